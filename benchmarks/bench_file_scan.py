@@ -0,0 +1,89 @@
+"""Sequential vs. concurrent scans of SQL files by the SQL hooks.
+
+Network mounted workspaces are emulated with a delay added to every file read.
+
+Usage: python benchmarks/bench_file_scan.py [--files 5000] [--latency 2]
+    [--jobs 0]
+"""
+import argparse
+import builtins
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Generator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from unittest.mock import patch
+
+from pre_commit_dbt import check_script_has_no_table_name
+from pre_commit_dbt import check_script_semicolon
+
+SQL = """with source as (
+    select * from {{{{ source('raw', 'table_{i}') }}}}
+),
+renamed as (
+    select id, name, coalesce(amount, 0) as amount from source
+)
+select * from renamed left join {{{{ ref('model_{j}') }}}} using (id)
+"""
+
+
+def write_files(directory: Path, files_cnt: int) -> List[str]:
+    paths = []
+    for i in range(files_cnt):
+        path = directory / f"model_{i}.sql"
+        path.write_text(SQL.format(i=i, j=max(i - 1, 0)))
+        paths.append(str(path))
+    return paths
+
+
+@contextlib.contextmanager
+def file_latency(latency: float) -> Generator[None, None, None]:
+    open_file = builtins.open
+
+    def slow_open(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(latency)
+        return open_file(*args, **kwargs)
+
+    with patch("builtins.open", slow_open), patch("io.open", slow_open):
+        yield
+
+
+def measure(label: str, main: Any, argv: Sequence[str]) -> str:
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        main(argv)
+    print(f"{label:<40} {time.perf_counter() - start:.3f}s")
+    return output.getvalue()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=2, help="ms per file")
+    parser.add_argument("--jobs", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    same = True
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_files(Path(tmp), args.files)
+        with file_latency(args.latency / 1000):
+            for name, hook in (
+                ("check-script-semicolon", check_script_semicolon.main),
+                ("check-script-has-no-table-name", check_script_has_no_table_name.main),
+            ):
+                jobs_argv = [*paths, "--jobs", str(args.jobs)]
+                sequential = measure(f"{name} --jobs 1", hook, paths)
+                concurrent = measure(f"{name} --jobs {args.jobs}", hook, jobs_argv)
+                same = same and sequential == concurrent
+    print(f"same output: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    exit(main())
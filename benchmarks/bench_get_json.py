@@ -0,0 +1,66 @@
+"""Cold vs. warm `get_json` on a synthetic manifest.
+
+Usage: python benchmarks/bench_get_json.py [--nodes 20000]
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+from pre_commit_dbt.utils import clear_json_documents
+from pre_commit_dbt.utils import get_json
+
+
+def synthetic_manifest(nodes_cnt: int) -> Dict[str, Any]:
+    nodes = {}
+    child_map = {}
+    for i in range(nodes_cnt):
+        model_id = f"model.bench.model_{i}"
+        nodes[model_id] = {
+            "name": f"model_{i}",
+            "path": f"models/model_{i}.sql",
+            "raw_sql": "select * from {{ ref('model_%s') }}" % (i - 1),
+            "tags": ["bench"],
+            "meta": {},
+            "columns": {
+                f"col_{j}": {"name": f"col_{j}", "description": f"col {j}"}
+                for j in range(10)
+            },
+            "depends_on": {"nodes": [f"model.bench.model_{i - 1}"], "macros": []},
+        }
+        child_map[model_id] = [f"model.bench.model_{i + 1}"]
+    return {"nodes": nodes, "child_map": child_map, "parent_map": {}}
+
+
+def timed(label: str, manifest_path: str, use_cache: bool = True) -> float:
+    clear_json_documents()
+    start = time.perf_counter()
+    get_json(manifest_path, use_cache=use_cache)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:.3f}s")
+    return elapsed
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = Path(tmp) / "manifest.json"
+        manifest_path.write_text(json.dumps(synthetic_manifest(args.nodes)))
+        size = manifest_path.stat().st_size / 1024 / 1024
+        print(f"manifest: {args.nodes} nodes, {size:.1f} MB")
+        timed("json only", str(manifest_path), use_cache=False)
+        timed("cold cache", str(manifest_path))
+        timed("warm cache", str(manifest_path))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
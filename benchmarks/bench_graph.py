@@ -0,0 +1,104 @@
+"""Dict of lists vs. CSR graph for parent and child counts on a generated DAG.
+
+Usage: python benchmarks/bench_graph.py [--models 30000] [--sources 3000]
+"""
+import argparse
+import random
+import sys
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from pre_commit_dbt.graph import build_graph
+
+
+def generated_manifest(models_cnt: int, sources_cnt: int) -> Dict[str, Any]:
+    rnd = random.Random(42)
+    sources = [f"source.project.raw.table_{i}" for i in range(sources_cnt)]
+    models: List[str] = []
+    parent_map: Dict[str, List[str]] = {source: [] for source in sources}
+    child_map: Dict[str, List[str]] = {source: [] for source in sources}
+    for i in range(models_cnt):
+        model = f"model.project.model_{i}"
+        upstream = rnd.sample(models[-500:], min(len(models), rnd.randint(0, 3)))
+        if not upstream or rnd.random() < 0.2:
+            upstream.append(rnd.choice(sources))
+        test = f"test.project.not_null_model_{i}_id"
+        parent_map[model] = upstream
+        parent_map[test] = [model]
+        child_map[model] = [test]
+        child_map[test] = []
+        for parent in upstream:
+            child_map[parent].append(model)
+        models.append(model)
+    return {"parent_map": parent_map, "child_map": child_map}
+
+
+def legacy_counts(manifest: Dict[str, Any], node_id: str) -> Any:
+    # one hop through the maps, as get_parent_childs did before the graph
+    parents = [
+        dep
+        for dep in manifest["parent_map"].get(node_id, [])
+        if dep.split(".")[0] in ["model", "source"]
+    ]
+    childs = [
+        dep
+        for dep in manifest["child_map"].get(node_id, [])
+        if dep.split(".")[0] in ["model"]
+    ]
+    return len(parents), len(childs)
+
+
+def size_of_maps(manifest: Dict[str, Any]) -> int:
+    size = 0
+    for section in ("parent_map", "child_map"):
+        size += sys.getsizeof(manifest[section])
+        size += sum(sys.getsizeof(deps) for deps in manifest[section].values())
+    return size
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", type=int, default=30000)
+    parser.add_argument("--sources", type=int, default=3000)
+    args = parser.parse_args(argv)
+
+    manifest = generated_manifest(args.models, args.sources)
+    model_ids = [key for key in manifest["parent_map"] if key.startswith("model.")]
+
+    start = time.perf_counter()
+    legacy = [legacy_counts(manifest, model_id) for model_id in model_ids]
+    print(f"{'dict':<8} {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    graph = build_graph(manifest)
+    built = time.perf_counter() - start
+    current = [
+        (
+            len(graph.parents_of(model_id, ["model", "source"])),
+            len(graph.children_of(model_id, ["model"])),
+        )
+        for model_id in model_ids
+    ]
+    queried = time.perf_counter() - start - built
+    print(f"{'graph':<8} {queried:.3f}s, build {built:.3f}s")
+
+    edges = (
+        graph.parents.edges.itemsize * len(graph.parents.edges)
+        + graph.children.edges.itemsize * len(graph.children.edges)
+        + graph.parents.offsets.itemsize * len(graph.parents.offsets) * 2
+        + len(graph.node_types)
+    )
+    print(
+        f"adjacency: maps {size_of_maps(manifest) / 1024 / 1024:.1f} MB, "
+        f"graph {edges / 1024 / 1024:.1f} MB"
+    )
+    print(f"same counts: {legacy == current}")
+    return 0 if legacy == current else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,53 @@
+"""Memory and time of a full vs. a projected manifest load.
+
+Usage: python benchmarks/bench_json_projection.py [--nodes 20000]
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+from typing import Sequence
+
+from bench_get_json import synthetic_manifest
+
+from pre_commit_dbt.check_script_ref_and_source import REFS_SOURCES_PROJECTION
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import MODEL_TESTS_PROJECTION
+
+
+def measure(label: str, manifest_path: str, projection: Optional[dict]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    get_json(manifest_path, use_cache=False, projection=projection)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<14} {elapsed:.3f}s  peak {peak / 1024 / 1024:.1f} MB")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = Path(tmp) / "manifest.json"
+        manifest = synthetic_manifest(args.nodes)
+        manifest["docs"] = {
+            f"doc.bench.doc_{i}": {"block_contents": "documentation " * 50}
+            for i in range(args.nodes)
+        }
+        manifest_path.write_text(json.dumps(manifest))
+        size = manifest_path.stat().st_size / 1024 / 1024
+        print(f"manifest: {args.nodes} nodes, {size:.1f} MB")
+        measure("full", str(manifest_path), None)
+        measure("model tests", str(manifest_path), MODEL_TESTS_PROJECTION)
+        measure("refs/sources", str(manifest_path), REFS_SOURCES_PROJECTION)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,77 @@
+"""Breadth-first search per model vs. memoized lineage on a generated DAG.
+
+Counts the upstream sources and the depth of every model, as
+check-model-upstream-sources and check-model-depth do with `--all-files`.
+
+Usage: python benchmarks/bench_lineage.py [--models 30000] [--sources 3000]
+"""
+import argparse
+import time
+import tracemalloc
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+
+from bench_graph import generated_manifest
+
+from pre_commit_dbt.graph import build_graph
+from pre_commit_dbt.graph import ManifestGraph
+from pre_commit_dbt.lineage import Lineage
+
+
+def bfs_ancestors(graph: ManifestGraph, node: int) -> Set[int]:
+    seen = set()
+    queue = [node]
+    while queue:
+        for parent in graph.parents.neighbors(queue.pop()):
+            if parent not in seen:
+                seen.add(parent)
+                queue.append(parent)
+    return seen
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", type=int, default=30000)
+    parser.add_argument("--sources", type=int, default=3000)
+    parser.add_argument(
+        "--bfs-models", type=int, default=1000, help="models checked by the BFS"
+    )
+    args = parser.parse_args(argv)
+
+    graph = build_graph(generated_manifest(args.models, args.sources))
+    models: List[int] = [
+        node for node in range(len(graph)) if graph.node_type(node) == "model"
+    ]
+
+    start = time.perf_counter()
+    bfs = [
+        sum(graph.node_type(node) == "source" for node in bfs_ancestors(graph, model))
+        for model in models[-args.bfs_models :]
+    ]
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'bfs':<8} {elapsed:.3f}s for {len(bfs)} models, "
+        f"~{elapsed * len(models) / len(bfs):.1f}s for all"
+    )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    lineage = Lineage(graph)
+    counts = [lineage.count(lineage.ancestors(model, ["source"])) for model in models]
+    depths = [lineage.depth(model) for model in models]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{'lineage':<8} {elapsed:.3f}s for {len(models)} models, "
+        f"peak {peak / 1024 / 1024:.1f} MB, max depth {max(depths)}"
+    )
+    same = counts[-args.bfs_models :] == bfs
+    print(f"same counts: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,79 @@
+"""Regex and split based vs. tokenizer based `has_table_name` on generated SQL.
+
+Usage: python benchmarks/bench_sql_tokens.py [--ctes 20000]
+"""
+import argparse
+import re
+import time
+import tracemalloc
+from typing import Any
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from pre_commit_dbt.check_script_has_no_table_name import has_table_name
+from pre_commit_dbt.check_script_has_no_table_name import prev_cur_next_iter
+
+LEGACY_COMMENTS = r"(?<=(\/\*|\{#))((.|[\r\n])+?)(?=(\*+\/|#\}))|[ \t]*--.*"
+
+
+def legacy_has_table_name(sql: str) -> Tuple[int, Set[str]]:
+    # has_table_name before the tokenizer
+    sql_clean = re.sub(LEGACY_COMMENTS, "", sql)
+    sql_clean = re.sub(r"([\(\)])", r" \1 ", sql_clean)
+    tables = set()
+    cte = set()
+    for prev, cur, nxt in prev_cur_next_iter(re.split(r"[\s]+", sql_clean)):
+        if prev in ["from", "join"] and cur not in ["", "(", "{{"]:
+            tables.add(cur.lower().strip().replace(",", ""))
+        if cur == "as" and nxt and nxt[0] == "(" and prev not in ["", "(", "{{"]:
+            cte.add(prev)
+    table_names = tables.difference(cte)
+    return int(bool(table_names)), table_names
+
+
+def generated_sql(ctes_cnt: int) -> str:
+    ctes = []
+    for i in range(ctes_cnt):
+        source = (
+            f"{{{{ ref('model_{i}') }}}}" if i % 3 else f"raw.schema.table_{i}"
+        )
+        ctes.append(
+            f"-- cte number {i}\n"
+            f"cte_{i} as (\n"
+            f"    /* columns of\n       cte {i} */\n"
+            f"    select a, b, coalesce(c, 'none') as c\n"
+            f"    from {source}\n"
+            f"    left join cte_{max(i - 1, 0)} using (a)\n"
+            f")"
+        )
+    return "with " + ",\n".join(ctes) + f"\nselect * from cte_{ctes_cnt - 1}\n"
+
+
+def measure(label: str, func: Any, sql: str) -> Any:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(sql)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {elapsed:.3f}s  peak {peak / 1024 / 1024:.1f} MB")
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ctes", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    sql = generated_sql(args.ctes)
+    print(f"SQL: {len(sql) / 1024 / 1024:.1f} MB")
+    legacy = measure("legacy", legacy_has_table_name, sql)
+    current = measure("tokenizer", lambda sql: has_table_name(sql, "bench.sql"), sql)
+    print(f"same tables: {legacy == current}")
+    return 0 if legacy == current else 1
+
+
+if __name__ == "__main__":
+    exit(main())
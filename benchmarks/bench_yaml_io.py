@@ -0,0 +1,70 @@
+"""Pure Python vs. libyaml loading and dumping of properties files.
+
+Usage: python benchmarks/bench_yaml_io.py [--models 5000]
+"""
+import argparse
+import time
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+import yaml
+
+from pre_commit_dbt.yaml_io import dump_yaml
+from pre_commit_dbt.yaml_io import load_yaml
+
+
+def synthetic_properties(models_cnt: int) -> Dict[str, Any]:
+    return {
+        "version": 2,
+        "models": [
+            {
+                "name": f"model_{i}",
+                "description": f"Model {i}, with a 'quoted' description: ü.",
+                "meta": {"owner": f"team_{i % 7}", "tier": i % 3},
+                "columns": [
+                    {
+                        "name": f"column_{j}",
+                        "description": f"Column {j} of model {i}.",
+                        "tests": ["not_null", {"accepted_values": {"values": [1, 2]}}],
+                    }
+                    for j in range(10)
+                ],
+            }
+            for i in range(models_cnt)
+        ],
+    }
+
+
+def timed(label: str, func: Any) -> Any:
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<14} {time.perf_counter() - start:.3f}s")
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    print(f"libyaml: {yaml.__with_libyaml__}, {args.models} models")
+    properties = synthetic_properties(args.models)
+    text = yaml.dump(properties, default_flow_style=False, sort_keys=False)
+
+    pure = timed("load pure", lambda: yaml.safe_load(text))
+    fast = timed("load libyaml", lambda: load_yaml(text))
+    assert pure == fast == properties
+
+    pure_text = timed(
+        "dump pure",
+        lambda: yaml.dump(pure, default_flow_style=False, sort_keys=False),
+    )
+    fast_text = timed("dump libyaml", lambda: dump_yaml(fast))
+    print(f"identical output: {pure_text == fast_text}")
+    return 0 if pure_text == fast_text else 1
+
+
+if __name__ == "__main__":
+    exit(main())
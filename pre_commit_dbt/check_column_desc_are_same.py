@@ -9,9 +9,12 @@ from typing import Optional
 from typing import Sequence
 from typing import Tuple
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import get_filenames
 from pre_commit_dbt.utils import get_model_schemas
+from pre_commit_dbt.utils import load_yaml_files
 from pre_commit_dbt.utils import ModelSchema
 
 
@@ -64,9 +67,11 @@ def check_column_desc(paths: Sequence[str], ignore: Optional[Sequence[str]]) ->
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
@@ -76,6 +81,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     return check_column_desc(paths=args.filenames, ignore=args.ignore)
 
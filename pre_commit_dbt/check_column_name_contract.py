@@ -5,6 +5,7 @@ from typing import Dict
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_catalog_args
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import get_filenames
@@ -46,6 +47,7 @@ def check_column_name_contract(
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
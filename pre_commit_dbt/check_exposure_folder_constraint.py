@@ -3,8 +3,11 @@ from pathlib import Path
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import get_exposure_paths
+from pre_commit_dbt.utils import load_yaml_files
 
 def check_exposure_path(paths: Sequence[str], exposure_folder_path: str) -> int:
     """
@@ -28,15 +31,18 @@ def check_exposure_path(paths: Sequence[str], exposure_folder_path: str) -> int:
         )
     return status_code
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
     parser.add_argument(
         "--exposure-folder",
         required=True,
         help="Directory in which exposures should be defined.",
     )
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
     return check_exposure_path(args.filenames, exposure_folder_path=args.exposure_folder)
 
 if __name__ == "__main__":
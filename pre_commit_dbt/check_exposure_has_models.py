@@ -1,9 +1,12 @@
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import get_filenames, get_exposures
 from typing import Sequence
 from pathlib import Path
 from typing import Optional
 import argparse
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
+from pre_commit_dbt.utils import load_yaml_files
 import logging
 
 
@@ -21,10 +24,13 @@ def has_models(paths: Sequence[str]):
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int :
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
     logging.debug(args.filenames)
     return has_models(paths=args.filenames)
 
@@ -1,9 +1,12 @@
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import get_filenames, get_exposures
 from typing import Sequence
 from pathlib import Path
 from typing import Optional
 import argparse
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
+from pre_commit_dbt.utils import load_yaml_files
 
     
 def is_owner_name_defined(paths: Sequence[str]) -> int:
@@ -22,10 +25,13 @@ def is_owner_name_defined(paths: Sequence[str]) -> int:
     
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int :
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
     return is_owner_name_defined(paths=args.filenames)
 
 
@@ -7,7 +7,9 @@ from typing import Sequence
 from typing import Set
 from typing import Tuple
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_filenames
 from pre_commit_dbt.utils import get_json
@@ -15,6 +17,7 @@ from pre_commit_dbt.utils import get_macro_schemas
 from pre_commit_dbt.utils import get_macro_sqls
 from pre_commit_dbt.utils import get_macros
 from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import load_yaml_files
 from pre_commit_dbt.utils import Macro
 from pre_commit_dbt.utils import MacroSchema
 
@@ -72,12 +75,15 @@ def check_argument_desc(
     return status_code, missing
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
     add_manifest_args(parser)
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     try:
         manifest = get_json(args.manifest)
@@ -4,6 +4,7 @@ from typing import Dict
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_json
@@ -31,6 +32,7 @@ def macros_have_reference(paths: Sequence[str], manifest: Dict[str, Any]) -> int
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
      parser = argparse.ArgumentParser()
      add_filenames_args(parser)
@@ -0,0 +1,75 @@
+import argparse
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+from pre_commit_dbt.daemon import use_daemon
+from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_manifest_args
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import get_lineage
+from pre_commit_dbt.utils import get_model_sqls
+from pre_commit_dbt.utils import get_models
+from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import LINEAGE_PROJECTION
+
+
+def check_model_depth(
+    paths: Sequence[str], manifest: Dict[str, Any], max_depth: int
+) -> int:
+    status_code = 0
+    sqls = get_model_sqls(paths, manifest)
+    filenames = set(sqls.keys())
+
+    # get manifest nodes that pre-commit found as changed
+    models = get_models(manifest, filenames)
+    lineage = get_lineage(manifest)
+
+    for model in models:
+        node = lineage.graph.get(model.model_id)
+        if node is None:
+            continue
+        depth = lineage.depth(node)
+        if depth > max_depth:
+            status_code = 1
+            path = " -> ".join(
+                lineage.graph.node_ids[parent]
+                for parent in lineage.upstream_path(node)
+            )
+            print(
+                f"{model.model_name}: has depth {depth}, but maximal depth "
+                f"{max_depth} is allowed:\n- {path}",
+            )
+    return status_code
+
+
+@use_daemon
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    add_filenames_args(parser)
+    add_manifest_args(parser)
+
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        required=True,
+        help="""Maximal number of dependencies on the longest path from a node
+        without parents (e.g. a source) to the model.""",
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = get_json(args.manifest, projection=LINEAGE_PROJECTION)
+    except JsonOpenError as e:
+        print(f"Unable to load manifest file ({e})")
+        return 1
+
+    return check_model_depth(
+        paths=args.filenames, manifest=manifest, max_depth=args.max_depth
+    )
+
+
+if __name__ == "__main__":
+    exit(main())
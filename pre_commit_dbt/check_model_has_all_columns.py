@@ -6,6 +6,7 @@ from typing import Sequence
 from typing import Set
 from typing import Tuple
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_catalog_args
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
@@ -76,6 +77,7 @@ def check_model_columns(
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
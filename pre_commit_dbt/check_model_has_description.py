@@ -4,7 +4,9 @@ from typing import Dict
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_filenames
 from pre_commit_dbt.utils import get_json
@@ -12,6 +14,7 @@ from pre_commit_dbt.utils import get_model_schemas
 from pre_commit_dbt.utils import get_model_sqls
 from pre_commit_dbt.utils import get_models
 from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import load_yaml_files
 
 
 def has_description(paths: Sequence[str], manifest: Dict[str, Any]) -> int:
@@ -40,12 +43,15 @@ def has_description(paths: Sequence[str], manifest: Dict[str, Any]) -> int:
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
     add_manifest_args(parser)
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     try:
         manifest = get_json(args.manifest)
@@ -6,6 +6,7 @@ from typing import Sequence
 from typing import Set
 from typing import Tuple
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_json
@@ -36,6 +37,7 @@ def has_properties_file(
     return status_code, missing
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
@@ -5,6 +5,7 @@ from typing import Dict
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_json
@@ -12,6 +13,7 @@ from pre_commit_dbt.utils import get_model_sqls
 from pre_commit_dbt.utils import get_models
 from pre_commit_dbt.utils import get_parent_childs
 from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import MODEL_TESTS_PROJECTION
 from pre_commit_dbt.utils import Test
 
 
@@ -55,6 +57,7 @@ def check_test_cnt(
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
@@ -75,7 +78,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parser.parse_args(argv)
 
     try:
-        manifest = get_json(args.manifest)
+        manifest = get_json(args.manifest, projection=MODEL_TESTS_PROJECTION)
     except JsonOpenError as e:
         print(f"Unable to load manifest file ({e})")
         return 1
@@ -5,12 +5,13 @@ from typing import Dict
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import get_manifest_graph
 from pre_commit_dbt.utils import get_model_sqls
 from pre_commit_dbt.utils import get_models
-from pre_commit_dbt.utils import get_parent_childs
 from pre_commit_dbt.utils import JsonOpenError
 
 
@@ -26,23 +27,11 @@ def check_child_parent_cnt(
     # get manifest nodes that pre-commit found as changed
     models = get_models(manifest, filenames)
 
+    graph = get_manifest_graph(manifest)
+
     for model in models:
-        childs = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=model,
-                manifest_node="child_map",
-                node_types=["model"],
-            )
-        )
-        parents = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=model,
-                manifest_node="parent_map",
-                node_types=["model", "source"],
-            )
-        )
+        childs = graph.children_of(model.model_id, ["model"])
+        parents = graph.parents_of(model.model_id, ["model", "source"])
         real_cnt = {"childs": len(childs), "parents": len(parents)}
         for required in required_cnt:
             req_cnt = required.get("cnt")
@@ -61,6 +50,7 @@ def check_child_parent_cnt(
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
@@ -0,0 +1,88 @@
+import argparse
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+from pre_commit_dbt.daemon import use_daemon
+from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_manifest_args
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import get_lineage
+from pre_commit_dbt.utils import get_model_sqls
+from pre_commit_dbt.utils import get_models
+from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import LINEAGE_PROJECTION
+
+
+def check_upstream_sources(
+    paths: Sequence[str],
+    manifest: Dict[str, Any],
+    min_cnt: int,
+    max_cnt: Optional[int],
+) -> int:
+    status_code = 0
+    sqls = get_model_sqls(paths, manifest)
+    filenames = set(sqls.keys())
+
+    # get manifest nodes that pre-commit found as changed
+    models = get_models(manifest, filenames)
+    lineage = get_lineage(manifest)
+
+    for model in models:
+        node = lineage.graph.get(model.model_id)
+        sources_cnt = 0
+        if node is not None:
+            sources_cnt = lineage.count(lineage.ancestors(node, ["source"]))
+        if sources_cnt < min_cnt:
+            status_code = 1
+            print(
+                f"{model.model_name}: depends on {sources_cnt} sources, "
+                f"but at least {min_cnt} are required.",
+            )
+        if max_cnt is not None and sources_cnt > max_cnt:
+            status_code = 1
+            print(
+                f"{model.model_name}: depends on {sources_cnt} sources, "
+                f"but at most {max_cnt} are allowed.",
+            )
+    return status_code
+
+
+@use_daemon
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    add_filenames_args(parser)
+    add_manifest_args(parser)
+
+    parser.add_argument(
+        "--min-source-cnt",
+        type=int,
+        default=0,
+        help="Minimal number of sources the model depends on, also transitively.",
+    )
+
+    parser.add_argument(
+        "--max-source-cnt",
+        type=int,
+        help="Maximal number of sources the model depends on, also transitively.",
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = get_json(args.manifest, projection=LINEAGE_PROJECTION)
+    except JsonOpenError as e:
+        print(f"Unable to load manifest file ({e})")
+        return 1
+
+    return check_upstream_sources(
+        paths=args.filenames,
+        manifest=manifest,
+        min_cnt=args.min_source_cnt,
+        max_cnt=args.max_source_cnt,
+    )
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,28 +1,45 @@
 import argparse
 import re
+import time
 from pathlib import Path
 from typing import Generator
+from typing import Iterable
 from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
+from pre_commit_dbt.daemon import use_daemon
+from pre_commit_dbt.sql_tokens import tokenize_sql
 from pre_commit_dbt.utils import add_filenames_args
-
-REGEX_COMMENTS = (
-    r"(?<=(\/\*|\{#))((.|[\r\n])+?)(?=(\*+\/|#\}))|[ \t]*--.*"
+from pre_commit_dbt.utils import add_jobs_args
+from pre_commit_dbt.utils import map_files
+from pre_commit_dbt.utils import TimeBudgetError
+
+# Used by replace_comments, kept as public API. The hook itself skips comments
+# with tokenize_sql.
+# String literals are matched to keep comment markers inside of them. Every
+# alternative either matches or fails at once, so the time is linear.
+REGEX_COMMENTS = re.compile(
+    r"('[^'\\]*(?:(?:\\.|'')[^'\\]*)*(?:'|\Z))"
+    r"|--[^\n]*|/\*.*?(?:\*/|\Z)|\{#.*?(?:#\}|\Z)",
+    re.DOTALL,
 )
-REGEX_SPLIT = r"[\s]+"
-IGNORE_WORDS = ["", "(", "{{"]  # pragma: no mutate
-REGEX_PARENTHESIS = r"([\(\)])"  # pragma: no mutate
+IGNORE_WORDS = ["", "(", ","]  # pragma: no mutate
+TIME_BUDGET = 10.0  # pragma: no mutate
+# tokens between checks of the time budget
+TIME_BUDGET_TOKENS = 1024  # pragma: no mutate
 
 
 def prev_cur_next_iter(
-    sql: Sequence[str],
+    sql: Iterable[str],
 ) -> Generator[Tuple[Optional[str], str, Optional[str]], None, None]:
     sql_iter = iter(sql)
     prev = None
-    cur = next(sql_iter).lower()
+    try:
+        cur = next(sql_iter).lower()
+    except StopIteration:
+        return
     try:
         while True:
             nxt = next(sql_iter).lower()  # pragma: no mutate
@@ -34,32 +51,35 @@ def prev_cur_next_iter(
 
 
 def replace_comments(sql: str) -> str:
-    return re.sub(REGEX_COMMENTS, "", sql)
+    return REGEX_COMMENTS.sub(lambda match: match.group(1) or "", sql)
 
 
-def add_space_to_parenthesis(sql: str) -> str:
-    return re.sub(REGEX_PARENTHESIS, r" \1 ", sql)
+def is_ignored(word: Optional[str]) -> bool:
+    # Jinja expressions, e.g. {{ ref('model') }}
+    return word in IGNORE_WORDS or bool(word and word.startswith("{{"))
 
 
 def has_table_name(
-    sql: str, filename: str, dotless: Optional[bool] = False
+    sql: str,
+    filename: str,
+    dotless: Optional[bool] = False,
+    deadline: Optional[float] = None,
 ) -> Tuple[int, Set[str]]:
     status_code = 0
-    sql_clean = replace_comments(sql)
-    sql_clean = add_space_to_parenthesis(sql_clean)
-    sql_split = re.split(REGEX_SPLIT, sql_clean)
     tables = set()
     cte = set()
 
-    for prev, cur, nxt in prev_cur_next_iter(sql_split):
-        if prev in ["from", "join"] and cur not in IGNORE_WORDS:
+    for i, (prev, cur, nxt) in enumerate(prev_cur_next_iter(tokenize_sql(sql))):
+        if deadline and i % TIME_BUDGET_TOKENS == 0 and time.monotonic() > deadline:
+            raise TimeBudgetError(filename)
+        if prev in ["from", "join"] and not is_ignored(cur):
             table = cur.lower().strip().replace(",", "") if cur else cur
             if dotless and "." not in table:
                 pass
             else:
                 tables.add(table)
         if (
-            cur.lower() == "as" and nxt and nxt[0] == "(" and prev not in IGNORE_WORDS
+            cur.lower() == "as" and nxt and nxt[0] == "(" and not is_ignored(prev)
         ):  # pragma: no mutate
             cte.add(prev.lower() if prev else prev)
 
@@ -69,20 +89,41 @@ def has_table_name(
     return status_code, table_names
 
 
+def _read_sql(filename: str) -> str:
+    return Path(filename).read_text()
+
+
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     parser.add_argument("--ignore-dotless-table", action="store_true")
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=TIME_BUDGET,
+        help="""Seconds allowed for checking one file. Files that take longer
+        are reported and fail the hook. 0 means no limit.
+        """,
+    )
 
     args = parser.parse_args(argv)
     status_code = 0
 
-    for filename in args.filenames:
-        sql = Path(filename).read_text()
-        status_code_file, tables = has_table_name(
-            sql, filename, args.ignore_dotless_table
-        )
+    # Files are read in threads, the check itself keeps to this thread so
+    # that the time budget of a file is not shared with the others.
+    for filename, sql in map_files(_read_sql, args.filenames, args.jobs):
+        deadline = time.monotonic() + args.time_budget if args.time_budget else None
+        try:
+            status_code_file, tables = has_table_name(
+                sql, filename, args.ignore_dotless_table, deadline
+            )
+        except TimeBudgetError:
+            print(f"{filename}: not checked, it took more than {args.time_budget}s.")
+            status_code = 1
+            continue
         if status_code_file:
             result = "\n- ".join(list(tables))  # pragma: no mutate
             print(
@@ -1,5 +1,4 @@
 import argparse
-import re
 from typing import Any
 from typing import Dict
 from typing import FrozenSet
@@ -8,51 +7,46 @@ from typing import Sequence
 from typing import Set
 from typing import Tuple
 
+from pre_commit_dbt.daemon import use_daemon
+from pre_commit_dbt.references import get_references
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_filenames
 from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import get_manifest_index
 from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import map_files
+
+REFS_SOURCES_PROJECTION = {"nodes": ["name"], "sources": ["source_name", "name"]}
 
 
 def check_refs_sources(
-    paths: Sequence[str], manifest: Dict[str, Any]
+    paths: Sequence[str], manifest: Dict[str, Any], jobs: int = 1
 ) -> Tuple[int, Set[str], Dict[FrozenSet[str], Dict[str, str]]]:
     status_code = 0
     sqls = get_filenames(paths, [".sql"])
 
     models = set()
     sources = {}
-    for _, file in sqls.items():
-        full_script = file.read_text(encoding="utf-8")
-        src_refs = re.findall(r"\{\{\s*(source|ref)\s*\((.*)\)\s*\}\}", full_script)
-        for src_ref in src_refs:
-            src_ref_value = src_ref[1].replace("'", "").replace('"', "").strip()
-            if src_ref[0] == "ref":
-                models.add(src_ref_value)
-            if src_ref[0] == "source":
-                src_split = src_ref_value.split(",")
-                source_name = src_split[0].strip()
-                table_name = src_split[1].strip()
-                src_key = frozenset([source_name, table_name])
+    for _, references in map_files(get_references, sqls.values(), jobs):
+        for reference in references:
+            if reference.kind == "ref":
+                models.add(reference.name)
+            elif reference.namespace:
+                src_key = frozenset([reference.namespace, reference.name])
                 sources[src_key] = {
-                    "source_name": source_name,
-                    "table_name": table_name,
+                    "source_name": reference.namespace,
+                    "table_name": reference.name,
                 }
 
-    if models:
-        nodes = manifest.get("nodes", {})
-        for _, value in nodes.items():
-            model_name = value.get("name")
-            if model_name in models:
-                models.remove(model_name)
-
-    if sources:
-        srcs = manifest.get("sources", {})
-        for _, value in srcs.items():
-            source_set = frozenset([value.get("source_name"), value.get("name")])
-            if source_set in sources.keys():
-                sources.pop(source_set)
+    index = get_manifest_index(manifest)
+    models = {model for model in models if model not in index.node_ids_by_name}
+    sources = {
+        key: value
+        for key, value in sources.items()
+        if key not in index.source_ids_by_name
+    }
 
     for _, src in sources.items():
         status_code = 1
@@ -67,20 +61,24 @@ def check_refs_sources(
     return status_code, models, sources
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
     add_manifest_args(parser)
+    add_jobs_args(parser)
 
     args = parser.parse_args(argv)
 
     try:
-        manifest = get_json(args.manifest)
+        manifest = get_json(args.manifest, projection=REFS_SOURCES_PROJECTION)
     except JsonOpenError as e:
         print(f"Unable to load manifest file ({e})")
         return 1
 
-    status_code, _, _ = check_refs_sources(paths=args.filenames, manifest=manifest)
+    status_code, _, _ = check_refs_sources(
+        paths=args.filenames, manifest=manifest, jobs=args.jobs
+    )
     return status_code
 
 
@@ -4,7 +4,10 @@ from typing import IO
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
+from pre_commit_dbt.utils import map_files
 
 
 def check_semicolon(file_obj: IO[bytes], replace: bool = False) -> int:
@@ -35,23 +38,30 @@ def check_semicolon(file_obj: IO[bytes], replace: bool = False) -> int:
     return status_code
 
 
+def check_semicolon_file(filename: str, replace: bool = False) -> int:
+    # Read as binary so we can read byte-by-byte
+    with open(filename, "rb+") as file_obj:
+        return check_semicolon(file_obj, replace)
+
+
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     args = parser.parse_args(argv)
     status_code = 0
 
-    for filename in args.filenames:
-        # Read as binary so we can read byte-by-byte
-        with open(filename, "rb+") as file_obj:
-            status_code_file = check_semicolon(file_obj)
-            if status_code_file:
-                print(
-                    f"{filename}: contains a semicolon at the end. "
-                    f"dbt does not support that."
-                )
-                status_code = status_code_file
+    for filename, status_code_file in map_files(
+        check_semicolon_file, args.filenames, args.jobs
+    ):
+        if status_code_file:
+            print(
+                f"{filename}: contains a semicolon at the end. "
+                f"dbt does not support that."
+            )
+            status_code = status_code_file
 
     return status_code
 
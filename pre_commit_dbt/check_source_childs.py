@@ -6,12 +6,16 @@ from typing import Dict
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import add_manifest_args
+from pre_commit_dbt.utils import get_deps_names
 from pre_commit_dbt.utils import get_json
-from pre_commit_dbt.utils import get_parent_childs
+from pre_commit_dbt.utils import get_manifest_graph
 from pre_commit_dbt.utils import get_source_schemas
 from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import load_yaml_files
 
 
 def check_child_parent_cnt(
@@ -24,16 +28,13 @@ def check_child_parent_cnt(
 
     schemas = get_source_schemas(ymls)
 
+    graph = get_manifest_graph(manifest)
+
     for schema in schemas:
-        childs = list(
-            get_parent_childs(
-                manifest=manifest,
-                obj=schema,
-                manifest_node="child_map",
-                node_types=["model"],
-            )
+        real_value = sum(
+            len(graph.children_of(source_id, ["model"]))
+            for source_id in get_deps_names(manifest, schema, "child_map")
         )
-        real_value = len(childs)
         for required in required_cnt:
             req_cnt = required.get("cnt")
             req_operator = required.get("operator", operator.lt)
@@ -49,9 +50,11 @@ def check_child_parent_cnt(
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
     add_manifest_args(parser)
 
     parser.add_argument(
@@ -68,6 +71,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     try:
         manifest = get_json(args.manifest)
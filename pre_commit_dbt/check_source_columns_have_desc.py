@@ -3,8 +3,11 @@ from pathlib import Path
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import get_source_schemas
+from pre_commit_dbt.utils import load_yaml_files
 
 
 def check_column_desc(paths: Sequence[str]) -> int:
@@ -30,11 +33,14 @@ def check_column_desc(paths: Sequence[str]) -> int:
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     return check_column_desc(paths=args.filenames)
 
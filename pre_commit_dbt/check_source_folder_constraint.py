@@ -3,8 +3,11 @@ from pathlib import Path
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import get_source_path
+from pre_commit_dbt.utils import load_yaml_files
 
 def check_source_path(paths: Sequence[str], source_folder_path: str) -> int:
     status_code = 0
@@ -20,15 +23,18 @@ def check_source_path(paths: Sequence[str], source_folder_path: str) -> int:
          )
     return status_code
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
     parser.add_argument(
         "--source-folder",
         required=True,
         help="Directory in which sources should not be defined.",
     )
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
     return check_source_path(args.filenames, source_folder_path=args.source_folder)
 
 if __name__ == "__main__":
@@ -4,8 +4,11 @@ from typing import Optional
 from typing import Sequence
 from typing import Set
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import get_source_schemas
+from pre_commit_dbt.utils import load_yaml_files
 
 
 def has_freshness(paths: Sequence[str], required_freshness: Set[str]) -> int:
@@ -43,9 +46,11 @@ def has_freshness(paths: Sequence[str], required_freshness: Set[str]) -> int:
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     parser.add_argument(
         "--freshness",
@@ -56,6 +61,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     return has_freshness(paths=args.filenames, required_freshness=set(args.freshness))
 
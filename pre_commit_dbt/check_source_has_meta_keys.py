@@ -3,8 +3,11 @@ from pathlib import Path
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.daemon import use_daemon
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
 from pre_commit_dbt.utils import get_source_schemas
+from pre_commit_dbt.utils import load_yaml_files
 
 
 def has_meta_key(paths: Sequence[str], meta_keys: Sequence[str]) -> int:
@@ -28,9 +31,11 @@ def has_meta_key(paths: Sequence[str], meta_keys: Sequence[str]) -> int:
     return status_code
 
 
+@use_daemon
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     parser.add_argument(
         "--meta-keys",
@@ -40,6 +45,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     return has_meta_key(paths=args.filenames, meta_keys=args.meta_keys)
 
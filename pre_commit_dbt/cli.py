@@ -0,0 +1,31 @@
+import argparse
+import importlib
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+COMMANDS: Dict[str, str] = {
+    "diff-manifest": "pre_commit_dbt.diff_manifest",
+    "run": "pre_commit_dbt.run_hooks",
+    "serve": "pre_commit_dbt.daemon",
+    "slim-manifest": "pre_commit_dbt.slim_manifest",
+}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pre-commit-dbt")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument(
+        "args",
+        nargs=argparse.REMAINDER,
+        help="Arguments of the command.",
+    )
+
+    args = parser.parse_args(argv)
+
+    module = importlib.import_module(COMMANDS[args.command])
+    return module.main(args.args)  # type: ignore
+
+
+if __name__ == "__main__":
+    exit(main())
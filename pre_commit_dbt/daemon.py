@@ -0,0 +1,170 @@
+import argparse
+import functools
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import NoReturn
+from typing import Optional
+from typing import Sequence
+from typing import TypeVar
+
+from pre_commit_dbt.utils import add_catalog_args
+from pre_commit_dbt.utils import add_manifest_args
+from pre_commit_dbt.utils import full_json_documents
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import JSON_CACHE_DIR
+from pre_commit_dbt.utils import JsonOpenError
+
+DAEMON_SOCKET = f"target/{JSON_CACHE_DIR}/daemon.sock"
+DAEMON_TIMEOUT = 600  # pragma: no mutate
+
+MainFunction = TypeVar("MainFunction", bound=Callable[..., int])
+
+# True in the daemon process itself, hooks are then executed directly.
+_IN_DAEMON = False
+
+
+def get_socket_path() -> str:
+    return os.environ.get("PRE_COMMIT_DBT_SOCKET", DAEMON_SOCKET)
+
+
+def request_daemon(hook_id: str, argv: Sequence[str]) -> Optional[int]:
+    """Run the hook in the daemon, None if the daemon is not available."""
+    socket_path = get_socket_path()
+    if _IN_DAEMON or not hasattr(socket, "AF_UNIX"):
+        return None
+    if not Path(socket_path).exists():
+        return None
+    request = {"hook": hook_id, "argv": list(argv), "cwd": os.getcwd()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(DAEMON_TIMEOUT)
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            response = json.loads(client.makefile("rb").read().decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if response.get("status_code") is None:
+        return None
+    print(response.get("output", ""), end="")
+    return response["status_code"]
+
+
+def use_daemon(main: MainFunction) -> MainFunction:
+    """Forward the hook to a running `pre-commit-dbt serve` daemon.
+
+    Without the daemon the hook is executed in the current process.
+    """
+    hook_id = main.__module__.split(".")[-1].replace("_", "-")
+
+    @functools.wraps(main)
+    def wrapper(argv: Optional[Sequence[str]] = None) -> int:
+        if argv is None:
+            argv = sys.argv[1:]
+        status_code = request_daemon(hook_id, argv)
+        if status_code is None:
+            status_code = main(argv)
+        return status_code
+
+    return cast(MainFunction, wrapper)
+
+
+def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    # imported here, because hooks import this module
+    from pre_commit_dbt.run_hooks import HOOKS
+    from pre_commit_dbt.run_hooks import run_hook
+
+    global _IN_DAEMON
+    hook_id = request.get("hook", "")
+    # only read-only checks, modifiers and dbt commands are run by the client
+    if (
+        request.get("cwd") != os.getcwd()
+        or hook_id not in HOOKS
+        or not hook_id.startswith("check-")
+    ):
+        # the client falls back to running the hook itself
+        return {"status_code": None}
+    output = io.StringIO()
+    in_daemon = _IN_DAEMON
+    # the hook must not forward the request to the daemon again
+    _IN_DAEMON = True
+    try:
+        with redirect_stdout(output), redirect_stderr(output), full_json_documents():
+            status_code = run_hook(hook_id, request.get("argv", []))
+    finally:
+        _IN_DAEMON = in_daemon
+    return {"status_code": status_code, "output": output.getvalue()}
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> NoReturn:
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            response = handle_request(request)
+        except Exception as e:  # pragma: no cover
+            response = {"status_code": None, "error": repr(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+def serve(socket_path: str, preload: Sequence[str]) -> int:
+    global _IN_DAEMON
+    _IN_DAEMON = True
+    for json_filename in preload:
+        # parsed documents are kept in memory and reloaded when changed
+        try:
+            get_json(json_filename)
+        except JsonOpenError as e:
+            print(f"Unable to preload {json_filename} ({e})")
+    path = Path(socket_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+    print(f"Serving pre-commit-dbt hooks on {socket_path}")
+    try:
+        with socketserver.UnixStreamServer(socket_path, DaemonHandler) as server:
+            server.serve_forever()
+    except KeyboardInterrupt:  # pragma: no cover
+        pass
+    finally:
+        if path.exists():
+            path.unlink()
+        _IN_DAEMON = False
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pre-commit-dbt serve")
+    add_manifest_args(parser)
+    add_catalog_args(parser)
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=get_socket_path(),
+        help="""Location of the Unix socket. Hooks use the daemon if they find
+        the socket in the default location or in $PRE_COMMIT_DBT_SOCKET.
+        """,
+    )
+
+    args = parser.parse_args(argv)
+
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        print("Unix sockets are not supported on this platform.")
+        return 1
+
+    return serve(args.socket, preload=[args.manifest, args.catalog])
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,11 +1,15 @@
 import argparse
+from pathlib import Path
 from typing import List
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.project_fingerprint import get_project_inputs
+from pre_commit_dbt.project_fingerprint import run_dbt_cmd_if_changed
 from pre_commit_dbt.utils import add_dbt_cmd_args
 from pre_commit_dbt.utils import add_dbt_cmd_model_args
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_skip_unchanged_args
 from pre_commit_dbt.utils import get_flags
 from pre_commit_dbt.utils import paths_to_dbt_models
 from pre_commit_dbt.utils import run_dbt_cmd
@@ -34,6 +38,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     add_filenames_args(parser)
     add_dbt_cmd_args(parser)
     add_dbt_cmd_model_args(parser)
+    add_skip_unchanged_args(parser)
 
     args = parser.parse_args(argv)
 
@@ -45,6 +50,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         args.model_postfix,
         args.models,
     )
+    if args.skip_unchanged:
+        outputs = [Path("target/manifest.json")]
+        return run_dbt_cmd_if_changed("compile", cmd, get_project_inputs(), outputs)
     return run_dbt_cmd(cmd)
 
 
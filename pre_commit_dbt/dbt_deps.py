@@ -1,7 +1,12 @@
+import argparse
 from typing import List
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.project_fingerprint import get_packages_inputs
+from pre_commit_dbt.project_fingerprint import get_packages_outputs
+from pre_commit_dbt.project_fingerprint import run_dbt_cmd_if_changed
+from pre_commit_dbt.utils import add_skip_unchanged_args
 from pre_commit_dbt.utils import run_dbt_cmd
 
 
@@ -11,7 +16,16 @@ def prepare_cmd() -> List[str]:
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    add_skip_unchanged_args(parser)
+
+    args = parser.parse_args(argv)
+
     cmd = prepare_cmd()
+    if args.skip_unchanged:
+        return run_dbt_cmd_if_changed(
+            "deps", cmd, get_packages_inputs(), get_packages_outputs()
+        )
     return run_dbt_cmd(cmd)
 
 
@@ -1,9 +1,13 @@
 import argparse
+from pathlib import Path
 from typing import List
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.project_fingerprint import get_project_inputs
+from pre_commit_dbt.project_fingerprint import run_dbt_cmd_if_changed
 from pre_commit_dbt.utils import add_dbt_cmd_args
+from pre_commit_dbt.utils import add_skip_unchanged_args
 from pre_commit_dbt.utils import get_flags
 from pre_commit_dbt.utils import run_dbt_cmd
 
@@ -21,10 +25,16 @@ def docs_generate_cmd(
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_dbt_cmd_args(parser)
+    add_skip_unchanged_args(parser)
 
     args = parser.parse_args(argv)
 
     cmd = docs_generate_cmd(args.global_flags, args.cmd_flags)
+    if args.skip_unchanged:
+        outputs = [Path("target/catalog.json")]
+        return run_dbt_cmd_if_changed(
+            "docs generate", cmd, get_project_inputs(), outputs
+        )
     return run_dbt_cmd(cmd)
 
 
@@ -3,12 +3,23 @@ from typing import List
 from typing import Optional
 from typing import Sequence
 
+from pre_commit_dbt.diff_manifest import get_state_selection
+from pre_commit_dbt.impact import get_impact_selection
+from pre_commit_dbt.impact import IMPACT_PROJECTION
+from pre_commit_dbt.run_report import get_mtime
+from pre_commit_dbt.run_report import print_timing_report
 from pre_commit_dbt.utils import add_dbt_cmd_args
+from pre_commit_dbt.utils import add_dbt_cmd_chunk_args
 from pre_commit_dbt.utils import add_dbt_cmd_model_args
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_impact_args
+from pre_commit_dbt.utils import add_timing_report_args
+from pre_commit_dbt.utils import chunked
 from pre_commit_dbt.utils import get_flags
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import JsonOpenError
 from pre_commit_dbt.utils import paths_to_dbt_models
-from pre_commit_dbt.utils import run_dbt_cmd
+from pre_commit_dbt.utils import run_dbt_cmds
 
 
 def prepare_cmd(
@@ -34,18 +45,57 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     add_filenames_args(parser)
     add_dbt_cmd_args(parser)
     add_dbt_cmd_model_args(parser)
+    add_dbt_cmd_chunk_args(parser)
+    add_impact_args(parser)
+    add_timing_report_args(parser)
 
     args = parser.parse_args(argv)
 
-    cmd = prepare_cmd(
-        args.filenames,
-        args.global_flags,
-        args.cmd_flags,
-        args.model_prefix,
-        args.model_postfix,
-        args.models,
-    )
-    return run_dbt_cmd(cmd)
+    models = args.models
+    if args.state and not models:
+        try:
+            models = get_state_selection(
+                args.manifest, args.state, args.model_prefix, args.model_postfix
+            )
+        except JsonOpenError as e:
+            print(f"Unable to load manifest file ({e})")
+            return 1
+        if not models:
+            print("No dbt nodes are modified compared to the state manifest.")
+            return 0
+    elif args.impact and not models:
+        try:
+            manifest = get_json(args.manifest, projection=IMPACT_PROJECTION)
+        except JsonOpenError as e:
+            print(f"Unable to load manifest file ({e})")
+            return 1
+        models = get_impact_selection(
+            args.filenames, manifest, "test", args.model_prefix, args.model_postfix
+        )
+        if not models:
+            print("No dbt nodes are affected by the changed files.")
+            return 0
+
+    if not models:
+        models = paths_to_dbt_models(
+            args.filenames, args.model_prefix, args.model_postfix
+        )
+    # tests do not depend on each other, every chunk can run concurrently
+    cmds = [
+        prepare_cmd(args.filenames, args.global_flags, args.cmd_flags, models=chunk)
+        for chunk in chunked(models, args.chunk_size)
+    ]
+    run_results_mtime = get_mtime(args.run_results)
+    status_code = run_dbt_cmds([cmds], args.chunk_jobs)
+    if args.report_slowest or args.timing_baseline:
+        print_timing_report(
+            args.run_results,
+            args.report_slowest,
+            args.timing_baseline,
+            args.write_timing_baseline,
+            previous_mtime=run_results_mtime,
+        )
+    return status_code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+"""Nodes modified between two manifests, like dbt's ``state:modified``.
+
+Every node gets a fingerprint, a hash of its checksum, config and properties
+(the patch of its properties file) and of the macros it uses. Nodes whose
+fingerprint is missing from, or different in, the state manifest are modified.
+The fingerprints of a manifest file are cached next to it, so that comparing
+with the same production manifest again only loads two small mappings.
+"""
+import argparse
+import hashlib
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from pre_commit_dbt.impact import get_selectors
+from pre_commit_dbt.impact import IMPACT_PROJECTION
+from pre_commit_dbt.json_projection import Projection
+from pre_commit_dbt.utils import get_full_manifest_path
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import get_json_derived
+from pre_commit_dbt.utils import JsonOpenError
+
+# Database and schema depend on the target, their configs are compared
+# through the unrendered config.
+NODE_FINGERPRINT_FIELDS = (
+    "checksum",
+    "description",
+    "columns",
+    "meta",
+    "docs",
+    "test_metadata",
+)
+SOURCE_FINGERPRINT_FIELDS = (
+    "description",
+    "source_description",
+    "columns",
+    "meta",
+    "tags",
+    "identifier",
+    "loader",
+    "loaded_at_field",
+    "freshness",
+    "quoting",
+    "external",
+)
+CONFIG_FIELDS = ("unrendered_config", "config")
+DIFF_PROJECTION: Projection = {
+    "nodes": [*NODE_FINGERPRINT_FIELDS, *CONFIG_FIELDS, "name", "depends_on"],
+    "sources": [*SOURCE_FINGERPRINT_FIELDS, *CONFIG_FIELDS, "source_name", "name"],
+    "macros": ["macro_sql", "depends_on"],
+}
+# bump when the fingerprinted fields change, to invalidate cached fingerprints
+FINGERPRINT_VERSION = 1
+
+
+def fingerprint(values: Any) -> bytes:
+    data = json.dumps(values, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(data.encode()).digest()  # pragma: no mutate
+
+
+def get_config(entry: Dict[str, Any]) -> Any:
+    if "unrendered_config" in entry:
+        return entry["unrendered_config"]
+    return entry.get("config")
+
+
+def get_macro_fingerprints(manifest: Dict[str, Any]) -> Dict[str, bytes]:
+    """Fingerprints of the macros and of every macro they call."""
+    macros = manifest.get("macros", {})
+    own = {key: fingerprint(macro.get("macro_sql")) for key, macro in macros.items()}
+    fingerprints = {}
+    for key in macros:
+        called = {key}
+        stack = [key]
+        while stack:
+            macro = macros.get(stack.pop(), {})
+            for dep in macro.get("depends_on", {}).get("macros", []):
+                if dep not in called:
+                    called.add(dep)
+                    stack.append(dep)
+        digest = hashlib.sha1()  # pragma: no mutate
+        for dep in sorted(called):
+            digest.update(dep.encode())
+            digest.update(own.get(dep, b""))
+        fingerprints[key] = digest.digest()
+    return fingerprints
+
+
+def get_fingerprints(manifest: Dict[str, Any]) -> Dict[str, bytes]:
+    """Fingerprints of the selectable nodes and sources, by unique id."""
+    macros = get_macro_fingerprints(manifest)
+    fingerprints = {}
+    for key, node in manifest.get("nodes", {}).items():
+        if key.startswith("operation."):
+            continue
+        values = [node.get(field) for field in NODE_FINGERPRINT_FIELDS]
+        values.append(get_config(node))
+        used = node.get("depends_on", {}).get("macros", [])
+        values.append(sorted(macros.get(dep, b"").hex() for dep in used))
+        fingerprints[key] = fingerprint(values)
+    for key, source in manifest.get("sources", {}).items():
+        values = [source.get(field) for field in SOURCE_FINGERPRINT_FIELDS]
+        values.append(get_config(source))
+        fingerprints[key] = fingerprint(values)
+    return fingerprints
+
+
+def diff_fingerprints(
+    fingerprints: Dict[str, bytes], state_fingerprints: Dict[str, bytes]
+) -> List[str]:
+    return [
+        key
+        for key, node_fingerprint in fingerprints.items()
+        if state_fingerprints.get(key) != node_fingerprint
+    ]
+
+
+def get_modified_nodes(manifest: Dict[str, Any], state: Dict[str, Any]) -> List[str]:
+    """Unique ids of the new and modified nodes of ``manifest``."""
+    return diff_fingerprints(get_fingerprints(manifest), get_fingerprints(state))
+
+
+def load_fingerprints(manifest_filename: str) -> Dict[str, bytes]:
+    return get_json_derived(
+        manifest_filename,
+        f"fingerprints-{FINGERPRINT_VERSION}",
+        get_fingerprints,
+        projection=DIFF_PROJECTION,
+    )
+
+
+def get_state_selection(
+    manifest_filename: str,
+    state_filename: str,
+    prefix: str = "",
+    postfix: str = "",
+) -> List[str]:
+    # the slim manifest has no checksums and configs
+    modified = diff_fingerprints(
+        load_fingerprints(get_full_manifest_path(manifest_filename)),
+        load_fingerprints(state_filename),
+    )
+    manifest = get_json(manifest_filename, projection=IMPACT_PROJECTION)
+    return get_selectors(modified, manifest, prefix, postfix)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pre-commit-dbt diff-manifest")
+
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default="target/manifest.json",
+        help="""Location of manifest.json file. Usually target/manifest.json.""",
+    )
+    parser.add_argument(
+        "--state",
+        type=str,
+        required=True,
+        help="""Location of manifest.json file to compare with, e.g. from
+        the production run.""",
+    )
+    parser.add_argument(
+        "--model-prefix",
+        type=str,
+        default="",
+        help="Prefix dbt selector, for selecting parents.",
+    )
+    parser.add_argument(
+        "--model-postfix",
+        type=str,
+        default="",
+        help="Postfix dbt selector, for selecting children.",
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        selectors = get_state_selection(
+            args.manifest, args.state, args.model_prefix, args.model_postfix
+        )
+    except JsonOpenError as e:
+        print(f"Unable to load manifest file ({e})")
+        return 1
+
+    for selector in selectors:
+        print(selector)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -5,13 +5,13 @@ from typing import FrozenSet
 from typing import Optional
 from typing import Sequence
 
-import yaml
-
 from pre_commit_dbt.check_script_ref_and_source import check_refs_sources
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_json
 from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.yaml_io import dump_yaml
+from pre_commit_dbt.yaml_io import load_yaml
 
 
 def create_missing_sources(
@@ -26,7 +26,7 @@ def create_missing_sources(
             path = Path(output_path)
             # is file and exists
             if path.is_file():
-                schema = yaml.safe_load(path.open())
+                schema = load_yaml(path.read_text())
                 schema_sources = schema.get("sources", [])
                 seen = False  # pragma: no mutate
                 for schema_source in schema_sources:
@@ -42,7 +42,7 @@ def create_missing_sources(
                     )
                 with open(path, "w") as f:
                     print(f"Generating missing source `{source_name}.{table_name}`.")
-                    yaml.dump(schema, f, default_flow_style=False, sort_keys=False)
+                    dump_yaml(schema, f)
             else:
                 print(
                     f"Path `{output_path}` does not exists. "
@@ -6,8 +6,6 @@ from typing import NoReturn
 from typing import Optional
 from typing import Sequence
 
-import yaml
-
 from pre_commit_dbt.utils import add_catalog_args
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
@@ -16,10 +14,12 @@ from pre_commit_dbt.utils import get_json
 from pre_commit_dbt.utils import get_models
 from pre_commit_dbt.utils import JsonOpenError
 from pre_commit_dbt.utils import Model
+from pre_commit_dbt.yaml_io import dump_yaml
+from pre_commit_dbt.yaml_io import load_yaml
 
 
 def append_to_properties_file(path: Path, model_schema: Dict[str, Any]) -> NoReturn:
-    file = yaml.safe_load(path.open())
+    file = load_yaml(path.read_text())
     if file.get("models"):
         model = file.get("models")
     else:
@@ -28,7 +28,7 @@ def append_to_properties_file(path: Path, model_schema: Dict[str, Any]) -> NoRet
     model.append(model_schema)
     model_name = model_schema.get("name")  # pragma: no mutate
     with open(path, "w") as f:
-        yaml.dump(file, f, default_flow_style=False, sort_keys=False)
+        dump_yaml(file, f)
         print(
             f"{path}: the schema of the `{model_name}` model was appended to the file."
         )
@@ -39,7 +39,7 @@ def write_to_properties_file(path: Path, model_schema: Dict[str, Any]) -> NoRetu
     file = {"version": 2, "models": [model_schema]}
     model_name = model_schema.get("name")  # pragma: no mutate
     with open(path, "w") as f:
-        yaml.dump(file, f, default_flow_style=False, sort_keys=False)
+        dump_yaml(file, f)
         print(
             f"{path}: the schema of the `{model_name}` model was written to the file."
         )
@@ -0,0 +1,127 @@
+"""Compact graph of the manifest ``parent_map`` and ``child_map``.
+
+Nodes get integer ids in the order of the keys of the maps, followed by nodes
+only listed as dependencies. Edges are stored CSR-style, the neighbors of node
+``i`` are ``edges[offsets[i]:offsets[i + 1]]``, in the order of the map.
+"""
+import itertools
+from array import array
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+
+@dataclass
+class Adjacency:
+    offsets: "array[int]"
+    edges: "array[int]"
+
+    def neighbors(self, node: int) -> "array[int]":
+        return self.edges[self.offsets[node] : self.offsets[node + 1]]
+
+    def degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+
+@dataclass
+class ManifestGraph:
+    node_ids: List[str]
+    ids: Dict[str, int]
+    # one byte per node, index of its type (first part of its id) in type_names
+    node_types: bytearray
+    type_names: List[str]
+    type_codes: Dict[str, int]
+    # edges of parent_map and child_map
+    parents: Adjacency
+    children: Adjacency
+    # codes of the node types asked for, by node types
+    _codes: Dict[Tuple[str, ...], bytes] = field(default_factory=dict)
+
+    def add_node(self, node_id: str) -> int:
+        node = len(self.node_ids)
+        self.ids[node_id] = node
+        self.node_ids.append(node_id)
+        node_type = node_id.split(".", 1)[0]
+        if node_type not in self.type_codes:
+            self.type_codes[node_type] = len(self.type_names)
+            self.type_names.append(node_type)
+        self.node_types.append(self.type_codes[node_type])
+        return node
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def get(self, node_id: str) -> Optional[int]:
+        return self.ids.get(node_id)
+
+    def node_type(self, node: int) -> str:
+        return self.type_names[self.node_types[node]]
+
+    def in_degree(self, node: int) -> int:
+        return self.parents.degree(node)
+
+    def out_degree(self, node: int) -> int:
+        return self.children.degree(node)
+
+    def of_types(self, nodes: Iterable[int], node_types: Sequence[str]) -> List[int]:
+        codes = self._codes.get(tuple(node_types))
+        if codes is None:
+            codes = bytes(
+                self.type_codes[node_type]
+                for node_type in node_types
+                if node_type in self.type_codes
+            )
+            self._codes[tuple(node_types)] = codes
+        node_type_codes = self.node_types
+        return [node for node in nodes if node_type_codes[node] in codes]
+
+    def parents_of(self, node_id: str, node_types: Sequence[str]) -> List[int]:
+        node = self.ids.get(node_id)
+        if node is None:
+            return []
+        return self.of_types(self.parents.neighbors(node), node_types)
+
+    def children_of(self, node_id: str, node_types: Sequence[str]) -> List[int]:
+        node = self.ids.get(node_id)
+        if node is None:
+            return []
+        return self.of_types(self.children.neighbors(node), node_types)
+
+
+def _build_adjacency(deps: Dict[str, List[str]], graph: ManifestGraph) -> Adjacency:
+    dep_lists = [deps.get(node_id, ()) for node_id in graph.node_ids]
+    offsets = array("q", [0])
+    offsets.extend(itertools.accumulate(map(len, dep_lists)))
+    edges = array(
+        "i", map(graph.ids.__getitem__, itertools.chain.from_iterable(dep_lists))
+    )
+    return Adjacency(offsets, edges)
+
+
+def build_graph(manifest: Dict[str, Any]) -> ManifestGraph:
+    parent_map = manifest.get("parent_map", {})
+    child_map = manifest.get("child_map", {})
+    graph = ManifestGraph(
+        node_ids=[],
+        ids={},
+        node_types=bytearray(),
+        type_names=[],
+        type_codes={},
+        parents=Adjacency(array("q"), array("i")),
+        children=Adjacency(array("q"), array("i")),
+    )
+    keys = itertools.chain(
+        parent_map, child_map, *parent_map.values(), *child_map.values()
+    )
+    for key in keys:
+        if key not in graph.ids:
+            graph.add_node(key)
+    graph.parents = _build_adjacency(parent_map, graph)
+    graph.children = _build_adjacency(child_map, graph)
+    return graph
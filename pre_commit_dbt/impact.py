@@ -0,0 +1,169 @@
+"""Selection of the dbt nodes affected by changed files."""
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+
+from pre_commit_dbt.json_projection import Projection
+from pre_commit_dbt.utils import build_properties_index
+from pre_commit_dbt.utils import get_filenames
+from pre_commit_dbt.utils import get_lineage
+from pre_commit_dbt.utils import get_macro_sqls
+from pre_commit_dbt.utils import get_manifest_index
+from pre_commit_dbt.utils import get_model_sqls
+
+# manifest parts needed to find the affected nodes
+IMPACT_PROJECTION: Projection = {
+    "nodes": ["name", "depends_on"],
+    "sources": ["source_name", "name"],
+    "macros": ["path"],
+    "parent_map": None,
+    "child_map": None,
+}
+# node types selected by `dbt run` and `dbt test`
+RUN_NODE_TYPES = ("model",)
+TEST_NODE_TYPES = ("model", "seed", "snapshot", "source", "test")
+# `dbt run` gets the child models of these nodes instead
+RUN_PARENT_NODE_TYPES = ("seed", "snapshot", "source")
+
+
+def get_changed_nodes(paths: Sequence[str], manifest: Dict[str, Any]) -> List[str]:
+    """Unique ids of the nodes defined or configured in the changed files.
+
+    SQL files give models and snapshots, CSV files seeds, macro files every
+    node using their macros and properties files their models and sources.
+    """
+    index = get_manifest_index(manifest)
+    changed: Set[str] = set()
+
+    stems = set(get_model_sqls(paths, manifest))
+    changed.update(index.get_ids("model", stems))
+    changed.update(index.get_ids("snapshot", stems))
+    changed.update(index.get_ids("seed", set(get_filenames(paths, [".csv"]))))
+
+    macro_paths = set(get_macro_sqls(paths, manifest).values())
+    if macro_paths:
+        macro_ids = {
+            key
+            for key, macro in manifest.get("macros", {}).items()
+            if Path(macro.get("path", "")) in macro_paths
+        }
+        for key, node in manifest.get("nodes", {}).items():
+            if macro_ids.intersection(node.get("depends_on", {}).get("macros", [])):
+                changed.add(key)
+
+    ymls = [Path(path) for path in paths if Path(path).suffix in (".yml", ".yaml")]
+    for entry in build_properties_index(ymls).entries:
+        if not entry.name:
+            continue
+        if entry.resource_type == "model":
+            node_ids = index.node_ids_by_name.get(entry.name, [])
+            changed.update(key for key in node_ids if key.startswith("model."))
+        elif entry.resource_type == "source" and entry.source_name:
+            source_key = frozenset([entry.source_name, entry.name])
+            changed.update(index.source_ids_by_name.get(source_key, []))
+
+    return sorted(changed, key=index.position.__getitem__)
+
+
+def get_selector(manifest: Dict[str, Any], node_id: str) -> str:
+    if node_id.startswith("source."):
+        source = manifest.get("sources", {}).get(node_id, {})
+        return f"source:{source.get('source_name')}.{source.get('name')}"
+    node = manifest.get("nodes", {}).get(node_id, {})
+    return node.get("name") or node_id.split(".")[-1]
+
+
+def get_selectors(
+    node_ids: Sequence[str],
+    manifest: Dict[str, Any],
+    prefix: str = "",
+    postfix: str = "",
+) -> List[str]:
+    """``-m`` selectors of the nodes, in the given order.
+
+    With the ``+`` postfix (prefix) nodes that are descendants (ancestors) of
+    other selected nodes are left out, they are selected anyway.
+    """
+    node_ids = list(dict.fromkeys(node_ids))
+    if prefix + postfix == "+":
+        lineage = get_lineage(manifest)
+        graph = lineage.graph
+        if prefix:
+            covered_by = lineage.descendants
+        else:
+            covered_by = lineage.ancestors
+        selected_bits = 0
+        for node_id in node_ids:
+            node = graph.get(node_id)
+            if node is not None:
+                selected_bits |= 1 << node
+
+        def is_covered(node_id: str) -> bool:
+            node = graph.get(node_id)
+            if node is None:
+                return False
+            return bool(covered_by(node) & selected_bits & ~(1 << node))
+
+        node_ids = [node_id for node_id in node_ids if not is_covered(node_id)]
+
+    return [prefix + get_selector(manifest, node_id) + postfix for node_id in node_ids]
+
+
+def get_impact_selection(
+    paths: Sequence[str],
+    manifest: Dict[str, Any],
+    command: str,
+    prefix: str = "",
+    postfix: str = "",
+) -> List[str]:
+    """Minimal ``-m`` selection of the nodes affected by the changed files.
+
+    ``dbt run`` gets the child models of changed sources, seeds and snapshots
+    instead of these nodes, which it does not run.
+    """
+    graph = get_lineage(manifest).graph
+    node_types = RUN_NODE_TYPES if command == "run" else TEST_NODE_TYPES
+
+    selected: Set[str] = set()
+    for node_id in get_changed_nodes(paths, manifest):
+        node_type = node_id.split(".")[0]
+        if node_type in RUN_PARENT_NODE_TYPES and command == "run":
+            children = graph.children_of(node_id, RUN_NODE_TYPES)
+            selected.update(graph.node_ids[child] for child in children)
+        elif node_type in node_types:
+            selected.add(node_id)
+    # nodes only listed in the maps go last
+    position = get_manifest_index(manifest).position
+    node_ids = sorted(selected, key=lambda key: position.get(key, len(position)))
+    return get_selectors(node_ids, manifest, prefix, postfix)
+
+
+def get_run_waves(
+    selectors: Sequence[str], manifest: Dict[str, Any]
+) -> Optional[List[List[str]]]:
+    """Selectors grouped by the depth of their nodes, in the order of the depth.
+
+    Nodes of the same depth do not depend on each other, so the selectors of
+    a wave can be run concurrently. ``None`` when a selector is not the name
+    of exactly one model, e.g. it uses graph operators.
+    """
+    index = get_manifest_index(manifest)
+    lineage = get_lineage(manifest)
+    waves: Dict[int, List[str]] = {}
+    for selector in selectors:
+        node_ids = [
+            key
+            for key in index.node_ids_by_name.get(selector, [])
+            if key.split(".")[0] in RUN_NODE_TYPES
+        ]
+        if len(node_ids) != 1:
+            return None
+        node = lineage.graph.get(node_ids[0])
+        # nodes missing from the maps have no dependencies
+        depth = lineage.depth(node) if node is not None else 0
+        waves.setdefault(depth, []).append(selector)
+    return [waves[depth] for depth in sorted(waves)]
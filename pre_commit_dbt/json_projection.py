@@ -0,0 +1,118 @@
+"""Load only selected parts of a big JSON document, e.g. manifest.json.
+
+Projected sections are decoded one entry at a time and only the projected fields
+are kept, the other sections are skipped without building their objects. The
+text of the document is still read in memory as a whole.
+"""
+import json
+import re
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# Top-level section -> fields kept for every entry of the section,
+# None keeps the whole section.
+Projection = Dict[str, Optional[Sequence[str]]]
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# everything up to the next bracket, strings included
+FILLER = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+STRING_END = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+SCALAR = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null")
+
+_DECODER = json.JSONDecoder()
+_SKIPPED = object()
+
+ValueLoader = Callable[[str, str, int], Tuple[Any, int]]
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    return WHITESPACE.match(text, pos).end()  # type: ignore
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    pos = _skip_whitespace(text, pos)
+    if text[pos : pos + 1] != char:
+        raise ValueError(f"Expecting '{char}' at position {pos}")
+    return _skip_whitespace(text, pos + 1)
+
+
+def skip_value(text: str, pos: int) -> int:
+    """Return the end of the JSON value starting at ``pos``.
+
+    Only strings and brackets of arrays and objects are checked, the value is
+    not decoded.
+    """
+    char = text[pos : pos + 1]
+    if char == '"':
+        match = STRING_END.match(text, pos + 1)
+        if not match:
+            raise ValueError(f"Unterminated string at position {pos}")
+        return match.end()
+    if char in ("[", "{"):
+        depth = 0
+        while True:
+            pos = FILLER.match(text, pos).end()  # type: ignore
+            char = text[pos : pos + 1]
+            if not char or char == '"':
+                raise ValueError(f"Unterminated value at position {pos}")
+            depth += 1 if char in ("[", "{") else -1
+            pos += 1
+            if depth == 0:
+                return pos
+    match = SCALAR.match(text, pos)
+    if not match:
+        raise ValueError(f"Expecting value at position {pos}")
+    return match.end()
+
+
+def _load_members(text: str, pos: int, load_value: ValueLoader) -> Tuple[Any, int]:
+    pos = _skip_whitespace(text, pos)
+    if text[pos : pos + 1] != "{":
+        # not an object, nothing to project
+        return _DECODER.raw_decode(text, pos)
+    result: Dict[str, Any] = {}
+    pos = _skip_whitespace(text, pos + 1)
+    if text[pos : pos + 1] == "}":
+        return result, pos + 1
+    while True:
+        key, pos = _DECODER.raw_decode(text, pos)
+        if not isinstance(key, str):
+            raise ValueError(f"Expecting property name at position {pos}")
+        pos = _expect(text, pos, ":")
+        value, pos = load_value(key, text, pos)
+        if value is not _SKIPPED:
+            result[key] = value
+        pos = _skip_whitespace(text, pos)
+        char = text[pos : pos + 1]
+        if char == "}":
+            return result, pos + 1
+        pos = _expect(text, pos, ",")
+
+
+def _load_entry(fields: Sequence[str]) -> ValueLoader:
+    def load_entry(key: str, text: str, pos: int) -> Tuple[Any, int]:
+        entry, pos = _DECODER.raw_decode(text, pos)
+        if isinstance(entry, dict):
+            entry = {field: entry[field] for field in fields if field in entry}
+        return entry, pos
+
+    return load_entry
+
+
+def loads_projection(text: str, projection: Projection) -> Dict[str, Any]:
+    def load_section(key: str, text: str, pos: int) -> Tuple[Any, int]:
+        if key not in projection:
+            return _SKIPPED, skip_value(text, pos)
+        fields = projection[key]
+        if fields is None:
+            return _DECODER.raw_decode(text, pos)
+        return _load_members(text, pos, _load_entry(fields))
+
+    result, pos = _load_members(text, 0, load_section)
+    if _skip_whitespace(text, pos) != len(text):
+        raise ValueError(f"Extra data at position {pos}")
+    return result
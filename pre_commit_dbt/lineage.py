@@ -0,0 +1,141 @@
+"""Transitive lineage of manifest nodes over a ``ManifestGraph``.
+
+Ancestors and descendants are bitsets, Python ints with bit ``i`` set for node
+``i``, or for the ``i``-th node of the asked node types. Every node is expanded
+only once, the result of a node is the union of the results of its neighbors,
+so the lineage of a whole project is computed in one walk of the DAG.
+"""
+from array import array
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+
+from pre_commit_dbt.graph import Adjacency
+from pre_commit_dbt.graph import ManifestGraph
+
+T = TypeVar("T")
+NodeTypes = Optional[Tuple[str, ...]]
+
+
+def _resolve(
+    node: int,
+    adjacency: Adjacency,
+    memo: Dict[int, T],
+    combine: Callable[[int, Sequence[int], Dict[int, T]], T],
+) -> T:
+    """Post-order walk from ``node``, neighbors are combined before the node.
+
+    Neighbors closing a cycle are not in ``memo`` when their node is combined.
+    """
+    if node in memo:
+        return memo[node]
+    stack: List[Tuple[int, Iterator[int]]] = [(node, iter(adjacency.neighbors(node)))]
+    on_path = {node}
+    while stack:
+        current, deps = stack[-1]
+        for dep in deps:
+            if dep not in memo and dep not in on_path:
+                on_path.add(dep)
+                stack.append((dep, iter(adjacency.neighbors(dep))))
+                break
+        else:
+            stack.pop()
+            on_path.discard(current)
+            memo[current] = combine(current, adjacency.neighbors(current), memo)
+    return memo[node]
+
+
+def _longest(
+    node: int, deps: Sequence[int], memo: Dict[int, Tuple[int, int]]
+) -> Tuple[int, int]:
+    # (depth, deepest neighbor or -1)
+    depth, deepest = 0, -1
+    for dep in deps:
+        if dep in memo and memo[dep][0] + 1 > depth:
+            depth, deepest = memo[dep][0] + 1, dep
+    return depth, deepest
+
+
+class Lineage:
+    def __init__(self, graph: ManifestGraph) -> None:
+        self.graph = graph
+        # (direction, node types) -> node -> bitset
+        self._closures: Dict[Tuple[str, NodeTypes], Dict[int, int]] = {}
+        self._depths: Dict[int, Tuple[int, int]] = {}
+        # node types -> bit of every node of the types, or -1
+        self._bits: Dict[NodeTypes, Sequence[int]] = {}
+        self._members: Dict[NodeTypes, List[int]] = {}
+
+    def _get_bits(self, node_types: NodeTypes) -> Sequence[int]:
+        if node_types is None:
+            return range(len(self.graph))
+        if node_types not in self._bits:
+            codes = {self.graph.type_codes.get(node_type) for node_type in node_types}
+            bits = array("i", [-1]) * len(self.graph)
+            members: List[int] = []
+            for node, code in enumerate(self.graph.node_types):
+                if code in codes:
+                    bits[node] = len(members)
+                    members.append(node)
+            self._bits[node_types] = bits
+            self._members[node_types] = members
+        return self._bits[node_types]
+
+    def _closure(
+        self, node: int, direction: str, node_types: Optional[Sequence[str]]
+    ) -> int:
+        key = tuple(node_types) if node_types is not None else None
+        bits = self._get_bits(key)
+        memo = self._closures.setdefault((direction, key), {})
+
+        def union(current: int, deps: Sequence[int], memo: Dict[int, int]) -> int:
+            result = 0
+            for dep in deps:
+                result |= memo.get(dep, 0)
+                if bits[dep] >= 0:
+                    result |= 1 << bits[dep]
+            return result
+
+        if direction == "ancestors":
+            return _resolve(node, self.graph.parents, memo, union)
+        return _resolve(node, self.graph.children, memo, union)
+
+    def ancestors(self, node: int, node_types: Optional[Sequence[str]] = None) -> int:
+        """Bitset of the transitive parents of ``node``, see ``nodes``.
+
+        With ``node_types`` only nodes of the types are kept, which makes the
+        bitsets as short as the number of such nodes.
+        """
+        return self._closure(node, "ancestors", node_types)
+
+    def descendants(self, node: int, node_types: Optional[Sequence[str]] = None) -> int:
+        return self._closure(node, "descendants", node_types)
+
+    def nodes(self, bits: int, node_types: Optional[Sequence[str]] = None) -> List[int]:
+        """Nodes of a bitset returned for the same ``node_types``."""
+        key = tuple(node_types) if node_types is not None else None
+        self._get_bits(key)
+        members = self._members.get(key) if key is not None else None
+        nodes = [i for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+        return [members[i] for i in nodes] if members is not None else nodes
+
+    @staticmethod
+    def count(bits: int) -> int:
+        return bin(bits).count("1")
+
+    def depth(self, node: int) -> int:
+        """Number of edges on the longest path from a node without parents."""
+        return _resolve(node, self.graph.parents, self._depths, _longest)[0]
+
+    def upstream_path(self, node: int) -> List[int]:
+        """The longest path ending in ``node``, from its first node."""
+        self.depth(node)
+        path = [node]
+        while self._depths[path[-1]][1] != -1:
+            path.append(self._depths[path[-1]][1])
+        return path[::-1]
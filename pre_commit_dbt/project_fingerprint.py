@@ -0,0 +1,156 @@
+"""Skip dbt commands when their inputs did not change since they last succeeded.
+
+The fingerprint of a command hashes the command, the ``DBT_*`` environment
+variables and the path, size and modification time of every input file, like
+git does for its index. It is stored in ``target/.pre-commit-dbt/`` once the
+command succeeded, so ``dbt clean`` also clears it.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+import yaml
+
+from pre_commit_dbt.utils import JSON_CACHE_DIR
+from pre_commit_dbt.utils import run_dbt_cmd
+from pre_commit_dbt.utils import write_text_atomic
+
+FINGERPRINT_VERSION = 1
+FINGERPRINTS_FILE = "fingerprints.json"
+PROJECT_FILE = "dbt_project.yml"
+PACKAGES_FILES = ("packages.yml", "dependencies.yml", "package-lock.yml")
+# project settings with source directories (also their names before dbt 1.0),
+# and their defaults
+PROJECT_PATHS: Tuple[Tuple[Tuple[str, ...], List[str]], ...] = (
+    (("model-paths", "source-paths"), ["models"]),
+    (("seed-paths", "data-paths"), ["seeds", "data"]),
+    (("test-paths",), ["tests"]),
+    (("analysis-paths",), ["analyses", "analysis"]),
+    (("macro-paths",), ["macros"]),
+    (("snapshot-paths",), ["snapshots"]),
+    (("docs-paths",), []),
+)
+PACKAGES_PATHS = (
+    ("packages-install-path", "modules-path"),
+    ["dbt_packages", "dbt_modules"],
+)
+
+
+def get_project_config(project_dir: Path) -> Dict[str, Any]:
+    try:
+        with (project_dir / PROJECT_FILE).open(encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError):
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
+def get_project_paths(
+    config: Dict[str, Any], keys: Sequence[str], defaults: List[str]
+) -> List[str]:
+    paths: List[str] = []
+    for key in keys:
+        value = config.get(key, [])
+        paths.extend([value] if isinstance(value, str) else value)
+    return paths or defaults
+
+
+def get_project_inputs(project_dir: Path = Path(".")) -> List[Path]:
+    """Files read by ``dbt compile``: project, profile and source files."""
+    config = get_project_config(project_dir)
+    dirs = set(get_project_paths(config, *PACKAGES_PATHS))
+    for keys, defaults in PROJECT_PATHS:
+        dirs.update(get_project_paths(config, keys, defaults))
+    profiles_dir = Path(os.environ.get("DBT_PROFILES_DIR", Path.home() / ".dbt"))
+    inputs = [
+        project_dir / PROJECT_FILE,
+        project_dir / "profiles.yml",
+        project_dir / "selectors.yml",
+        profiles_dir / "profiles.yml",
+        *(project_dir / name for name in PACKAGES_FILES),
+    ]
+    for directory in sorted(dirs):
+        for root, subdirs, files in os.walk(project_dir / directory):
+            subdirs.sort()
+            inputs.extend(Path(root) / name for name in sorted(files))
+    return inputs
+
+
+def get_packages_inputs(project_dir: Path = Path(".")) -> List[Path]:
+    """Files read by ``dbt deps``."""
+    return [project_dir / name for name in (PROJECT_FILE, *PACKAGES_FILES)]
+
+
+def get_packages_outputs(project_dir: Path = Path(".")) -> List[Path]:
+    """Directories ``dbt deps`` installs packages to."""
+    config = get_project_config(project_dir)
+    return [project_dir / path for path in get_project_paths(config, *PACKAGES_PATHS)]
+
+
+def get_fingerprint(cmd: Sequence[str], inputs: Iterable[Path]) -> str:
+    digest = hashlib.sha1()  # pragma: no mutate
+    header = {
+        "version": FINGERPRINT_VERSION,
+        "cmd": list(cmd),
+        "env": sorted(
+            (key, value) for key, value in os.environ.items() if key.startswith("DBT_")
+        ),
+    }
+    digest.update(json.dumps(header).encode())
+    for path in inputs:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def get_fingerprints_path(target: Path = Path("target")) -> Path:
+    return target / JSON_CACHE_DIR / FINGERPRINTS_FILE
+
+
+def load_fingerprints(fingerprints_file: Path) -> Dict[str, str]:
+    try:
+        fingerprints = json.loads(fingerprints_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return fingerprints if isinstance(fingerprints, dict) else {}
+
+
+def run_dbt_cmd_if_changed(
+    name: str,
+    cmd: Sequence[str],
+    inputs: Iterable[Path],
+    outputs: Sequence[Path],
+    target: Path = Path("target"),
+) -> int:
+    """Run ``cmd`` unless it succeeded with the same inputs before.
+
+    ``cmd`` runs anyway when none of ``outputs`` exists, e.g. after ``dbt clean``.
+    """
+    fingerprint = get_fingerprint(cmd, inputs)
+    fingerprints_file = get_fingerprints_path(target)
+    fingerprints = load_fingerprints(fingerprints_file)
+    outputs_exist = not outputs or any(path.exists() for path in outputs)
+    if fingerprints.get(name) == fingerprint and outputs_exist:
+        print(f"Skipping `{' '.join(cmd)}`, its inputs did not change.")
+        return 0
+    status_code = run_dbt_cmd(cmd)
+    if status_code == 0:
+        # files changed while dbt ran give another fingerprint next time
+        fingerprints = load_fingerprints(fingerprints_file)
+        fingerprints[name] = fingerprint
+        try:
+            fingerprints_file.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(fingerprints_file, json.dumps(fingerprints, indent=2))
+        except OSError:
+            pass
+    return status_code
@@ -0,0 +1,104 @@
+"""Extraction of ref() and source() calls from dbt SQL files."""
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Optional
+from typing import Tuple
+
+# Jinja expressions, statements and comments, the comments are skipped.
+# Unterminated blocks end with the file, so nothing is scanned twice.
+JINJA_BLOCK = re.compile(
+    r"\{\{.*?(?:\}\}|\Z)|\{%.*?(?:%\}|\Z)|\{#.*?(?:#\}|\Z)", re.DOTALL
+)
+CALL = re.compile(r"""\b(ref|source)\s*\(((?:'[^']*'|"[^"]*"|[^'"()])*)\)""", re.DOTALL)
+ARGUMENT = re.compile(
+    r"""\s*(?:(\w+)\s*=\s*)?('[^']*'|"[^"]*"|[^,'"]+?)\s*(?:,|$)""", re.DOTALL
+)
+REFERENCES_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class Reference:
+    # "ref" or "source"
+    kind: str
+    # model name of a ref, table name of a source
+    name: str
+    # source name of a source, package name of a ref
+    namespace: Optional[str] = None
+    version: Optional[str] = None
+
+
+# content digest -> references
+_REFERENCES: Dict[str, Tuple[Reference, ...]] = {}
+_REFERENCES_LOCK = threading.Lock()
+
+
+def _parse_arguments(arguments: str) -> Optional[Tuple[List[str], Dict[str, str]]]:
+    """Arguments of a call, None unless the positional ones are string literals."""
+    args = []
+    kwargs = {}
+    arguments = arguments.strip()
+    pos = 0
+    while pos < len(arguments):
+        match = ARGUMENT.match(arguments, pos)
+        if not match or match.end() == pos:
+            return None
+        keyword, value = match.groups()
+        quoted = value[:1] in ("'", '"')
+        if quoted:
+            value = value[1:-1]
+        if keyword:
+            kwargs[keyword] = value
+        elif quoted:
+            args.append(value.strip())
+        else:
+            # e.g. a variable or an expression
+            return None
+        pos = match.end()
+    return args, kwargs
+
+
+def extract_references(sql: str) -> List[Reference]:
+    references = []
+    for block in JINJA_BLOCK.finditer(sql):
+        if block.group().startswith("{#"):
+            continue
+        for call in CALL.finditer(block.group()):
+            kind, arguments = call.groups()
+            parsed = _parse_arguments(arguments)
+            if not parsed or not parsed[0]:
+                continue
+            args, kwargs = parsed
+            version = kwargs.get("v") or kwargs.get("version")
+            if kind == "source" and len(args) >= 2:
+                references.append(Reference(kind, args[1], args[0]))
+            elif kind == "ref":
+                namespace = args[0] if len(args) >= 2 else None
+                references.append(Reference(kind, args[-1], namespace, version))
+    return references
+
+
+def get_references(file: Path) -> List[Reference]:
+    """References of the file, the same content is scanned only once.
+
+    Safe to call from several threads.
+    """
+    content = file.read_bytes()
+    digest = hashlib.sha1(content).hexdigest()  # pragma: no mutate
+    references = _REFERENCES.get(digest)
+    if references is None:
+        references = tuple(extract_references(content.decode("utf-8")))
+        with _REFERENCES_LOCK:
+            if len(_REFERENCES) >= REFERENCES_CACHE_SIZE:
+                _REFERENCES.pop(next(iter(_REFERENCES)))
+            _REFERENCES[digest] = references
+    return list(references)
+
+
+def clear_references() -> NoReturn:
+    _REFERENCES.clear()
@@ -1,24 +1,29 @@
 import argparse
+import functools
 from typing import Optional
 from typing import Sequence
 
-from pre_commit_dbt.check_script_semicolon import check_semicolon
+from pre_commit_dbt.check_script_semicolon import check_semicolon_file
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
+from pre_commit_dbt.utils import map_files
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     args = parser.parse_args(argv)
     status_code = 0
 
-    for filename in args.filenames:
-        with open(filename, "rb+") as file_obj:
-            status_code_file = check_semicolon(file_obj, replace=True)
-            if status_code_file:
-                print(f"Replacing semicolon in {filename}.")
-                status_code = status_code_file
+    remove_semicolon = functools.partial(check_semicolon_file, replace=True)
+    for filename, status_code_file in map_files(
+        remove_semicolon, args.filenames, args.jobs
+    ):
+        if status_code_file:
+            print(f"Replacing semicolon in {filename}.")
+            status_code = status_code_file
 
     return status_code
 
@@ -14,43 +14,45 @@ from pre_commit_dbt.check_script_has_no_table_name import has_table_name
 from pre_commit_dbt.utils import add_filenames_args
 from pre_commit_dbt.utils import add_manifest_args
 from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import get_manifest_index
 from pre_commit_dbt.utils import JsonOpenError
 
 
 def get_ref_from_name(
     manifest: Dict[str, Any], tables: Set[str]
 ) -> Generator[Tuple[str, str], None, None]:
+    index = get_manifest_index(manifest)
     table_names = {table.split(".")[-1]: table for table in tables}
-    models = manifest.get("nodes", {})
-    for _, value in models.items():
-        # model name has to be unique
-        model_name = value.get("alias")
-        table = table_names.pop(model_name, None)
-        if table:
-            tables.remove(table)
-            model_ref = "{{ ref('%s') }}" % model_name
-            yield (table, model_ref)
+    found = []
+    for model_name, table in table_names.items():
+        # model name has to be unique, the first node wins
+        node_ids = index.node_ids_by_alias.get(model_name)
+        if node_ids:
+            found.append((index.position[node_ids[0]], model_name, table))
+    for _, model_name, table in sorted(found):
+        tables.remove(table)
+        model_ref = "{{ ref('%s') }}" % model_name
+        yield (table, model_ref)
 
 
 def get_source_from_name(
     manifest: Dict[str, Any], tables: Set[str]
 ) -> Generator[Tuple[str, str], None, None]:
-    if tables:
-        table_names = {table: set(table.split(".")) for table in tables}
-        sources = manifest.get("sources", {})
-        for _, value in sources.items():
-            source = {value.get("database"), value.get("schema"), value.get("name")}
-            table = None  # pragma: no mutate
-            for table_name, table_split in table_names.items():
-                if source.issuperset(table_split):
-                    table = table_name
-            if table:
-                tables.remove(table)
-                source_ref = "{{ source('%s', '%s') }}" % (
-                    value.get("source_name"),
-                    value.get("name"),
-                )
-                yield (table, source_ref)
+    index = get_manifest_index(manifest)
+    found = []
+    for table in tables:
+        source_ids = index.source_ids_by_relation.get(tuple(table.split(".")))
+        if source_ids:
+            found.append((index.position[source_ids[0]], table, source_ids[0]))
+    sources = manifest.get("sources", {})
+    for _, table, source_id in sorted(found):
+        tables.remove(table)
+        value = sources[source_id]
+        source_ref = "{{ source('%s', '%s') }}" % (
+            value.get("source_name"),
+            value.get("name"),
+        )
+        yield (table, source_ref)
 
 
 def get_unknown_source(tables: Set[str]) -> Generator[Tuple[str, str], None, None]:
@@ -85,6 +87,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 1
 
     status_code = 0
+    # built once, every file is resolved against the same index
+    get_manifest_index(manifest)
 
     for filename in args.filenames:
         file = Path(filename)
@@ -0,0 +1,162 @@
+import argparse
+import importlib
+import re
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import yaml
+
+from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import full_json_documents
+from pre_commit_dbt.yaml_io import load_yaml
+
+SQL = (".sql",)
+YAML = (".yml", ".yaml")
+SQL_YAML = SQL + YAML
+
+# Same file types as in `.pre-commit-hooks.yaml` (checked by tests), None means
+# that the hook does not take filenames.
+HOOKS: Dict[str, Optional[Sequence[str]]] = {
+    "check-column-desc-are-same": YAML,
+    "check-column-name-contract": SQL,
+    "check-exposure-folder-constraint": YAML,
+    "check-exposure-has-models": YAML,
+    "check-exposure-has-owner": YAML,
+    "check-macro-arguments-have-desc": SQL_YAML,
+    "check-macro-has-description": SQL_YAML,
+    "check-macros-are-referenced": SQL,
+    "check-model-columns-have-desc": SQL_YAML,
+    "check-model-depth": SQL,
+    "check-model-has-all-columns": SQL,
+    "check-model-has-description": SQL_YAML,
+    "check-model-has-meta-keys": SQL_YAML,
+    "check-model-has-properties-file": SQL,
+    "check-model-has-tests": SQL,
+    "check-model-has-tests-by-group": SQL,
+    "check-model-has-tests-by-name": SQL,
+    "check-model-has-tests-by-type": SQL,
+    "check-model-name-contract": SQL,
+    "check-model-parents-and-childs": SQL,
+    "check-model-parents-database": SQL,
+    "check-model-parents-schema": SQL,
+    "check-model-tags": SQL,
+    "check-model-upstream-sources": SQL,
+    "check-script-has-no-table-name": SQL,
+    "check-script-ref-and-source": SQL,
+    "check-script-semicolon": SQL,
+    "check-source-childs": YAML,
+    "check-source-columns-have-desc": YAML,
+    "check-source-folder-constraint": YAML,
+    "check-source-has-all-columns": YAML,
+    "check-source-has-freshness": YAML,
+    "check-source-has-loader": YAML,
+    "check-source-has-meta-keys": YAML,
+    "check-source-has-tests": YAML,
+    "check-source-has-tests-by-name": YAML,
+    "check-source-has-tests-by-type": YAML,
+    "check-source-table-has-description": YAML,
+    "check-source-tags": YAML,
+    "dbt-clean": None,
+    "dbt-compile": SQL,
+    "dbt-deps": None,
+    "dbt-docs-generate": None,
+    "dbt-run": SQL,
+    "dbt-test": SQL,
+    "generate-missing-sources": SQL,
+    "generate-model-properties-file": SQL,
+    "remove-script-semicolon": SQL,
+    "replace-script-table-names": SQL,
+    "unify-column-description": YAML,
+}
+
+
+def get_hooks(config_file: str) -> List[Dict[str, Any]]:
+    config = load_yaml(Path(config_file).read_text(encoding="utf-8")) or {}
+    return config.get("hooks", [])
+
+
+def get_hook_filenames(hook: Dict[str, Any], paths: Sequence[str]) -> List[str]:
+    extensions = HOOKS.get(hook["id"]) or ()
+    files = re.compile(hook.get("files", ""))
+    exclude = re.compile(hook["exclude"]) if hook.get("exclude") else None
+    return [
+        path
+        for path in paths
+        if Path(path).suffix in extensions
+        and files.search(path)
+        and not (exclude and exclude.search(path))
+    ]
+
+
+def run_hook(hook_id: str, argv: Sequence[str]) -> int:
+    module = importlib.import_module(f"pre_commit_dbt.{hook_id.replace('-', '_')}")
+    try:
+        return module.main(argv)  # type: ignore
+    except SystemExit as e:
+        # argparse exits on invalid arguments, other hooks still have to run
+        return e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        print(f"{hook_id}: unexpected error ({e!r})")
+        return 1
+
+
+def run_hooks(paths: Sequence[str], hooks: Sequence[Dict[str, Any]]) -> int:
+    status_code = 0
+    results = []
+
+    for hook in hooks:
+        hook_id = hook.get("id", "")
+        if hook_id not in HOOKS:
+            print(f"Unknown hook `{hook_id}`.")
+            results.append((hook_id, "Failed"))
+            status_code = 1
+            continue
+        argv = [str(arg) for arg in hook.get("args", [])]
+        if HOOKS[hook_id] is not None:
+            filenames = get_hook_filenames(hook, paths)
+            if not filenames:
+                results.append((hook_id, "Skipped"))
+                continue
+            # same as pre-commit, filenames are appended to the args
+            argv.extend(filenames)
+        with full_json_documents():
+            hook_status_code = run_hook(hook_id, argv)
+        results.append((hook_id, "Passed" if hook_status_code == 0 else "Failed"))
+        status_code = status_code or hook_status_code
+
+    for hook_id, result in results:
+        print(f"{hook_id}: {result}")
+    return status_code
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pre-commit-dbt run")
+    add_filenames_args(parser)
+
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=".pre-commit-dbt.yaml",
+        help="""Location of the file with the list of hooks to run. Each hook
+        has an `id` and optionally `args`, `files` and `exclude`, the same
+        as in `.pre-commit-config.yaml`.
+        """,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        hooks = get_hooks(args.config)
+    except (OSError, yaml.YAMLError) as e:
+        print(f"Unable to load config file ({e})")
+        return 1
+
+    return run_hooks(paths=args.filenames, hooks=hooks)
+
+
+if __name__ == "__main__":
+    exit(main())
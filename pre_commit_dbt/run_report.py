@@ -0,0 +1,137 @@
+"""Timing report of the nodes executed by dbt, from ``run_results.json``."""
+import json
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Optional
+
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import write_text_atomic
+
+# statuses of the results kept in the baseline
+SUCCESS_STATUSES = ("success", "pass")
+
+
+def get_mtime(filename: str) -> int:
+    """Modification time of a file in nanoseconds, -1 for a missing file."""
+    try:
+        return Path(filename).stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def load_run_results(
+    run_results_filename: str, previous_mtime: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Load run results, unless the file still has its ``previous_mtime``."""
+    if previous_mtime is not None and get_mtime(run_results_filename) == previous_mtime:
+        return None
+    try:
+        return get_json(run_results_filename, use_cache=False)
+    except JsonOpenError:
+        return None
+
+
+def get_timings(run_results: Dict[str, Any]) -> Dict[str, float]:
+    """Execution time of every node, by unique id."""
+    return {
+        result["unique_id"]: float(result.get("execution_time") or 0)
+        for result in run_results.get("results", [])
+        if "unique_id" in result
+    }
+
+
+def get_threads(run_results: Dict[str, Any]) -> int:
+    threads = run_results.get("args", {}).get("threads")
+    if threads:
+        return int(threads)
+    thread_ids = {
+        result.get("thread_id") for result in run_results.get("results", [])
+    }
+    return max(len(thread_ids - {None}), 1)
+
+
+def load_baseline(baseline_filename: str) -> Dict[str, float]:
+    try:
+        baseline = json.loads(Path(baseline_filename).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return baseline if isinstance(baseline, dict) else {}
+
+
+def update_baseline(baseline_filename: str, run_results: Dict[str, Any]) -> NoReturn:
+    """Store the execution times of the successful nodes in the baseline."""
+    baseline = load_baseline(baseline_filename)
+    for result in run_results.get("results", []):
+        if result.get("status") in SUCCESS_STATUSES and "unique_id" in result:
+            baseline[result["unique_id"]] = float(result.get("execution_time") or 0)
+    baseline_file = Path(baseline_filename)
+    baseline_file.parent.mkdir(parents=True, exist_ok=True)
+    write_text_atomic(
+        baseline_file, json.dumps(dict(sorted(baseline.items())), indent=2) + "\n"
+    )
+
+
+def format_timing_report(
+    run_results: Dict[str, Any],
+    slowest: int = 0,
+    baseline: Optional[Dict[str, float]] = None,
+) -> List[str]:
+    timings = get_timings(run_results)
+    lines = []
+    if slowest > 0:
+        ranked = sorted(timings.items(), key=lambda item: (-item[1], item[0]))
+        lines.append(f"Slowest {min(slowest, len(ranked))} of {len(ranked)} nodes:")
+        lines.extend(f"{time:>9.2f}s {key}" for key, time in ranked[:slowest])
+
+    elapsed = float(run_results.get("elapsed_time") or 0)
+    threads = get_threads(run_results)
+    if elapsed > 0:
+        utilization = sum(timings.values()) / (elapsed * threads)
+        lines.append(
+            f"Thread utilization: {utilization:.0%} "
+            f"({threads} threads, {elapsed:.2f}s elapsed)"
+        )
+
+    if baseline is not None:
+        deltas = sorted(
+            (
+                (time - baseline[key], key, time)
+                for key, time in timings.items()
+                if key in baseline
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+        lines.append(f"Execution time compared to the baseline ({len(deltas)} nodes):")
+        for delta, key, time in deltas:
+            previous = baseline[key]
+            ratio = f", {delta / previous:+.0%}" if previous > 0 else ""
+            lines.append(f"{time:>9.2f}s {key} ({delta:+.2f}s{ratio})")
+        missing = len(timings) - len(deltas)
+        if missing:
+            lines.append(f"{missing} nodes are not in the baseline.")
+    return lines
+
+
+def print_timing_report(
+    run_results_filename: str,
+    slowest: int = 0,
+    baseline_filename: Optional[str] = None,
+    write_baseline: bool = False,
+    previous_mtime: Optional[int] = None,
+) -> NoReturn:
+    run_results = load_run_results(run_results_filename, previous_mtime)
+    if run_results is None:
+        print(f"No timing report, {run_results_filename} was not written by dbt.")
+        return
+    baseline = None
+    if baseline_filename and not write_baseline:
+        baseline = load_baseline(baseline_filename)
+    for line in format_timing_report(run_results, slowest, baseline):
+        print(line)
+    if baseline_filename and write_baseline:
+        update_baseline(baseline_filename, run_results)
+        print(f"Execution times stored in {baseline_filename}.")
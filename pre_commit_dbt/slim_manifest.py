@@ -0,0 +1,123 @@
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+from typing import Sequence
+
+from pre_commit_dbt.json_projection import loads_projection
+from pre_commit_dbt.json_projection import Projection
+from pre_commit_dbt.utils import get_slim_manifest_path
+from pre_commit_dbt.utils import JsonOpenError
+
+# Every part of the manifest used by the hooks.
+SLIM_MANIFEST_PROJECTION: Projection = {
+    "metadata": None,
+    "nodes": [
+        "name",
+        "resource_type",
+        "path",
+        "original_file_path",
+        "patch_path",
+        "database",
+        "schema",
+        "alias",
+        "description",
+        "tags",
+        "meta",
+        "columns",
+        "depends_on",
+        "test_metadata",
+    ],
+    "sources": [
+        "name",
+        "source_name",
+        "resource_type",
+        "path",
+        "original_file_path",
+        "database",
+        "schema",
+        "identifier",
+        "description",
+        "tags",
+        "meta",
+        "columns",
+        "loader",
+        "loaded_at_field",
+        "freshness",
+    ],
+    "macros": [
+        "name",
+        "resource_type",
+        "path",
+        "original_file_path",
+        "patch_path",
+        "description",
+        "arguments",
+        "depends_on",
+    ],
+    "exposures": [
+        "name",
+        "resource_type",
+        "path",
+        "original_file_path",
+        "type",
+        "owner",
+        "depends_on",
+    ],
+    "parent_map": None,
+    "child_map": None,
+}
+
+
+def slim_manifest(manifest_filename: str) -> Path:
+    manifest_file = Path(manifest_filename)
+    try:
+        content = loads_projection(
+            manifest_file.read_text(encoding="utf-8"), SLIM_MANIFEST_PROJECTION
+        )
+    except Exception as e:
+        raise JsonOpenError(e)
+    slim_file = get_slim_manifest_path(manifest_filename)
+    fd, tmp_name = tempfile.mkstemp(dir=slim_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(content, f, separators=(",", ":"))
+        os.replace(tmp_name, slim_file)
+    except Exception:
+        os.unlink(tmp_name)
+        raise
+    return slim_file
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pre-commit-dbt slim-manifest")
+
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default="target/manifest.json",
+        help="""Location of manifest.json file. Usually target/manifest.json.
+        The slim manifest is written next to it, e.g. target/manifest.slim.json.
+        """,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        slim_file = slim_manifest(args.manifest)
+    except (JsonOpenError, OSError) as e:
+        print(f"Unable to create slim manifest from {args.manifest} ({e})")
+        return 1
+
+    original_size = Path(args.manifest).stat().st_size
+    print(
+        f"{slim_file}: {slim_file.stat().st_size} bytes "
+        f"(manifest {original_size} bytes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,34 @@
+"""Single-pass tokenizer of dbt SQL files.
+
+Tokens are words (lowercased), parentheses and commas. Comments (``--``,
+``/* */``, ``{# #}``) and Jinja statements (``{% %}``) separate tokens, string
+literals, quoted identifiers and Jinja expressions (``{{ }}``) are parts of
+words. Unterminated blocks end with the file. Nothing is backtracked over, so
+the time is linear in the size of the file.
+"""
+import re
+from typing import Generator
+
+TOKEN = re.compile(
+    r"""
+    (?P<skip>\s+|--[^\n]*|/\*.*?(?:\*/|\Z)|\{\#.*?(?:\#\}|\Z)|\{%.*?(?:%\}|\Z))
+    |(?P<punctuation>[(),])
+    |(?P<word>(?:
+        [^\s(),'"`{/-]+
+        |'[^'\\]*(?:(?:\\.|'')[^'\\]*)*(?:'|\Z)
+        |"[^"]*(?:""[^"]*)*(?:"|\Z)
+        |`[^`]*(?:`|\Z)
+        |\{\{.*?(?:\}\}|\Z)
+        |\{(?![{%\#])
+        |/(?!\*)
+        |-(?!-)
+    )+)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+def tokenize_sql(sql: str) -> Generator[str, None, None]:
+    for match in TOKEN.finditer(sql):
+        if match.lastgroup != "skip":
+            yield match.group().lower()
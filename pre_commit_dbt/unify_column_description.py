@@ -1,33 +1,39 @@
 import argparse
 from collections import Counter
 from pathlib import Path
+from typing import Dict
 from typing import NoReturn
 from typing import Optional
 from typing import Sequence
 
-import yaml
-
 from pre_commit_dbt.check_column_desc_are_same import get_grouped
 from pre_commit_dbt.utils import add_filenames_args
+from pre_commit_dbt.utils import add_jobs_args
+from pre_commit_dbt.utils import load_yaml_files
+from pre_commit_dbt.utils import write_text_atomic
+from pre_commit_dbt.yaml_io import dump_yaml_str
+from pre_commit_dbt.yaml_io import load_yaml
 
 
-def _replace_desc(path: Path, column_name: str, description: str) -> NoReturn:
-    file = yaml.safe_load(path.open())
+def _replace_descs(path: Path, descriptions: Dict[str, str]) -> NoReturn:
+    file = load_yaml(path.read_text())
     for model in file.get("models", []):
         for column in model.get("columns", []):
-            if column_name == column.get("name"):
-                column["description"] = description
-    with open(path, "w") as f:
-        yaml.dump(file, f, default_flow_style=False, sort_keys=False)
-        print(
-            f"{path}: replaced description of "
-            f"column `{column_name}` for `{description}`"
-        )
+            if column.get("name") in descriptions:
+                column["description"] = descriptions[column["name"]]
+    write_text_atomic(path, dump_yaml_str(file))
+    replaced = "\n".join(
+        f"- column `{column_name}` for `{description}`"
+        for column_name, description in descriptions.items()
+    )
+    print(f"{path}: replaced {len(descriptions)} descriptions:\n{replaced}")
 
 
 def replace_column_desc(paths: Sequence[str], ignore: Optional[Sequence[str]]) -> int:
     status_code = 0
     grouped = get_grouped(paths, ignore)
+    # all changes of a file are written at once
+    replacements: Dict[Path, Dict[str, str]] = {}
 
     for name, grps in grouped:
         groups = list(grps)
@@ -51,7 +57,10 @@ def replace_column_desc(paths: Sequence[str], ignore: Optional[Sequence[str]]) -
             else:
                 for group in groups:
                     if group.description != top_desc:
-                        _replace_desc(group.file, name, top_desc)
+                        replacements.setdefault(group.file, {})[name] = top_desc
+
+    for path, descriptions in replacements.items():
+        _replace_descs(path, descriptions)
 
     return status_code
 
@@ -59,6 +68,7 @@ def replace_column_desc(paths: Sequence[str], ignore: Optional[Sequence[str]]) -
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser()
     add_filenames_args(parser)
+    add_jobs_args(parser)
 
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
@@ -68,6 +78,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    load_yaml_files(args.filenames, args.jobs)
 
     return replace_column_desc(paths=args.filenames, ignore=args.ignore)
 
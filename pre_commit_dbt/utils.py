@@ -1,19 +1,79 @@
 import argparse
+import concurrent.futures
+import copy
+import gc
+import hashlib
 import json
+import marshal
+import os
+import shutil
+import struct
 import subprocess
+import sys
+import tempfile
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
 from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Deque
 from typing import Dict
+from typing import FrozenSet
 from typing import Generator
+from typing import IO
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import NoReturn
 from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Text
+from typing import Tuple
+from typing import TypeVar
 from typing import Union
-import yaml
+
+from pre_commit_dbt.graph import build_graph
+from pre_commit_dbt.graph import ManifestGraph
+from pre_commit_dbt.json_projection import loads_projection
+from pre_commit_dbt.json_projection import Projection
+from pre_commit_dbt.lineage import Lineage
+from pre_commit_dbt.yaml_io import load_yaml_with_lines
+
+
+JSON_CACHE_DIR = ".pre-commit-dbt"
+JSON_CACHE_VERSION = 1
+JSON_CACHE_CHUNK = 1024 * 1024
+JSON_CACHE_HEADER = struct.Struct("<Q")
+MANIFEST_INDEX_CACHE_SIZE = 8
+YAML_CACHE_ENV = "PRE_COMMIT_DBT_YAML_CACHE"
+YAML_DOCUMENTS_CACHE_SIZE = 4096
+MANIFEST_SECTIONS = ("nodes", "sources", "macros", "exposures")
+SLIM_MANIFEST_SUFFIX = ".slim.json"
+RELATION_PARTS = ("database", "schema", "name")
+# lines of the output of a command kept for the error report
+CMD_OUTPUT_TAIL = 200
+
+T = TypeVar("T")
+PathT = TypeVar("PathT", str, Path)
+
+# manifest parts needed to count tests of changed models
+MODEL_TESTS_PROJECTION: Projection = {
+    "nodes": ["name", "tags", "test_metadata"],
+    "macros": ["path"],
+    "child_map": None,
+}
+
+# manifest parts needed to walk the lineage of changed models
+LINEAGE_PROJECTION: Projection = {
+    "nodes": ["name"],
+    "macros": ["path"],
+    "parent_map": None,
+    "child_map": None,
+}
 
 
 class CalledProcessError(RuntimeError):
@@ -24,6 +84,10 @@ class JsonOpenError(RuntimeError):
     pass
 
 
+class TimeBudgetError(RuntimeError):
+    pass
+
+
 @dataclass
 class Model:
     model_id: str
@@ -107,6 +171,115 @@ class ExposureSchema:
     prefix: str = "exposure"
 
 
+@dataclass
+class PropertiesEntry:
+    resource_type: str
+    name: Optional[str]
+    file: Path
+    line: int
+    schema: Dict[str, Any]
+    # only source tables, their source without the tables
+    source_name: Optional[str] = None
+    source_schema: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class ProjectPropertiesIndex:
+    """Models, source tables, macros and exposures of properties files."""
+
+    entries: List[PropertiesEntry] = field(default_factory=list)
+    by_name: Dict[Tuple[str, Any], List[PropertiesEntry]] = field(
+        default_factory=dict
+    )
+
+    def add(self, entry: PropertiesEntry) -> NoReturn:
+        self.entries.append(entry)
+        if entry.resource_type == "source":
+            name: Any = (entry.source_name, entry.name)
+            names = name
+        else:
+            name = entry.name
+            names = (name,)
+        # malformed names can not be looked up
+        if all(isinstance(part, str) for part in names):
+            self.by_name.setdefault((entry.resource_type, name), []).append(entry)
+
+    def get(self, resource_type: str, name: str) -> List[PropertiesEntry]:
+        return self.by_name.get((resource_type, name), [])
+
+    def get_source(self, source_name: str, table_name: str) -> List[PropertiesEntry]:
+        return self.by_name.get(("source", (source_name, table_name)), [])
+
+    def of_type(self, resource_type: str) -> Generator[PropertiesEntry, None, None]:
+        return (
+            entry for entry in self.entries if entry.resource_type == resource_type
+        )
+
+
+@dataclass
+class DependencyIndex:
+    """Inverted index of ``child_map`` or ``parent_map`` keys.
+
+    Every key is registered under each of its dot-separated parts, so the keys
+    matched by ``obj_in_deps`` are found by intersecting a few short lists.
+    """
+
+    keys_by_part: Dict[str, List[str]]
+    parts: Dict[str, FrozenSet[str]]
+    position: Dict[str, int]
+
+    def find(self, required: Set[str]) -> List[str]:
+        postings = [self.keys_by_part.get(part, []) for part in required]
+        if not postings:
+            return []
+        candidates = min(postings, key=len)
+        keys = [key for key in candidates if required.issubset(self.parts[key])]
+        return sorted(keys, key=self.position.__getitem__)
+
+
+@dataclass
+class ManifestIndex:
+    """Lookups over manifest keys, built in one pass over the manifest.
+
+    ``ids_by_stem`` is keyed by (resource type, last part of the unique id),
+    which is what pre-commit gets as a changed filename.
+    ``source_ids_by_relation`` is keyed by (database, schema, name) of
+    sources, as well as by (schema, name) and (name,).
+    """
+
+    ids_by_type: Dict[str, List[str]]
+    ids_by_stem: Dict[Tuple[str, str], List[str]]
+    node_ids_by_name: Dict[str, List[str]]
+    source_ids_by_name: Dict[FrozenSet[str], List[str]]
+    node_ids_by_alias: Dict[str, List[str]]
+    source_ids_by_relation: Dict[Tuple[str, ...], List[str]]
+    position: Dict[str, int]
+    dependencies: Dict[str, DependencyIndex] = field(default_factory=dict)
+    graph: Optional[ManifestGraph] = None
+    lineage: Optional[Lineage] = None
+
+    def get_ids(self, resource_type: str, stems: Set[str]) -> List[str]:
+        ids = [
+            key
+            for stem in stems
+            for key in self.ids_by_stem.get((resource_type, stem), [])
+        ]
+        # keep the manifest order, as with a full scan
+        return sorted(ids, key=self.position.__getitem__)
+
+
+# document key (or id of a manifest not loaded by get_json) -> manifest, index
+_MANIFEST_INDEXES: Dict[str, Tuple[Dict[str, Any], ManifestIndex]] = {}
+_JSON_DOCUMENTS: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+# Projections are ignored while several hooks share the loaded documents.
+_JSON_PROJECTIONS = True
+# content digest -> marshalled document, or the document itself when it
+# cannot be marshalled
+_YAML_DOCUMENTS: Dict[str, Any] = {}
+# The cache keeps at least the documents parsed ahead by load_yaml_files.
+_YAML_DOCUMENTS_LIMIT = YAML_DOCUMENTS_CACHE_SIZE
+
+
 def cmd_output(
     *cmd: str,
     expected_code: Optional[int] = 0,
@@ -128,6 +301,44 @@ def cmd_output(
     return stdout
 
 
+def stream_cmd_output(
+    *cmd: str,
+    expected_code: Optional[int] = 0,
+    callback: Optional[Callable[[str], Any]] = None,
+    tail: Optional[int] = CMD_OUTPUT_TAIL,
+    echo: bool = True,
+    **kwargs: Any,
+) -> str:
+    """Like ``cmd_output``, but print the output line by line while ``cmd`` runs.
+
+    stderr is merged into stdout. Every line is passed to ``callback``, only
+    the last ``tail`` lines (all with ``None``) are kept and returned.
+    """
+    kwargs.setdefault("stdout", subprocess.PIPE)
+    kwargs.setdefault("stderr", subprocess.STDOUT)
+    lines: Deque[str] = deque(maxlen=tail)
+    proc = subprocess.Popen(cmd, **kwargs)
+    stdout = proc.stdout
+    assert stdout is not None
+    try:
+        for raw_line in stdout:
+            line = raw_line.decode(errors="replace")
+            if echo:
+                print(line, end="", flush=True)
+            lines.append(line)
+            if callback is not None:
+                callback(line)
+    except BaseException:
+        proc.kill()
+        raise
+    finally:
+        proc.wait()
+    output = "".join(lines)
+    if expected_code is not None and proc.returncode != expected_code:
+        raise CalledProcessError(cmd, expected_code, proc.returncode, output, "")
+    return output
+
+
 def paths_to_dbt_models(
     paths: Sequence[str],
     prefix: str = "",
@@ -136,22 +347,460 @@ def paths_to_dbt_models(
     return [prefix + Path(path).stem + postfix for path in paths]
 
 def get_exposure_paths(yml_files: Sequence[Path]) -> Generator[ExposurePathSchema, None, None]:
-    for yml_file in yml_files:
-        exposures = yaml.safe_load(yml_file.open()).get("exposures", [])
-        for exposure in exposures:
-            exposure_name = exposure.get("name")
-            exposure_path = yml_file
-            yield ExposurePathSchema(
-                    exposure_name=exposure_name,
-                    exposure_path=exposure_path
-                ) 
-
-def get_json(json_filename: str) -> Dict[str, Any]:
+    for entry in build_properties_index(yml_files).of_type("exposure"):
+        if entry.name:
+            yield ExposurePathSchema(exposure_name=entry.name, exposure_path=entry.file)
+
+def get_projection_key(projection: Optional[Projection]) -> str:
+    if projection is None:
+        return ""
+    return json.dumps(
+        {
+            section: sorted(fields) if fields is not None else None
+            for section, fields in projection.items()
+        },
+        sort_keys=True,
+    )
+
+
+def get_json_cache_path(json_file: Path, projection_key: str = "") -> Path:
+    name = json_file.name
+    if projection_key:
+        name += "." + hashlib.sha1(projection_key.encode()).hexdigest()[:12]
+    return json_file.parent / JSON_CACHE_DIR / f"{name}.marshal"
+
+
+def _json_cache_key(json_file: Path, digest: str) -> Dict[str, Any]:
+    stat = json_file.stat()
+    return {
+        "version": JSON_CACHE_VERSION,
+        "python": list(sys.version_info[:2]),
+        "path": str(json_file.resolve()),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "digest": digest,
+    }
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha1()  # pragma: no mutate
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(JSON_CACHE_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def gc_disabled() -> Generator[None, None, None]:
+    # Deserializing a big manifest creates millions of containers and
+    # would otherwise trigger many useless garbage collections.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _read_json_cache(
+    json_file: Path, projection_key: str = ""
+) -> Optional[Dict[str, Any]]:
+    """Return the cached document if it still matches ``json_file``.
+
+    Size and mtime are checked first. When only the mtime changed (dbt
+    rewrote an identical file) the content hash decides and the cache
+    key is refreshed.
+    """
+    cache_file = get_json_cache_path(json_file, projection_key)
+    try:
+        with cache_file.open("rb") as f, gc_disabled():
+            (key_size,) = JSON_CACHE_HEADER.unpack(f.read(JSON_CACHE_HEADER.size))
+            key = marshal.loads(f.read(key_size))
+            current = _json_cache_key(json_file, key.get("digest", ""))
+            if key == current:
+                return marshal.loads(f.read())
+            if {**key, "mtime": current["mtime"]} != current:
+                return None
+            if _file_digest(json_file) != key["digest"]:
+                return None
+            content = marshal.loads(f.read())
+    except Exception:
+        return None
+    _write_json_cache(json_file, current, content, projection_key)
+    return content
+
+
+def _write_json_cache(
+    json_file: Path,
+    key: Dict[str, Any],
+    content: Dict[str, Any],
+    projection_key: str = "",
+) -> NoReturn:
+    cache_file = get_json_cache_path(json_file, projection_key)
+    tmp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent)
+        key_content = marshal.dumps(key)
+        with os.fdopen(fd, "wb") as f:
+            f.write(JSON_CACHE_HEADER.pack(len(key_content)))
+            f.write(key_content)
+            f.write(marshal.dumps(content))
+        os.replace(tmp_name, cache_file)
+    except Exception:
+        # The cache is only an optimization, e.g. target/ can be read-only.
+        if tmp_name and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def write_text_atomic(path: Path, text: str) -> NoReturn:
+    """Replace the content of ``path``, readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
     try:
-        file_content = Path(json_filename).read_text(encoding="utf-8")
-        return json.loads(file_content)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def get_json(
+    json_filename: str,
+    use_cache: bool = True,
+    projection: Optional[Projection] = None,
+) -> Dict[str, Any]:
+    """Load a dbt artifact, e.g. manifest.json or catalog.json.
+
+    With ``use_cache`` the document is shared by every caller in the process
+    (it must not be mutated) for as long as the file is unchanged, and an
+    on-disk snapshot is used across processes.
+
+    ``projection`` limits the result to some top-level sections and fields of
+    their entries, the rest of the file is skipped. Callers have to expect
+    that more is returned, e.g. the whole document when it is already loaded.
+    """
+    json_file = Path(json_filename)
+    if not _JSON_PROJECTIONS:
+        projection = None
+    projection_key = get_projection_key(projection)
+    if use_cache:
+        try:
+            stat = json_file.stat()
+            document_key = str(json_file.resolve())
+            stat_key = (stat.st_size, stat.st_mtime_ns)
+        except OSError as e:
+            raise JsonOpenError(e)
+        for key in (document_key, document_key + projection_key):
+            document = _JSON_DOCUMENTS.get(key)
+            if document and document[0] == stat_key:
+                return document[1]
+        content = _read_json_cache(json_file, projection_key)
+        if content is None:
+            content = _parse_json(json_file, projection=projection)
+        # a reloaded file replaces its outdated documents and their indexes
+        for key in [*_JSON_DOCUMENTS]:
+            same_file = key == document_key or key.startswith(document_key + "{")
+            if same_file and _JSON_DOCUMENTS[key][0] != stat_key:
+                del _JSON_DOCUMENTS[key]
+                _MANIFEST_INDEXES.pop(key, None)
+        _JSON_DOCUMENTS[document_key + projection_key] = (stat_key, content)
+        _MANIFEST_INDEXES.pop(document_key + projection_key, None)
+        return content
+    return _parse_json(json_file, write_cache=False, projection=projection)
+
+
+def get_json_derived(
+    json_filename: str,
+    name: str,
+    func: Callable[[Dict[str, Any]], T],
+    projection: Optional[Projection] = None,
+) -> T:
+    """``func`` of a dbt artifact, cached on disk while the file is unchanged.
+
+    The result has to be serializable with ``marshal``.
+    """
+    json_file = Path(json_filename)
+    cache_key = f"{name}:{get_projection_key(projection)}"
+    cached = _read_json_cache(json_file, cache_key)
+    if cached is not None:
+        return cast(T, cached)
+    content = func(get_json(json_filename, projection=projection))
+    try:
+        key = _json_cache_key(json_file, _file_digest(json_file))
+    except OSError as e:
+        raise JsonOpenError(e)
+    _write_json_cache(json_file, key, content, cache_key)  # type: ignore
+    return content
+
+
+def clear_json_documents() -> NoReturn:
+    _JSON_DOCUMENTS.clear()
+    _MANIFEST_INDEXES.clear()
+
+
+def get_yaml_cache_path(digest: str) -> Optional[Path]:
+    cache_dir = os.environ.get(YAML_CACHE_ENV)
+    if not cache_dir:
+        return None
+    python = "".join(str(part) for part in sys.version_info[:2])
+    return Path(cache_dir) / f"{digest}.py{python}.marshal"
+
+
+def _read_yaml_cache(cache_file: Path) -> Optional[bytes]:
+    try:
+        content = cache_file.read_bytes()
+        marshal.loads(content)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return content
+
+
+def _write_yaml_cache(cache_file: Path, content: bytes) -> NoReturn:
+    tmp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_name, cache_file)
+    except Exception:
+        if tmp_name and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def _load_yaml_document(digest: str, content: bytes) -> Any:
+    cache_file = get_yaml_cache_path(digest)
+    if cache_file:
+        cached = _read_yaml_cache(cache_file)
+        if cached is not None:
+            return cached
+    document = load_yaml_with_lines(content)
+    try:
+        dumped = marshal.dumps(document)
+    except ValueError:
+        # e.g. dates, such documents are deep-copied instead
+        return document
+    if cache_file:
+        _write_yaml_cache(cache_file, dumped)
+    return dumped
+
+
+def _cache_yaml_document(digest: str, document: Any) -> NoReturn:
+    while len(_YAML_DOCUMENTS) >= max(_YAML_DOCUMENTS_LIMIT, 1):
+        _YAML_DOCUMENTS.pop(next(iter(_YAML_DOCUMENTS)))
+    _YAML_DOCUMENTS[digest] = document
+
+
+def get_yaml_with_lines(yml_file: Path) -> Tuple[Any, Dict[str, List[Any]]]:
+    """Parse a YAML file, the same content is parsed only once.
+
+    Every call returns a new copy of the document, callers can modify it.
+    Parsed documents are also stored in $PRE_COMMIT_DBT_YAML_CACHE if set.
+    Line numbers are the ones of ``load_yaml_with_lines``.
+    """
+    with yml_file.open("rb") as f:
+        content = f.read()
+    digest = hashlib.sha1(content).hexdigest()  # pragma: no mutate
+    if digest not in _YAML_DOCUMENTS:
+        _cache_yaml_document(digest, _load_yaml_document(digest, content))
+    document = _YAML_DOCUMENTS[digest]
+    if isinstance(document, bytes):
+        return marshal.loads(document)
+    return copy.deepcopy(document)
+
+
+def get_yaml(yml_file: Path) -> Any:
+    return get_yaml_with_lines(yml_file)[0]
+
+
+def _parse_yaml_file(path: str) -> Optional[Tuple[str, Any]]:
+    try:
+        content = Path(path).read_bytes()
+        digest = hashlib.sha1(content).hexdigest()  # pragma: no mutate
+        return digest, _load_yaml_document(digest, content)
+    except Exception:
+        # reported by the hook when it parses the file itself
+        return None
+
+
+def load_yaml_files(paths: Sequence[str], jobs: int = 1) -> NoReturn:
+    """Parse YAML files in ``jobs`` processes, ahead of ``get_yaml``.
+
+    Hooks still go through the files in the given order, only the parsing
+    is done in parallel. The cache grows to hold all of the parsed files.
+    """
+    global _YAML_DOCUMENTS_LIMIT
+    yml_paths = [path for path in paths if Path(path).suffix in (".yml", ".yaml")]
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(yml_paths) <= 1:
+        return
+    _YAML_DOCUMENTS_LIMIT = max(_YAML_DOCUMENTS_LIMIT, len(yml_paths))
+    chunksize = max(1, len(yml_paths) // (jobs * 4))  # pragma: no mutate
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        for parsed in executor.map(_parse_yaml_file, yml_paths, chunksize=chunksize):
+            if parsed:
+                _cache_yaml_document(*parsed)
+
+
+def map_files(
+    func: Callable[[PathT], T], paths: Iterable[PathT], jobs: int = 1
+) -> Iterator[Tuple[PathT, T]]:
+    """Call ``func`` for every file in ``jobs`` threads.
+
+    Meant for work bound by I/O. Results are yielded in the order of ``paths``,
+    an exception is raised when the result of its file is reached.
+    """
+    paths = list(paths)
+    if jobs == 0:
+        jobs = min(32, (os.cpu_count() or 1) + 4)  # pragma: no mutate
+    if jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield path, func(path)
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from zip(paths, executor.map(func, paths))
+
+
+def clear_yaml_documents() -> NoReturn:
+    global _YAML_DOCUMENTS_LIMIT
+    _YAML_DOCUMENTS.clear()
+    _YAML_DOCUMENTS_LIMIT = YAML_DOCUMENTS_CACHE_SIZE
+
+
+@contextmanager
+def full_json_documents() -> Generator[None, None, None]:
+    """Load whole documents, so that they are parsed once for all hooks."""
+    global _JSON_PROJECTIONS
+    projections = _JSON_PROJECTIONS
+    _JSON_PROJECTIONS = False
+    try:
+        yield
+    finally:
+        _JSON_PROJECTIONS = projections
+
+
+def _parse_json(
+    json_file: Path,
+    write_cache: bool = True,
+    projection: Optional[Projection] = None,
+) -> Dict[str, Any]:
+    try:
+        raw_content = json_file.read_bytes()
+        with gc_disabled():
+            if projection is None:
+                content = json.loads(raw_content.decode("utf-8"))
+            else:
+                content = loads_projection(raw_content.decode("utf-8"), projection)
     except Exception as e:
         raise JsonOpenError(e)
+    if write_cache:
+        digest = hashlib.sha1(raw_content).hexdigest()  # pragma: no mutate
+        _write_json_cache(
+            json_file,
+            _json_cache_key(json_file, digest),
+            content,
+            get_projection_key(projection),
+        )
+    return content
+
+
+def build_manifest_index(manifest: Dict[str, Any]) -> ManifestIndex:
+    index = ManifestIndex(
+        ids_by_type={},
+        ids_by_stem={},
+        node_ids_by_name={},
+        source_ids_by_name={},
+        node_ids_by_alias={},
+        source_ids_by_relation={},
+        position={},
+    )
+    for section in MANIFEST_SECTIONS:
+        for key, value in manifest.get(section, {}).items():
+            split_key = key.split(".")
+            resource_type = split_key[0]
+            index.position[key] = len(index.position)
+            index.ids_by_type.setdefault(resource_type, []).append(key)
+            index.ids_by_stem.setdefault((resource_type, split_key[-1]), []).append(
+                key
+            )
+            if section == "nodes":
+                index.node_ids_by_name.setdefault(value.get("name"), []).append(key)
+                index.node_ids_by_alias.setdefault(value.get("alias"), []).append(key)
+            elif section == "sources":
+                source_key = frozenset([value.get("source_name"), value.get("name")])
+                index.source_ids_by_name.setdefault(source_key, []).append(key)
+                relation = tuple(value.get(part) for part in RELATION_PARTS)
+                for start in range(len(relation)):
+                    index.source_ids_by_relation.setdefault(
+                        relation[start:], []
+                    ).append(key)
+    return index
+
+
+def get_manifest_index(manifest: Dict[str, Any]) -> ManifestIndex:
+    """Return the index of ``manifest``, built only once per manifest object.
+
+    The manifest is expected not to be mutated once it was indexed.
+    """
+    # documents of get_json are indexed by their path, so that the index of an
+    # outdated document is dropped with it when the file is reloaded
+    key = next(
+        (key for key, value in _JSON_DOCUMENTS.items() if value[1] is manifest),
+        f"id:{id(manifest)}",
+    )
+    cached = _MANIFEST_INDEXES.get(key)
+    if cached and cached[0] is manifest:
+        return cached[1]
+    index = build_manifest_index(manifest)
+    if len(_MANIFEST_INDEXES) >= MANIFEST_INDEX_CACHE_SIZE:
+        _MANIFEST_INDEXES.pop(next(iter(_MANIFEST_INDEXES)))
+    # the manifest is kept referenced, so its id can not be reused
+    _MANIFEST_INDEXES[key] = (manifest, index)
+    return index
+
+
+def build_dependency_index(deps: Dict[str, Any]) -> DependencyIndex:
+    index = DependencyIndex(keys_by_part={}, parts={}, position={})
+    for position, dep_name in enumerate(deps):
+        parts = frozenset(dep_name.split("."))
+        index.parts[dep_name] = parts
+        index.position[dep_name] = position
+        for part in parts:
+            index.keys_by_part.setdefault(part, []).append(dep_name)
+    return index
+
+
+def get_dependency_index(
+    manifest: Dict[str, Any], manifest_node: str
+) -> DependencyIndex:
+    manifest_index = get_manifest_index(manifest)
+    index = manifest_index.dependencies.get(manifest_node)
+    if index is None:
+        index = build_dependency_index(manifest.get(manifest_node, {}))
+        manifest_index.dependencies[manifest_node] = index
+    return index
+
+
+def get_manifest_graph(manifest: Dict[str, Any]) -> ManifestGraph:
+    """Graph of ``parent_map`` and ``child_map``, built once per manifest."""
+    manifest_index = get_manifest_index(manifest)
+    if manifest_index.graph is None:
+        manifest_index.graph = build_graph(manifest)
+    return manifest_index.graph
+
+
+def get_lineage(manifest: Dict[str, Any]) -> Lineage:
+    """Lineage over the manifest graph, its results are kept per manifest."""
+    manifest_index = get_manifest_index(manifest)
+    if manifest_index.lineage is None:
+        manifest_index.lineage = Lineage(get_manifest_graph(manifest))
+    return manifest_index.lineage
 
 
 def get_models(
@@ -159,11 +808,10 @@ def get_models(
     filenames: Set[str],
 ) -> Generator[Model, None, None]:
     nodes = manifest.get("nodes", {})
-    for key, node in nodes.items():
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if filename in filenames and split_key[0] == "model":
-            yield Model(key, node.get("name"), filename, node)  # pragma: no mutate
+    for key in get_manifest_index(manifest).get_ids("model", filenames):
+        node = nodes[key]
+        filename = key.split(".")[-1]
+        yield Model(key, node.get("name"), filename, node)  # pragma: no mutate
 
 
 def get_macros(
@@ -171,12 +819,11 @@ def get_macros(
     filenames: Set[str],
 ) -> Generator[Macro, None, None]:
     macros = manifest.get("macros", {})
-    for key, macro in macros.items():
-        split_key = key.split(".")
-        filename = split_key[-1]
-        if filename in filenames and split_key[0] == "macro":
-            macro_ref = Macro(key, macro.get("name"), filename, macro)  # pragma: no mutate
-            yield macro_ref
+    for key in get_manifest_index(manifest).get_ids("macro", filenames):
+        macro = macros[key]
+        filename = key.split(".")[-1]
+        macro_ref = Macro(key, macro.get("name"), filename, macro)  # pragma: no mutate
+        yield macro_ref
 
 
 def get_macro_name(macro_ref: str) -> str:
@@ -216,74 +863,122 @@ def get_model_sqls(paths: Sequence[str], manifest: Dict[str, Any]) -> Dict[str,
     return {k: v for k, v in sqls.items() if k not in macro_sqls}
 
 
+def _add_properties(
+    index: ProjectPropertiesIndex,
+    yml_file: Path,
+    schema: Any,
+    lines: Dict[str, List[Any]],
+) -> NoReturn:
+    if not isinstance(schema, dict):
+        return
+    for section, resource_type in (
+        ("models", "model"),
+        ("macros", "macro"),
+        ("exposures", "exposure"),
+    ):
+        entries = schema.get(section, [])
+        if not isinstance(entries, list):
+            continue
+        section_lines = lines.get(section, [])
+        for i, entry in enumerate(entries):
+            if isinstance(entry, dict):
+                index.add(
+                    PropertiesEntry(
+                        resource_type=resource_type,
+                        name=entry.get("name"),
+                        file=yml_file,
+                        line=section_lines[i] if i < len(section_lines) else 0,
+                        schema=entry,
+                    )
+                )
+    sources = schema.get("sources", [])
+    if not isinstance(sources, list):
+        return
+    sources_lines = lines.get("sources", [])
+    for i, source in enumerate(sources):
+        if not isinstance(source, dict):
+            continue
+        tables = source.get("tables", [])
+        source = {key: value for key, value in source.items() if key != "tables"}
+        tables_lines = sources_lines[i][1] if i < len(sources_lines) else []
+        for j, table in enumerate(tables if isinstance(tables, list) else []):
+            if isinstance(table, dict):
+                index.add(
+                    PropertiesEntry(
+                        resource_type="source",
+                        name=table.get("name"),
+                        file=yml_file,
+                        line=tables_lines[j] if j < len(tables_lines) else 0,
+                        schema=table,
+                        source_name=source.get("name"),
+                        source_schema=source,
+                    )
+                )
+
+
+def build_properties_index(yml_files: Sequence[Path]) -> ProjectPropertiesIndex:
+    """Index all properties files in one pass, see ``get_yaml_with_lines``."""
+    index = ProjectPropertiesIndex()
+    for yml_file in yml_files:
+        schema, lines = get_yaml_with_lines(yml_file)
+        _add_properties(index, yml_file, schema, lines)
+    return index
+
+
 def get_model_schemas(
     yml_files: Sequence[Path], filenames: Set[str], all_schemas: bool = False
 ) -> Generator[ModelSchema, None, None]:
-    for yml_file in yml_files:
-        schema = yaml.safe_load(yml_file.open())
-        for model in schema.get("models", []):
-            if isinstance(model, dict) and model.get("name"):
-                model_name = model.get("name", "")  # pragma: no mutate
-                if model_name in filenames or all_schemas:
-                    yield ModelSchema(
-                        model_name=model_name,
-                        file=yml_file,
-                        filename=yml_file.stem,
-                        schema=model,
-                    )
+    for entry in build_properties_index(yml_files).of_type("model"):
+        if entry.name and (entry.name in filenames or all_schemas):
+            yield ModelSchema(
+                model_name=entry.name,
+                file=entry.file,
+                filename=entry.file.stem,
+                schema=entry.schema,
+            )
 
 
 def get_macro_schemas(
     yml_files: Sequence[Path], filenames: Set[str], all_schemas: bool = False
 ) -> Generator[MacroSchema, None, None]:
-    for yml_file in yml_files:
-        schema = yaml.safe_load(yml_file.open())
-        for macro in schema.get("macros", []):
-            if isinstance(macro, dict) and macro.get("name"):
-                macro_name = macro.get("name", "")  # pragma: no mutate
-                if macro_name in filenames or all_schemas:
-                    yield MacroSchema(
-                        macro_name=macro_name,
-                        file=yml_file,
-                        filename=yml_file.stem,
-                        schema=macro,
-                    )
+    for entry in build_properties_index(yml_files).of_type("macro"):
+        if entry.name and (entry.name in filenames or all_schemas):
+            yield MacroSchema(
+                macro_name=entry.name,
+                file=entry.file,
+                filename=entry.file.stem,
+                schema=entry.schema,
+            )
 
 
 def get_source_schemas(
     yml_files: Sequence[Path],
 ) -> Generator[SourceSchema, None, None]:
-    for yml_file in yml_files:
-        schema = yaml.safe_load(yml_file.open())
-        for source in schema.get("sources", []):
-            source_name = source.get("name")
-            tables = source.pop("tables", [])
-            for table in tables:
-                table_name = table.get("name")
-                yield SourceSchema(
-                    source_name=source_name,
-                    table_name=table_name,
-                    filename=yml_file.stem,
-                    source_schema=source,
-                    table_schema=table,
-                )
+    for entry in build_properties_index(yml_files).of_type("source"):
+        if entry.name and entry.source_name and entry.source_schema is not None:
+            yield SourceSchema(
+                source_name=entry.source_name,
+                table_name=entry.name,
+                filename=entry.file.stem,
+                source_schema=entry.source_schema,
+                table_schema=entry.schema,
+            )
 
                 
 def get_exposures(yml_files: Sequence[Path]) -> Generator[ExposureSchema, None, None]:
-    for yml_file in yml_files:
-        schema = yaml.safe_load(yml_file.open())
-        for exposure in schema.get("exposures", []):
+    for entry in build_properties_index(yml_files).of_type("exposure"):
+        if entry.name:
             yield ExposureSchema(
-                    exposure_name=exposure.get("name"),
-                    filename=yml_file.stem,
-                    exposure_type=exposure.get("type"),
-                    owner=exposure.get("owner"),
-                    models=exposure.get("depends_on"),
-                )
+                exposure_name=entry.name,
+                filename=entry.file.stem,
+                exposure_type=entry.schema.get("type", ""),
+                owner=entry.schema.get("owner", {}),
+                models=entry.schema.get("depends_on"),
+            )
 
 
 def contains_source_definition(yml_file:Path)->bool:
-    schema = yaml.safe_load(yml_file.open())
+    schema = get_yaml(yml_file)
     return True if schema.get("sources", [])!=0 else False
 
 def get_source_path(
@@ -317,36 +1012,53 @@ def get_test(node_id: str, manifest: Dict[str, Any]) -> Test:
     )
 
 
+def get_deps_names(
+    manifest: Dict[str, Any], obj: Any, manifest_node: str
+) -> List[str]:
+    """Same keys of ``manifest_node`` as matched by ``obj_in_deps``."""
+    if isinstance(obj, SourceSchema):
+        required = {obj.prefix, obj.source_name, obj.table_name}
+    elif isinstance(obj, ModelSchema):
+        required = {obj.prefix, obj.model_name}
+    elif isinstance(obj, Model):
+        deps = manifest.get(manifest_node, {})
+        return [obj.model_id] if obj.model_id in deps else []
+    else:
+        return []
+    return get_dependency_index(manifest, manifest_node).find(required)
+
+
 def get_parent_childs(
     manifest: Dict[str, Any], obj: Any, manifest_node: str, node_types: List[str]
 ) -> Generator[Union[Test, Model, Source], None, None]:
-    deps = manifest.get(manifest_node, {})
-    for dep_name, dep_items in deps.items():
-        if obj_in_deps(obj, dep_name):
-            for node_id in dep_items:
-                node_type = node_id.split(".")[0]
-                if node_type in node_types:
-                    if node_type == "test":
-                        yield get_test(node_id, manifest)
-                    elif node_type == "model":
-                        node = manifest.get("nodes", {}).get(node_id)
-                        yield Model(
-                            model_id=node_id,
-                            model_name=node.get("name", ""),  # pragma: no mutate
-                            filename=node.get("path", ""),  # pragma: no mutate
-                            node=node,
-                        )
-                    else:  # Source
-                        node = manifest.get("sources", {}).get(node_id)
-                        yield Source(
-                            source_id=node_id,
-                            source_name=node.get(
-                                "source_name", ""
-                            ),  # pragma: no mutate
-                            table_name=node.get("name", ""),  # pragma: no mutate
-                            filename=node.get("path", ""),  # pragma: no mutate
-                            node=node,
-                        )
+    graph = get_manifest_graph(manifest)
+    if manifest_node == "parent_map":
+        get_deps = graph.parents_of
+    else:
+        get_deps = graph.children_of
+    for dep_name in get_deps_names(manifest, obj, manifest_node):
+        for dep in get_deps(dep_name, node_types):
+            node_id = graph.node_ids[dep]
+            node_type = graph.node_type(dep)
+            if node_type == "test":
+                yield get_test(node_id, manifest)
+            elif node_type == "model":
+                node = manifest.get("nodes", {}).get(node_id)
+                yield Model(
+                    model_id=node_id,
+                    model_name=node.get("name", ""),  # pragma: no mutate
+                    filename=node.get("path", ""),  # pragma: no mutate
+                    node=node,
+                )
+            else:  # Source
+                node = manifest.get("sources", {}).get(node_id)
+                yield Source(
+                    source_id=node_id,
+                    source_name=node.get("source_name", ""),  # pragma: no mutate
+                    table_name=node.get("name", ""),  # pragma: no mutate
+                    filename=node.get("path", ""),  # pragma: no mutate
+                    node=node,
+                )
 
 
 def get_filenames(
@@ -364,19 +1076,90 @@ def get_filenames(
     return result
 
 
-def run_dbt_cmd(cmd: Sequence[Any]) -> int:
+def run_dbt_cmd(
+    cmd: Sequence[Any], callback: Optional[Callable[[str], Any]] = None
+) -> int:
+    """Run a dbt command, its output is printed while it runs.
+
+    ``callback`` gets every line of the output, e.g. to follow the progress.
+    """
     status_code = 0
     print(f"Executing cmd: `{' '.join(cmd)}`")
     try:
-        output = cmd_output(*list(filter(None, cmd)), expected_code=0)
-        print(output)
+        stream_cmd_output(*list(filter(None, cmd)), expected_code=0, callback=callback)
     except CalledProcessError as e:
-        print(e.args[3])  # pragma: no mutate
+        print(f"Command failed with exit code {e.args[2]}")  # pragma: no mutate
         status_code = 1
         return status_code
     return status_code
 
 
+def _capture_dbt_cmd(
+    cmd: Sequence[Any], callback: Optional[Callable[[str], Any]] = None
+) -> Tuple[int, IO[str]]:
+    """Run a dbt command, its output is spooled to a temporary file."""
+    spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def spool_line(line: str) -> NoReturn:
+        spool.write(line)
+        if callback is not None:
+            callback(line)
+
+    try:
+        stream_cmd_output(*list(filter(None, cmd)), callback=spool_line, echo=False)
+        returncode = 0
+    except CalledProcessError as e:
+        returncode = e.args[2]
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return returncode, spool
+
+
+def run_dbt_cmds(
+    waves: Sequence[Sequence[Sequence[Any]]],
+    jobs: int = 1,
+    callback: Optional[Callable[[str], Any]] = None,
+) -> int:
+    """Run dbt commands, wave after wave.
+
+    With ``jobs`` above one the commands of a wave run concurrently, the
+    output of every command is printed once it finished, in the order of the
+    commands. Waves after a failed wave are skipped.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1  # pragma: no mutate
+    for number, wave in enumerate(waves):
+        if jobs <= 1 or len(wave) <= 1:
+            status_codes = [run_dbt_cmd(cmd, callback) for cmd in wave]
+        else:
+            status_codes = []
+            workers = min(jobs, len(wave))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(lambda cmd: _capture_dbt_cmd(cmd, callback), wave)
+                for cmd, (returncode, output) in zip(wave, results):
+                    print(f"Executing cmd: `{' '.join(cmd)}`", flush=True)
+                    with output:
+                        shutil.copyfileobj(output, sys.stdout)
+                    if returncode:
+                        print(f"Command failed with exit code {returncode}")
+                    status_codes.append(1 if returncode else 0)
+        if any(status_codes):
+            skipped = sum(len(wave) for wave in waves[number + 1 :])
+            if skipped:
+                print(f"Skipped {skipped} commands after the failed commands.")
+            return 1
+    return 0
+
+
+def chunked(items: Sequence[T], size: int) -> List[List[T]]:
+    """Split ``items`` in lists of ``size`` items, one list if ``size`` is 0."""
+    if size <= 0 or not items:
+        return [list(items)]
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
 def add_filenames_args(parser: argparse.ArgumentParser) -> NoReturn:
     parser.add_argument(
         "filenames",
@@ -385,13 +1168,54 @@ def add_filenames_args(parser: argparse.ArgumentParser) -> NoReturn:
     )
 
 
+def add_jobs_args(parser: argparse.ArgumentParser) -> NoReturn:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="""Number of files processed in parallel, e.g. when running
+        `pre-commit run --all-files` on a large project. YAML files are parsed
+        in processes, SQL files are read in threads. 0 sets the number from
+        the CPU count. Results are the same as with one worker.
+        """,
+    )
+
+
+def get_slim_manifest_path(manifest_filename: str) -> Path:
+    manifest_file = Path(manifest_filename)
+    return manifest_file.with_name(manifest_file.stem + SLIM_MANIFEST_SUFFIX)
+
+
+def get_manifest_path(manifest_filename: str) -> str:
+    """Use the slim manifest if it was generated from the current manifest."""
+    slim_file = get_slim_manifest_path(manifest_filename)
+    try:
+        manifest_mtime = Path(manifest_filename).stat().st_mtime_ns
+        if slim_file.stat().st_mtime_ns >= manifest_mtime:
+            return str(slim_file)
+    except OSError:
+        pass
+    return manifest_filename
+
+
+def get_full_manifest_path(manifest_filename: str) -> str:
+    """The manifest a slim manifest was generated from."""
+    manifest_file = Path(manifest_filename)
+    if manifest_file.name.endswith(SLIM_MANIFEST_SUFFIX):
+        name = manifest_file.name[: -len(SLIM_MANIFEST_SUFFIX)] + ".json"
+        return str(manifest_file.with_name(name))
+    return manifest_filename
+
+
 def add_manifest_args(parser: argparse.ArgumentParser) -> NoReturn:
     parser.add_argument(
         "--manifest",
-        type=str,
+        type=get_manifest_path,
         default="target/manifest.json",
         help="""Location of manifest.json file. Usually target/manifest.json.
-        This file contains a full representation of dbt project.
+        This file contains a full representation of dbt project. A slim
+        manifest created by `pre-commit-dbt slim-manifest` is used instead
+        when it is up to date.
         """,
     )
 
@@ -445,6 +1269,83 @@ def add_dbt_cmd_model_args(parser: argparse.ArgumentParser) -> NoReturn:
     )
 
 
+def add_skip_unchanged_args(parser: argparse.ArgumentParser) -> NoReturn:
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="""Skip the dbt command when it already succeeded with the same
+        flags and input files (project, profile, package and source files).
+        Changes in the warehouse or of environment variables other than
+        DBT_* are not detected.""",
+    )
+
+
+def add_dbt_cmd_chunk_args(parser: argparse.ArgumentParser) -> NoReturn:
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0,
+        help="""Maximal number of models selected by one dbt command, e.g. when
+        running `pre-commit run --all-files` on a large project. By default
+        all models are selected by one command.""",
+    )
+    parser.add_argument(
+        "--chunk-jobs",
+        type=int,
+        default=1,
+        help="""Number of dbt commands run concurrently, 0 sets the number from
+        the CPU count. Their output is printed in the order of the commands.
+        """,
+    )
+
+
+def add_timing_report_args(parser: argparse.ArgumentParser) -> NoReturn:
+    parser.add_argument(
+        "--report-slowest",
+        type=int,
+        default=0,
+        help="""Print the N slowest nodes and the thread utilization from
+        run_results.json once dbt finished.""",
+    )
+    parser.add_argument(
+        "--run-results",
+        type=str,
+        default="target/run_results.json",
+        help="""Location of run_results.json file. Usually
+        target/run_results.json.""",
+    )
+    parser.add_argument(
+        "--timing-baseline",
+        type=str,
+        help="""Location of a JSON file with execution times of nodes. The
+        execution time of every node is compared with it.""",
+    )
+    parser.add_argument(
+        "--write-timing-baseline",
+        action="store_true",
+        help="""Store the execution times of the successful nodes in
+        --timing-baseline instead of comparing them.""",
+    )
+
+
+def add_impact_args(parser: argparse.ArgumentParser) -> NoReturn:
+    parser.add_argument(
+        "--impact",
+        action="store_true",
+        help="""Select only the nodes affected by the changed files (also
+        properties and macro files), found in the manifest. Run `dbt compile`
+        or `dbt parse` before, so that the manifest is up to date.""",
+    )
+    parser.add_argument(
+        "--state",
+        type=str,
+        help="""Location of manifest.json file to compare with, e.g. from the
+        production run. Select the nodes modified since then instead of the
+        changed files.""",
+    )
+    add_manifest_args(parser)
+
+
 class ParseDict(argparse.Action):  # pragma: no cover
     """Parse a KEY=VALUE string-list into a dictionary"""
 
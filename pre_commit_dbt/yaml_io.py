@@ -0,0 +1,88 @@
+"""Reading and writing of YAML files, with libyaml when PyYAML was built with it."""
+import io
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper  # type: ignore
+    from yaml import SafeLoader  # type: ignore
+
+YamlStream = Union[str, bytes, IO[str], IO[bytes]]
+# Sections of properties files, which entries get their line numbers.
+PROPERTIES_SECTIONS = ("models", "sources", "macros", "exposures")
+
+
+def load_yaml(stream: YamlStream) -> Any:
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def _get_lines(node: yaml.Node, nested: Optional[str] = None) -> List[Any]:
+    if not isinstance(node, yaml.SequenceNode):
+        return []
+    lines: List[Any] = []
+    for item in node.value:
+        line = item.start_mark.line + 1
+        if nested is None:
+            lines.append(line)
+        else:
+            nested_node = _get_value(item, nested)
+            lines.append([line, _get_lines(nested_node) if nested_node else []])
+    return lines
+
+
+def _get_value(node: yaml.Node, key: str) -> Optional[yaml.Node]:
+    value = None
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            if key_node.value == key:
+                value = value_node
+    return value
+
+
+def load_yaml_with_lines(stream: YamlStream) -> Tuple[Any, Dict[str, List[Any]]]:
+    """Load a properties file and the line numbers of its entries.
+
+    Lines are listed by section, in the same order as the entries. Every
+    source has its line and the lines of its tables.
+    """
+    loader = SafeLoader(stream)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None, {}
+        document = loader.construct_document(node)
+    finally:
+        loader.dispose()
+    lines = {}
+    for section in PROPERTIES_SECTIONS:
+        section_node = _get_value(node, section)
+        if section_node is not None:
+            nested = "tables" if section == "sources" else None
+            lines[section] = _get_lines(section_node, nested)
+    return document, lines
+
+
+def dump_yaml(data: Any, stream: Optional[IO[str]] = None) -> Optional[str]:
+    return yaml.dump(  # type: ignore
+        data,
+        stream,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+
+
+def dump_yaml_str(data: Any) -> str:
+    stream = io.StringIO()
+    dump_yaml(data, stream)
+    return stream.getvalue()
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from pre_commit_dbt.check_model_depth import main
+
+MANIFEST = {
+    "nodes": {
+        "model.p.stg_a": {"name": "stg_a"},
+        "model.p.int_b": {"name": "int_b"},
+        "model.p.mart_c": {"name": "mart_c"},
+    },
+    "sources": {"source.p.raw.s1": {"source_name": "raw", "name": "s1"}},
+    "macros": {},
+    "parent_map": {
+        "source.p.raw.s1": [],
+        "model.p.stg_a": ["source.p.raw.s1"],
+        "model.p.int_b": ["model.p.stg_a"],
+        "model.p.mart_c": ["model.p.int_b", "source.p.raw.s1"],
+    },
+}
+
+# Input, args, expected return value, expected output
+TESTS = (
+    (["models/stg_a.sql"], ["--max-depth", "1"], 0, ""),
+    (["models/mart_c.sql"], ["--max-depth", "3"], 0, ""),
+    (
+        ["models/stg_a.sql", "models/mart_c.sql"],
+        ["--max-depth", "2"],
+        1,
+        "mart_c: has depth 3, but maximal depth 2 is allowed:\n"
+        "- source.p.raw.s1 -> model.p.stg_a -> model.p.int_b -> model.p.mart_c\n",
+    ),
+    (["models/unknown.sql"], ["--max-depth", "0"], 0, ""),
+)
+
+
+@pytest.mark.parametrize(
+    ("input_files", "args", "expected_status_code", "output"), TESTS
+)
+def test_check_model_depth(
+    input_files, args, expected_status_code, output, tmpdir, capsys
+):
+    manifest_file = tmpdir.join("manifest.json")
+    manifest_file.write(json.dumps(MANIFEST))
+    status_code = main([*input_files, *args, "--manifest", str(manifest_file)])
+    assert status_code == expected_status_code
+    assert capsys.readouterr().out == output
+
+
+def test_check_model_depth_no_manifest(tmpdir):
+    manifest = str(tmpdir.join("missing.json"))
+    assert main(["models/stg_a.sql", "--max-depth", "1", "--manifest", manifest]) == 1
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from pre_commit_dbt.check_model_upstream_sources import main
+
+MANIFEST = {
+    "nodes": {
+        "model.p.stg_a": {"name": "stg_a"},
+        "model.p.stg_b": {"name": "stg_b"},
+        "model.p.mart_c": {"name": "mart_c"},
+        "model.p.orphan": {"name": "orphan"},
+    },
+    "sources": {},
+    "macros": {},
+    "parent_map": {
+        "model.p.stg_a": ["source.p.raw.s1", "source.p.raw.s2"],
+        "model.p.stg_b": ["source.p.raw.s2", "seed.p.codes"],
+        "model.p.mart_c": ["model.p.stg_a", "model.p.stg_b"],
+        "model.p.orphan": [],
+    },
+}
+
+# Input, args, expected return value
+TESTS = (
+    (["models/mart_c.sql"], ["--max-source-cnt", "2"], 0),
+    (["models/mart_c.sql"], ["--max-source-cnt", "1"], 1),
+    (["models/stg_b.sql"], ["--max-source-cnt", "1"], 0),
+    (["models/mart_c.sql"], ["--min-source-cnt", "3"], 1),
+    (["models/orphan.sql"], ["--min-source-cnt", "1"], 1),
+    (["models/orphan.sql"], [], 0),
+    (["models/stg_a.sql", "models/stg_b.sql"], ["--min-source-cnt", "2"], 1),
+)
+
+
+@pytest.mark.parametrize(("input_files", "args", "expected_status_code"), TESTS)
+def test_check_model_upstream_sources(input_files, args, expected_status_code, tmpdir):
+    manifest_file = tmpdir.join("manifest.json")
+    manifest_file.write(json.dumps(MANIFEST))
+    status_code = main([*input_files, *args, "--manifest", str(manifest_file)])
+    assert status_code == expected_status_code
+
+
+def test_check_model_upstream_sources_output(tmpdir, capsys):
+    manifest_file = tmpdir.join("manifest.json")
+    manifest_file.write(json.dumps(MANIFEST))
+    argv = ["models/mart_c.sql", "--max-source-cnt", "1"]
+    main([*argv, "--manifest", str(manifest_file)])
+    assert capsys.readouterr().out == (
+        "mart_c: depends on 2 sources, but at most 1 are allowed.\n"
+    )
@@ -1,9 +1,15 @@
+import random
+import time
+from unittest.mock import patch
+
 import pytest
 
 from pre_commit_dbt.check_script_has_no_table_name import has_table_name
 from pre_commit_dbt.check_script_has_no_table_name import main
 from pre_commit_dbt.check_script_has_no_table_name import prev_cur_next_iter
 from pre_commit_dbt.check_script_has_no_table_name import replace_comments
+from pre_commit_dbt.sql_tokens import tokenize_sql
+from pre_commit_dbt.utils import TimeBudgetError
 
 
 # Input, args, expected return value, expected output
@@ -292,6 +298,18 @@ def test_has_table_name_integration(
     assert ret == expected_status_code
 
 
+def test_has_table_name_jobs(tmpdir, capsys):
+    paths = []
+    for i, (input_s, *_) in enumerate(TESTS):
+        path = tmpdir.join(f"file{i}.sql")
+        path.write_text(input_s, "utf-8")
+        paths.append(str(path))
+    expected_ret = main(paths)
+    expected_output = capsys.readouterr().out
+    assert main([*paths, "--jobs", "4"]) == expected_ret
+    assert capsys.readouterr().out == expected_output
+
+
 def test_replace_comments():
     sql = "-- select * from ee"
     assert replace_comments(sql) == ""
@@ -299,6 +317,61 @@ def test_replace_comments():
     assert replace_comments(sql) == ""
     sql = "/* select * from ee*/"
     assert replace_comments(sql) == "" or replace_comments(sql) == "/**/"
+    sql = "select '--', '/*' from {# aa #} bb -- cc\n/* dd */"
+    assert replace_comments(sql) == "select '--', '/*' from  bb \n"
+
+
+PATHOLOGICAL = [
+    "/*" + " select * from aa\n" * 50000,
+    "{#" + " select * from aa\n" * 50000,
+    "select * from aa -- comment\n" * 50000,
+    "--\n" * 300000,
+    " " * 1000000 + "-",
+    "/*" * 300000,
+    "/* a " * 200000,
+    "{# a\n" * 200000,
+    "'" + "''" * 300000,
+    "{{" * 300000,
+    "(" * 300000,
+]
+
+
+@pytest.mark.parametrize("sql", PATHOLOGICAL, ids=range(len(PATHOLOGICAL)))
+def test_pathological_sql_is_linear(sql):
+    start = time.perf_counter()
+    list(tokenize_sql(sql))
+    has_table_name(sql, "text.sql")
+    # the backtracking regex took minutes for some of these
+    assert time.perf_counter() - start < 5
+
+
+def test_fuzz_sql():
+    rnd = random.Random(42)
+    alphabet = ["/*", "*/", "{#", "#}", "{{", "}}", "{%", "%}", "--", "'", '"']
+    alphabet += ["`", "(", ")", ",", " ", "\n", "from", "join", "as", "a", "*", "/"]
+    for _ in range(500):
+        sql = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 60)))
+        tokens = list(tokenize_sql(sql))
+        assert all(tokens)
+        assert len("".join(tokens)) <= len(sql)
+        has_table_name(sql, "text.sql", deadline=time.monotonic() + 5)
+
+
+def test_has_table_name_time_budget():
+    with pytest.raises(TimeBudgetError):
+        has_table_name("select * from aa", "text.sql", deadline=time.monotonic() - 1)
+
+
+def test_time_budget_reported(tmpdir, capsys):
+    path = tmpdir.join("file.sql")
+    path.write_text("select * from {{ ref('aa') }}", "utf-8")
+    with patch(
+        "pre_commit_dbt.check_script_has_no_table_name.time.monotonic"
+    ) as monotonic:
+        monotonic.side_effect = [0, 100]
+        assert main([str(path), "--time-budget", "1"]) == 1
+    assert capsys.readouterr().out == f"{path}: not checked, it took more than 1.0s.\n"
+    assert main([str(path), "--time-budget", "0"]) == 0
 
 
 def test_prev_cur_next_iter():
@@ -316,3 +389,19 @@ def test_prev_cur_next_iter():
     assert prv == "bb"
     assert cur == "cc"
     assert nxt is None
+
+
+@pytest.mark.parametrize(
+    ("input_s", "expected_tables"),
+    [
+        ("select * from /* comment */ aa", {"aa"}),
+        ("select 'select * from aa' as a from {{ ref('bb') }}", set()),
+        ("select * from {{ref('aa')}}", set()),
+        ("select * from {% if x %} aa {% endif %}", {"aa"}),
+        ("select * from aa, bb", {"aa"}),
+        ("select * from", set()),
+        ("", set()),
+    ],
+)
+def test_has_table_name_tokens(input_s, expected_tables):
+    assert has_table_name(input_s, "text.sql")[1] == expected_tables
@@ -29,3 +29,15 @@ def test_check_semicolon_integration(input_s, expected_status_code, tmpdir):
     status_code = main([str(path)])
 
     assert status_code == expected_status_code
+
+
+def test_check_semicolon_jobs(tmpdir, capsys):
+    paths = []
+    for i, (input_s, _) in enumerate(TESTS):
+        path = tmpdir.join(f"file{i}.txt")
+        path.write_binary(input_s)
+        paths.append(str(path))
+    expected_status_code = main(paths)
+    expected_output = capsys.readouterr().out
+    assert main([*paths, "--jobs", "4"]) == expected_status_code
+    assert capsys.readouterr().out == expected_output
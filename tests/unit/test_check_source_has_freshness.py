@@ -118,3 +118,16 @@ def test_check_source_has_freshness(input_schema, expected_status_code, tmpdir):
     yml_file.write(input_schema)
     status_code = main(argv=[str(yml_file), "--freshness", "error_after", "warn_after"])
     assert status_code == expected_status_code
+
+
+def test_check_source_has_freshness_jobs(tmpdir, capsys):
+    files = []
+    for i, (input_schema, _) in enumerate(TESTS):
+        yml_file = tmpdir.join(f"schema{i}.yml")
+        yml_file.write(input_schema)
+        files.append(str(yml_file))
+    argv = [*files, "--freshness", "error_after", "warn_after"]
+    expected_status_code = main(argv=argv)
+    expected_output = capsys.readouterr().out
+    assert main(argv=[*argv, "--jobs", "2"]) == expected_status_code
+    assert capsys.readouterr().out == expected_output
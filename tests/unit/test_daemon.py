@@ -0,0 +1,115 @@
+import os
+import socketserver
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pre_commit_dbt.check_model_has_tests import main as check_main
+from pre_commit_dbt.daemon import DaemonHandler
+from pre_commit_dbt.daemon import handle_request
+from pre_commit_dbt.daemon import main
+from pre_commit_dbt.daemon import request_daemon
+
+
+@pytest.fixture(scope="function")
+def daemon(tmpdir):
+    socket_path = str(tmpdir.join("d.sock"))
+    server = socketserver.UnixStreamServer(socket_path, DaemonHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    with patch.dict(os.environ, {"PRE_COMMIT_DBT_SOCKET": socket_path}):
+        yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_handle_request(manifest_path_str):
+    response = handle_request(
+        {
+            "hook": "check-model-has-tests",
+            "argv": ["aa/bb/without_test.sql", "--manifest", manifest_path_str],
+            "cwd": os.getcwd(),
+        }
+    )
+    assert response["status_code"] == 1
+    assert "has only 0 tests, but 1 are required" in response["output"]
+
+
+def test_handle_request_invalid_args():
+    response = handle_request(
+        {"hook": "check-model-has-tests", "argv": ["--bogus"], "cwd": os.getcwd()}
+    )
+    assert response["status_code"] == 2
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {"hook": "check-model-has-tests", "argv": [], "cwd": "/other/project"},
+        {"hook": "unknown-hook", "argv": [], "cwd": os.getcwd()},
+        {"hook": "dbt-run", "argv": [], "cwd": os.getcwd()},
+        {"hook": "unify-column-description", "argv": [], "cwd": os.getcwd()},
+    ],
+)
+def test_handle_request_rejected(request_):
+    assert handle_request(request_) == {"status_code": None}
+
+
+def test_request_daemon(daemon, manifest_path_str, capsys):
+    # the hook is executed by the daemon and does not call the daemon again
+    argv = ["aa/bb/without_test.sql", "--manifest", manifest_path_str]
+    assert request_daemon("check-model-has-tests", argv) == 1
+    assert "has only 0 tests, but 1 are required" in capsys.readouterr().out
+
+
+def test_hook_main_through_daemon(daemon, manifest_path_str):
+    argv = ["aa/bb/without_test.sql", "--manifest", manifest_path_str]
+    with patch("pre_commit_dbt.check_model_has_tests.check_test_cnt") as mock_check:
+        mock_check.return_value = 1
+        assert check_main(argv) == 1
+    # called once by the daemon, the client did not fall back
+    mock_check.assert_called_once()
+
+
+def test_hook_uses_daemon(daemon, manifest_path_str):
+    argv = ["aa/bb/with_test1.sql", "--manifest", manifest_path_str]
+    with patch("pre_commit_dbt.daemon.request_daemon") as mock_request:
+        mock_request.return_value = 0
+        assert check_main(argv) == 0
+    mock_request.assert_called_once_with("check-model-has-tests", argv)
+
+
+def test_request_daemon_rejected(daemon):
+    assert request_daemon("unknown-hook", []) is None
+
+
+def test_request_daemon_without_daemon(tmpdir):
+    socket_path = str(tmpdir.join("missing.sock"))
+    with patch.dict(os.environ, {"PRE_COMMIT_DBT_SOCKET": socket_path}):
+        assert request_daemon("check-model-has-tests", []) is None
+
+
+def test_request_daemon_stale_socket(tmpdir):
+    socket_path = tmpdir.join("stale.sock")
+    socket_path.write("")
+    with patch.dict(os.environ, {"PRE_COMMIT_DBT_SOCKET": str(socket_path)}):
+        assert request_daemon("check-model-has-tests", []) is None
+
+
+def test_serve(tmpdir, manifest_path_str):
+    socket_path = str(tmpdir.join("d.sock"))
+    with patch("pre_commit_dbt.daemon.socketserver.UnixStreamServer") as mock_srv:
+        status_code = main(
+            [
+                "--socket",
+                socket_path,
+                "--manifest",
+                manifest_path_str,
+                "--catalog",
+                str(tmpdir.join("missing.json")),
+            ]
+        )
+    assert status_code == 0
+    mock_srv.return_value.__enter__.return_value.serve_forever.assert_called_once()
@@ -8,10 +8,7 @@ from pre_commit_dbt.dbt_compile import prepare_cmd
 
 def test_dbt_compile():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 0
         result = main(("test",))
         assert result == 0
@@ -19,10 +16,7 @@ def test_dbt_compile():
 
 def test_dbt_compile_error():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            "stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 1
         result = main(("test",))
         assert result == 1
@@ -6,23 +6,17 @@ from pre_commit_dbt.dbt_deps import prepare_cmd
 
 def test_dbt_deps():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 0
-        result = main()
+        result = main(argv=[])
         assert result == 0
 
 
 def test_dbt_deps_error():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 1
-        result = main()
+        result = main(argv=[])
         assert result == 1
 
 
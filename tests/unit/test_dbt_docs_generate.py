@@ -6,10 +6,7 @@ from pre_commit_dbt.dbt_docs_generate import main
 
 def test_dbt_docs_generate():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 0
         result = main(argv=[])
         assert result == 0
@@ -17,10 +14,7 @@ def test_dbt_docs_generate():
 
 def test_dbt_docs_generate_error():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 1
         result = main(argv=[])
         assert result == 1
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch
 
 import pytest
@@ -8,10 +9,7 @@ from pre_commit_dbt.dbt_run import prepare_cmd
 
 def test_dbt_run():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 0
         result = main(("test",))
         assert result == 0
@@ -19,10 +17,7 @@ def test_dbt_run():
 
 def test_dbt_run_error():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 1
         result = main(("test",))
         assert result == 1
@@ -72,3 +67,89 @@ def test_dbt_run_error():
 def test_dbt_run_cmd(files, global_flags, cmd_flags, models, expected):
     result = prepare_cmd(files, global_flags, cmd_flags, models=models)
     assert result == expected
+
+
+def test_dbt_run_impact(manifest_path_str, capsys):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
+        mock_popen.return_value.returncode = 0
+        argv = ["aa/bb/parent_child.sql", "aa/bb/ref1.sql", "README.md"]
+        options = ["--model-postfix", "+", "--manifest", manifest_path_str]
+        assert main([*argv, "--impact", *options]) == 0
+        assert mock_popen.call_args[0][0] == ("dbt", "run", "-m", "ref1+")
+        mock_popen.reset_mock()
+        assert main(["README.md", "--impact", *options]) == 0
+        mock_popen.assert_not_called()
+        assert "No dbt nodes are affected" in capsys.readouterr().out
+
+
+def test_dbt_run_impact_no_manifest(tmpdir):
+    manifest = str(tmpdir.join("missing.json"))
+    assert main(["aa/bb/ref1.sql", "--impact", "--manifest", manifest]) == 1
+
+
+def test_dbt_run_state(manifest_path_str, manifest, tmpdir, capsys):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
+        mock_popen.return_value.returncode = 0
+        options = ["--manifest", manifest_path_str, "--model-postfix", "+"]
+        assert main(["--state", manifest_path_str, *options]) == 0
+        mock_popen.assert_not_called()
+        assert "No dbt nodes are modified" in capsys.readouterr().out
+        state = tmpdir.join("state.json")
+        nodes = {k: v for k, v in manifest["nodes"].items() if k != "model.ref1"}
+        state.write(json.dumps({**manifest, "nodes": nodes}))
+        assert main(["aa/bb/ref2.sql", "--state", str(state), *options]) == 0
+        assert mock_popen.call_args[0][0] == ("dbt", "run", "-m", "ref1+")
+
+
+def test_dbt_run_state_no_manifest(tmpdir):
+    state = str(tmpdir.join("missing.json"))
+    assert main(["aa/bb/ref1.sql", "--state", state]) == 1
+
+
+def test_dbt_run_chunks(manifest_path_str):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = []
+        mock_popen.return_value.returncode = 0
+        argv = ["aa/parent_child.sql", "aa/ref1.sql", "aa/ref2.sql"]
+        options = ["--chunk-size", "2", "--manifest", manifest_path_str]
+        assert main([*argv, *options]) == 0
+        # parent_child depends on ref1, chunks are in the order of the DAG
+        assert [call[0][0] for call in mock_popen.call_args_list] == [
+            ("dbt", "run", "-m", "ref1", "ref2"),
+            ("dbt", "run", "-m", "parent_child"),
+        ]
+
+
+def test_dbt_run_chunks_without_dag(manifest_path_str, capsys):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = []
+        mock_popen.return_value.returncode = 0
+        argv = ["aa/a.sql", "aa/b.sql", "aa/c.sql", "--chunk-size", "2"]
+        assert main([*argv, "--manifest", manifest_path_str]) == 0
+        assert [call[0][0] for call in mock_popen.call_args_list] == [
+            ("dbt", "run", "-m", "a", "b", "c"),
+        ]
+    assert "Running the models in one command" in capsys.readouterr().out
+
+
+def test_dbt_run_chunks_concurrent(manifest_path_str):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = []
+        mock_popen.return_value.returncode = 0
+        argv = ["aa/parent_child.sql", "aa/ref1.sql", "aa/ref2.sql"]
+        options = ["--chunk-size", "1", "--chunk-jobs", "2"]
+        assert main([*argv, *options, "--manifest", manifest_path_str]) == 0
+        cmds = [call[0][0] for call in mock_popen.call_args_list]
+        # parent_child depends on ref1
+        assert sorted(cmds[:2]) == [
+            ("dbt", "run", "-m", "ref1"),
+            ("dbt", "run", "-m", "ref2"),
+        ]
+        assert cmds[2] == ("dbt", "run", "-m", "parent_child")
+        mock_popen.reset_mock()
+        # selectors with graph operators are not split
+        assert main([*argv, *options, "--model-postfix", "+"]) == 0
+        cmds = [call[0][0] for call in mock_popen.call_args_list]
+        assert cmds == [("dbt", "run", "-m", "parent_child+", "ref1+", "ref2+")]
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch
 
 import pytest
@@ -8,10 +9,7 @@ from pre_commit_dbt.dbt_test import prepare_cmd
 
 def test_dbt_test():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 0
         result = main(("test",))
         assert result == 0
@@ -19,10 +17,7 @@ def test_dbt_test():
 
 def test_dbt_test_error():
     with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
-        mock_popen.return_value.communicate.return_value = (
-            b"stdout",
-            b"stderr",
-        )
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
         mock_popen.return_value.returncode = 1
         result = main(("test",))
         assert result == 1
@@ -72,3 +67,55 @@ def test_dbt_test_error():
 def test_dbt_test_cmd(files, global_flags, cmd_flags, models, expected):
     result = prepare_cmd(files, global_flags, cmd_flags, models=models)
     assert result == expected
+
+
+def test_dbt_test_impact(manifest_path_str, capsys):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
+        mock_popen.return_value.returncode = 0
+        argv = ["aa/bb/parent_child.sql", "aa/bb/ref1.sql", "README.md"]
+        options = ["--model-postfix", "+", "--manifest", manifest_path_str]
+        assert main([*argv, "--impact", *options]) == 0
+        assert mock_popen.call_args[0][0] == ("dbt", "test", "-m", "ref1+")
+        mock_popen.reset_mock()
+        assert main(["README.md", "--impact", *options]) == 0
+        mock_popen.assert_not_called()
+        assert "No dbt nodes are affected" in capsys.readouterr().out
+
+
+def test_dbt_test_impact_no_manifest(tmpdir):
+    manifest = str(tmpdir.join("missing.json"))
+    assert main(["aa/bb/ref1.sql", "--impact", "--manifest", manifest]) == 1
+
+
+def test_dbt_test_state(manifest_path_str, manifest, tmpdir, capsys):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = [b"stdout\n", b"stderr\n"]
+        mock_popen.return_value.returncode = 0
+        options = ["--manifest", manifest_path_str, "--model-postfix", "+"]
+        assert main(["--state", manifest_path_str, *options]) == 0
+        mock_popen.assert_not_called()
+        assert "No dbt nodes are modified" in capsys.readouterr().out
+        state = tmpdir.join("state.json")
+        nodes = {k: v for k, v in manifest["nodes"].items() if k != "model.ref1"}
+        state.write(json.dumps({**manifest, "nodes": nodes}))
+        assert main(["aa/bb/ref2.sql", "--state", str(state), *options]) == 0
+        assert mock_popen.call_args[0][0] == ("dbt", "test", "-m", "ref1+")
+
+
+def test_dbt_test_state_no_manifest(tmpdir):
+    state = str(tmpdir.join("missing.json"))
+    assert main(["aa/bb/ref1.sql", "--state", state]) == 1
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_dbt_test_chunks(jobs):
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = []
+        mock_popen.return_value.returncode = 0
+        argv = ["aa/a.sql", "aa/b.sql", "aa/c.sql", "--chunk-size", "2"]
+        assert main([*argv, "--chunk-jobs", jobs]) == 0
+        assert sorted(call[0][0] for call in mock_popen.call_args_list) == [
+            ("dbt", "test", "-m", "a", "b"),
+            ("dbt", "test", "-m", "c"),
+        ]
@@ -0,0 +1,186 @@
+import copy
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pre_commit_dbt.cli import main as cli_main
+from pre_commit_dbt.diff_manifest import get_fingerprints
+from pre_commit_dbt.diff_manifest import get_modified_nodes
+from pre_commit_dbt.diff_manifest import load_fingerprints
+from pre_commit_dbt.diff_manifest import main
+from pre_commit_dbt.slim_manifest import main as slim_manifest_main
+from pre_commit_dbt.utils import clear_json_documents
+from pre_commit_dbt.utils import get_full_manifest_path
+from pre_commit_dbt.utils import get_slim_manifest_path
+
+STATE = {
+    "nodes": {
+        "model.p.stg_a": {
+            "name": "stg_a",
+            "checksum": {"name": "sha256", "checksum": "a1"},
+            "config": {"materialized": "view", "schema": "prod_staging"},
+            "unrendered_config": {"materialized": "view"},
+            "description": "",
+            "columns": {},
+            "depends_on": {"macros": []},
+        },
+        "model.p.int_b": {
+            "name": "int_b",
+            "checksum": {"name": "sha256", "checksum": "b1"},
+            "unrendered_config": {"materialized": "table"},
+            "depends_on": {"macros": ["macro.p.cents"]},
+        },
+        "model.p.mart_c": {
+            "name": "mart_c",
+            "checksum": {"name": "sha256", "checksum": "c1"},
+            "unrendered_config": {},
+            "depends_on": {"macros": []},
+        },
+        "operation.p.p-on-run-start-0": {
+            "name": "p-on-run-start-0",
+            "checksum": {"name": "sha256", "checksum": "o1"},
+        },
+    },
+    "sources": {
+        "source.p.raw.s1": {
+            "source_name": "raw",
+            "name": "s1",
+            "description": "",
+            "loaded_at_field": None,
+        },
+    },
+    "macros": {
+        "macro.p.cents": {
+            "macro_sql": "{{ round_to(x) }} / 100",
+            "depends_on": {"macros": ["macro.p.round_to"]},
+        },
+        "macro.p.round_to": {"macro_sql": "round(x, 2)", "depends_on": {}},
+    },
+    "parent_map": {
+        "model.p.stg_a": ["source.p.raw.s1"],
+        "model.p.int_b": ["model.p.stg_a"],
+        "model.p.mart_c": ["model.p.int_b"],
+    },
+    "child_map": {
+        "source.p.raw.s1": ["model.p.stg_a"],
+        "model.p.stg_a": ["model.p.int_b"],
+        "model.p.int_b": ["model.p.mart_c"],
+        "model.p.mart_c": [],
+    },
+}
+
+
+def modified_manifest():
+    manifest = copy.deepcopy(STATE)
+    # other target, same unrendered config
+    manifest["nodes"]["model.p.stg_a"]["config"]["schema"] = "dev_staging"
+    manifest["nodes"]["operation.p.p-on-run-start-0"]["checksum"]["checksum"] = "o2"
+    return manifest
+
+
+def test_get_modified_nodes_unchanged():
+    assert get_modified_nodes(modified_manifest(), STATE) == []
+
+
+@pytest.mark.parametrize(
+    ("change", "expected"),
+    [
+        (
+            lambda m: m["nodes"]["model.p.mart_c"]["checksum"].update(checksum="c2"),
+            ["model.p.mart_c"],
+        ),
+        (
+            lambda m: m["nodes"]["model.p.stg_a"]["unrendered_config"].update(
+                materialized="table"
+            ),
+            ["model.p.stg_a"],
+        ),
+        (
+            lambda m: m["nodes"]["model.p.stg_a"].update(description="Staging"),
+            ["model.p.stg_a"],
+        ),
+        (
+            lambda m: m["macros"]["macro.p.round_to"].update(macro_sql="round(x)"),
+            ["model.p.int_b"],
+        ),
+        (
+            lambda m: m["sources"]["source.p.raw.s1"].update(loaded_at_field="ts"),
+            ["source.p.raw.s1"],
+        ),
+        (
+            lambda m: m["nodes"].update(
+                {"model.p.new": {"name": "new", "depends_on": {"macros": []}}}
+            ),
+            ["model.p.new"],
+        ),
+        (lambda m: m["nodes"].pop("model.p.mart_c"), []),
+    ],
+)
+def test_get_modified_nodes(change, expected):
+    manifest = modified_manifest()
+    change(manifest)
+    assert get_modified_nodes(manifest, STATE) == expected
+
+
+@pytest.fixture
+def manifests(tmpdir):
+    manifest = modified_manifest()
+    manifest["nodes"]["model.p.stg_a"]["checksum"]["checksum"] = "a2"
+    manifest["sources"]["source.p.raw.s1"]["description"] = "Raw table"
+    target = tmpdir.mkdir("target")
+    manifest_path = target.join("manifest.json")
+    manifest_path.write(json.dumps(manifest))
+    state_path = tmpdir.mkdir("prod").join("manifest.json")
+    state_path.write(json.dumps(STATE))
+    yield str(manifest_path), str(state_path)
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        ([], "stg_a\nsource:raw.s1\n"),
+        (["--model-postfix", "+"], "source:raw.s1+\n"),
+        (["--model-prefix", "+"], "+stg_a\n"),
+    ],
+)
+def test_diff_manifest(manifests, options, expected, capsys):
+    manifest_path, state_path = manifests
+    argv = ["--manifest", manifest_path, "--state", state_path, *options]
+    assert main(argv) == 0
+    assert capsys.readouterr().out == expected
+
+
+def test_diff_manifest_slim_manifest(manifests, capsys):
+    manifest_path, state_path = manifests
+    slim_manifest_main(["--manifest", manifest_path])
+    capsys.readouterr()
+    slim_path = str(get_slim_manifest_path(manifest_path))
+    assert get_full_manifest_path(slim_path) == manifest_path
+    assert get_full_manifest_path(manifest_path) == manifest_path
+    assert main(["--manifest", slim_path, "--state", state_path]) == 0
+    assert capsys.readouterr().out == "stg_a\nsource:raw.s1\n"
+
+
+def test_diff_manifest_no_state(manifests, tmpdir, capsys):
+    manifest_path, _ = manifests
+    state_path = str(tmpdir.join("missing.json"))
+    assert main(["--manifest", manifest_path, "--state", state_path]) == 1
+    assert "Unable to load manifest file" in capsys.readouterr().out
+
+
+def test_cli_diff_manifest(manifests, capsys):
+    manifest_path, state_path = manifests
+    argv = ["diff-manifest", "--manifest", manifest_path, "--state", state_path]
+    assert cli_main(argv) == 0
+    assert capsys.readouterr().out == "stg_a\nsource:raw.s1\n"
+
+
+def test_load_fingerprints_cached(manifests):
+    _, state_path = manifests
+    fingerprints = load_fingerprints(state_path)
+    assert fingerprints == get_fingerprints(STATE)
+    clear_json_documents()
+    with patch("pre_commit_dbt.diff_manifest.get_fingerprints") as mock_fingerprints:
+        assert load_fingerprints(state_path) == fingerprints
+        mock_fingerprints.assert_not_called()
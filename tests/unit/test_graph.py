@@ -0,0 +1,64 @@
+from pre_commit_dbt.graph import build_graph
+from pre_commit_dbt.utils import get_manifest_graph
+
+MANIFEST = {
+    "parent_map": {
+        "model.a": ["source.s.t"],
+        "model.b": ["model.a", "source.s.t"],
+        "test.t1": ["model.b"],
+        "source.s.t": [],
+    },
+    "child_map": {
+        "source.s.t": ["model.a", "model.b"],
+        "model.a": ["model.b"],
+        "model.b": ["test.t1", "exposure.e"],
+        "test.t1": [],
+    },
+}
+
+
+def test_build_graph():
+    graph = build_graph(MANIFEST)
+    assert graph.node_ids == [
+        "model.a",
+        "model.b",
+        "test.t1",
+        "source.s.t",
+        "exposure.e",
+    ]
+    assert len(graph) == 5
+    assert graph.get("model.missing") is None
+    b = graph.get("model.b")
+    assert graph.node_type(b) == "model"
+    assert graph.node_type(graph.get("exposure.e")) == "exposure"
+    assert [graph.node_ids[node] for node in graph.parents.neighbors(b)] == [
+        "model.a",
+        "source.s.t",
+    ]
+    assert [graph.node_ids[node] for node in graph.children.neighbors(b)] == [
+        "test.t1",
+        "exposure.e",
+    ]
+    assert graph.in_degree(b) == 2
+    assert graph.out_degree(b) == 2
+    assert graph.in_degree(graph.get("exposure.e")) == 0
+    assert graph.out_degree(graph.get("exposure.e")) == 0
+
+
+def test_graph_of_types():
+    graph = build_graph(MANIFEST)
+    assert graph.parents_of("model.b", ["source"]) == [graph.get("source.s.t")]
+    assert graph.children_of("model.b", ["test", "macro"]) == [graph.get("test.t1")]
+    assert graph.children_of("model.missing", ["model"]) == []
+    assert graph.parents_of("exposure.e", ["model"]) == []
+
+
+def test_build_graph_empty():
+    graph = build_graph({})
+    assert len(graph) == 0
+    assert graph.parents_of("model.a", ["model"]) == []
+
+
+def test_get_manifest_graph_cached():
+    manifest = dict(MANIFEST)
+    assert get_manifest_graph(manifest) is get_manifest_graph(manifest)
@@ -0,0 +1,147 @@
+import pytest
+
+from pre_commit_dbt.impact import get_changed_nodes
+from pre_commit_dbt.impact import get_impact_selection
+from pre_commit_dbt.impact import get_run_waves
+
+MANIFEST = {
+    "nodes": {
+        "model.p.stg_a": {"name": "stg_a", "depends_on": {"macros": []}},
+        "model.p.stg_b": {
+            "name": "stg_b",
+            "depends_on": {"macros": ["macro.p.cents_to_dollars"]},
+        },
+        "model.p.int_c": {"name": "int_c", "depends_on": {"macros": []}},
+        "model.p.mart_d": {"name": "mart_d", "depends_on": {"macros": []}},
+        "seed.p.codes": {"name": "codes", "depends_on": {"macros": []}},
+        "test.p.not_null_stg_a_id": {
+            "name": "not_null_stg_a_id",
+            "depends_on": {"macros": ["macro.dbt.test_not_null"]},
+        },
+    },
+    "sources": {
+        "source.p.raw.s1": {"source_name": "raw", "name": "s1"},
+        "source.p.raw.s2": {"source_name": "raw", "name": "s2"},
+    },
+    "macros": {
+        "macro.p.cents_to_dollars": {"path": "macros/cents_to_dollars.sql"},
+        "macro.dbt.test_not_null": {"path": "macros/schema_tests/not_null.sql"},
+    },
+    "parent_map": {
+        "model.p.stg_a": ["source.p.raw.s1"],
+        "model.p.stg_b": ["source.p.raw.s2", "seed.p.codes"],
+        "model.p.int_c": ["model.p.stg_a", "model.p.stg_b"],
+        "model.p.mart_d": ["model.p.int_c"],
+        "test.p.not_null_stg_a_id": ["model.p.stg_a"],
+    },
+    "child_map": {
+        "source.p.raw.s1": ["model.p.stg_a"],
+        "source.p.raw.s2": ["model.p.stg_b"],
+        "seed.p.codes": ["model.p.stg_b"],
+        "model.p.stg_a": ["model.p.int_c", "test.p.not_null_stg_a_id"],
+        "model.p.stg_b": ["model.p.int_c"],
+        "model.p.int_c": ["model.p.mart_d"],
+        "model.p.mart_d": [],
+    },
+}
+
+PROPERTIES = """version: 2
+models:
+- name: int_c
+  tests:
+  - unique
+sources:
+- name: raw
+  tables:
+  - name: s2
+"""
+
+
+@pytest.fixture
+def properties_file(tmpdir):
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(PROPERTIES)
+    return str(yml_file)
+
+
+def test_get_changed_nodes(properties_file):
+    paths = [
+        "models/mart_d.sql",
+        "models/stg_a.sql",
+        "seeds/codes.csv",
+        "macros/cents_to_dollars.sql",
+        "README.md",
+        properties_file,
+    ]
+    assert get_changed_nodes(paths, MANIFEST) == [
+        "model.p.stg_a",
+        "model.p.stg_b",
+        "model.p.int_c",
+        "model.p.mart_d",
+        "seed.p.codes",
+        "source.p.raw.s2",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("paths", "command", "prefix", "postfix", "expected"),
+    [
+        (["models/int_c.sql", "models/stg_a.sql"], "run", "", "", ["stg_a", "int_c"]),
+        (["models/int_c.sql", "models/stg_a.sql"], "run", "", "+", ["stg_a+"]),
+        (["models/int_c.sql", "models/stg_a.sql"], "run", "+", "", ["+int_c"]),
+        (
+            ["models/int_c.sql", "models/stg_a.sql"],
+            "run",
+            "+",
+            "+",
+            ["+stg_a+", "+int_c+"],
+        ),
+        (["models/mart_d.sql", "models/stg_b.sql"], "run", "", "+", ["stg_b+"]),
+        (["README.md"], "run", "", "", []),
+        (
+            ["macros/schema_tests/not_null.sql"],
+            "test",
+            "",
+            "",
+            ["not_null_stg_a_id"],
+        ),
+        (["macros/schema_tests/not_null.sql"], "run", "", "", []),
+        (["seeds/codes.csv"], "run", "", "", ["stg_b"]),
+        (["seeds/codes.csv"], "run", "", "+", ["stg_b+"]),
+        (["seeds/codes.csv"], "test", "", "", ["codes"]),
+    ],
+)
+def test_get_impact_selection(paths, command, prefix, postfix, expected):
+    assert get_impact_selection(paths, MANIFEST, command, prefix, postfix) == expected
+
+
+def test_get_impact_selection_sources(properties_file):
+    assert get_impact_selection([properties_file], MANIFEST, "run") == [
+        "stg_b",
+        "int_c",
+    ]
+    assert get_impact_selection([properties_file], MANIFEST, "run", postfix="+") == [
+        "stg_b+"
+    ]
+    assert get_impact_selection([properties_file], MANIFEST, "test") == [
+        "int_c",
+        "source:raw.s2",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("selectors", "expected"),
+    [
+        (
+            ["mart_d", "stg_a", "int_c", "stg_b"],
+            [["stg_a", "stg_b"], ["int_c"], ["mart_d"]],
+        ),
+        ([], []),
+        (["codes"], None),
+        (["stg_a+"], None),
+        (["not_null_stg_a_id"], None),
+        (["missing"], None),
+    ],
+)
+def test_get_run_waves(selectors, expected):
+    assert get_run_waves(selectors, MANIFEST) == expected
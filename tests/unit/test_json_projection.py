@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from pre_commit_dbt.json_projection import loads_projection
+from pre_commit_dbt.json_projection import skip_value
+from pre_commit_dbt.utils import clear_json_documents
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import MODEL_TESTS_PROJECTION
+
+DOCUMENT = {
+    "metadata": {"dbt_version": "0.19.1", "generated_at": None},
+    "nodes": {
+        "model.aa.bb": {
+            "name": "bb",
+            "raw_sql": 'select "a\\"b", \'{[}]\' from {{ ref("cc") }}\n',
+            "tags": ["a", "b"],
+            "config": {"enabled": True, "n": -1.5e3, "nested": [[], {}, [{}]]},
+            "description": "unicode é中 \\u0041 {",
+        },
+        "test.aa.cc": {"name": "cc", "tags": [], "test_metadata": {"name": "x"}},
+        "seed.aa.dd": {},
+    },
+    "docs": {"doc.aa.ee": {"block_contents": '}}]]""' * 100}},
+    "child_map": {"model.aa.bb": ["test.aa.cc"]},
+    "disabled": [],
+    "empty": {},
+}
+
+
+def project(document, projection):
+    result = {}
+    for section, fields in projection.items():
+        if section not in document:
+            continue
+        value = document[section]
+        if fields is not None and isinstance(value, dict):
+            value = {
+                key: {f: v for f, v in entry.items() if f in fields}
+                if isinstance(entry, dict)
+                else entry
+                for key, entry in value.items()
+            }
+        result[section] = value
+    return result
+
+
+@pytest.mark.parametrize(
+    "projection",
+    [
+        {"nodes": ["name"]},
+        {"nodes": ["name", "tags", "config"], "child_map": None},
+        {"nodes": None, "docs": None, "metadata": ["dbt_version"]},
+        {"nodes": ["raw_sql", "description"], "disabled": ["name"]},
+        {"empty": ["name"], "missing": None},
+        MODEL_TESTS_PROJECTION,
+    ],
+)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_loads_projection(projection, indent):
+    text = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False)
+    assert loads_projection(text, projection) == project(DOCUMENT, projection)
+
+
+def test_loads_projection_manifest(manifest):
+    text = json.dumps(manifest)
+    assert loads_projection(text, MODEL_TESTS_PROJECTION) == project(
+        manifest, MODEL_TESTS_PROJECTION
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"nodes": {"a": 1',
+        '{"a": "b',
+        '{"a": [1, 2',
+        '{"a": {"b": "c}',
+        '{"a": xx}',
+        '{"a" 1}',
+        "{1: 2}",
+    ],
+)
+def test_loads_projection_invalid(text):
+    with pytest.raises(ValueError):
+        loads_projection(text, {"nodes": ["name"]})
+
+
+def test_loads_projection_extra_data():
+    with pytest.raises(ValueError):
+        loads_projection('{"a": 1} {}', {"a": None})
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ('"a\\"b" ', 6),
+        ("[1, [2], {}] ", 12),
+        ('{"a": "]}"} ', 11),
+        ("-1.5e3,", 6),
+        ("null]", 4),
+    ],
+)
+def test_skip_value(text, expected):
+    assert skip_value(text, 0) == expected
+
+
+def test_get_json_projection(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write(json.dumps(DOCUMENT))
+    projection = {"nodes": ["name"]}
+    expected = project(DOCUMENT, projection)
+    assert get_json(str(file), projection=projection) == expected
+    # from the disk cache
+    clear_json_documents()
+    assert get_json(str(file), projection=projection) == expected
+    assert get_json(str(file), use_cache=False, projection=projection) == expected
+    # a fully loaded document satisfies any projection
+    full = get_json(str(file))
+    assert get_json(str(file), projection={"docs": None}) is full
@@ -0,0 +1,97 @@
+from pre_commit_dbt.graph import build_graph
+from pre_commit_dbt.lineage import Lineage
+
+PARENT_MAP = {
+    "source.p.raw.s1": [],
+    "source.p.raw.s2": [],
+    "model.p.stg_a": ["source.p.raw.s1"],
+    "model.p.stg_b": ["source.p.raw.s2", "source.p.raw.s1"],
+    "model.p.int_c": ["model.p.stg_a", "model.p.stg_b"],
+    "model.p.mart_d": ["model.p.stg_a", "model.p.int_c"],
+    "test.p.not_null_mart_d": ["model.p.mart_d"],
+}
+
+
+def get_child_map(parent_map):
+    child_map = {node_id: [] for node_id in parent_map}
+    for node_id, parents in parent_map.items():
+        for parent in parents:
+            child_map[parent].append(node_id)
+    return child_map
+
+
+def get_lineage(parent_map=PARENT_MAP):
+    graph = build_graph(
+        {"parent_map": parent_map, "child_map": get_child_map(parent_map)}
+    )
+    return graph, Lineage(graph)
+
+
+def names(graph, nodes):
+    return {graph.node_ids[node] for node in nodes}
+
+
+def test_ancestors():
+    graph, lineage = get_lineage()
+    mart = graph.get("model.p.mart_d")
+    assert names(graph, lineage.nodes(lineage.ancestors(mart))) == {
+        "source.p.raw.s1",
+        "source.p.raw.s2",
+        "model.p.stg_a",
+        "model.p.stg_b",
+        "model.p.int_c",
+    }
+    sources = lineage.ancestors(mart, ["source"])
+    assert lineage.count(sources) == 2
+    assert names(graph, lineage.nodes(sources, ["source"])) == {
+        "source.p.raw.s1",
+        "source.p.raw.s2",
+    }
+    assert lineage.ancestors(graph.get("source.p.raw.s1")) == 0
+
+
+def test_descendants():
+    graph, lineage = get_lineage()
+    s2 = graph.get("source.p.raw.s2")
+    models = lineage.descendants(s2, ["model"])
+    assert names(graph, lineage.nodes(models, ["model"])) == {
+        "model.p.stg_b",
+        "model.p.int_c",
+        "model.p.mart_d",
+    }
+    assert lineage.count(lineage.descendants(s2)) == 4
+
+
+def test_depth():
+    graph, lineage = get_lineage()
+    assert lineage.depth(graph.get("source.p.raw.s1")) == 0
+    assert lineage.depth(graph.get("model.p.stg_a")) == 1
+    assert lineage.depth(graph.get("model.p.mart_d")) == 3
+    assert lineage.depth(graph.get("test.p.not_null_mart_d")) == 4
+    assert [
+        graph.node_ids[node]
+        for node in lineage.upstream_path(graph.get("model.p.mart_d"))
+    ] == ["source.p.raw.s1", "model.p.stg_a", "model.p.int_c", "model.p.mart_d"]
+
+
+def test_long_chain():
+    # deeper than the recursion limit
+    parent_map = {"model.p.m0": []}
+    for i in range(1, 5000):
+        parent_map[f"model.p.m{i}"] = [f"model.p.m{i - 1}"]
+    graph, lineage = get_lineage(parent_map)
+    last = graph.get("model.p.m4999")
+    assert lineage.depth(last) == 4999
+    assert lineage.count(lineage.ancestors(last)) == 4999
+    assert lineage.count(lineage.descendants(graph.get("model.p.m0"))) == 4999
+
+
+def test_cycle():
+    parent_map = {"model.p.a": ["model.p.b"], "model.p.b": ["model.p.a"]}
+    graph, lineage = get_lineage(parent_map)
+    a = graph.get("model.p.a")
+    assert names(graph, lineage.nodes(lineage.ancestors(a))) == {
+        "model.p.a",
+        "model.p.b",
+    }
+    assert lineage.depth(a) == 1
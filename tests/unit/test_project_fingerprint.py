@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pre_commit_dbt.dbt_compile import main as dbt_compile
+from pre_commit_dbt.dbt_deps import main as dbt_deps
+from pre_commit_dbt.dbt_docs_generate import main as dbt_docs_generate
+from pre_commit_dbt.project_fingerprint import get_fingerprint
+from pre_commit_dbt.project_fingerprint import get_fingerprints_path
+from pre_commit_dbt.project_fingerprint import get_packages_outputs
+from pre_commit_dbt.project_fingerprint import get_project_inputs
+from pre_commit_dbt.project_fingerprint import run_dbt_cmd_if_changed
+
+
+@pytest.fixture
+def project(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setenv("DBT_PROFILES_DIR", str(tmpdir))
+    tmpdir.join("dbt_project.yml").write(
+        "name: p\nmodel-paths: ['sql']\npackages-install-path: pkgs\n"
+    )
+    tmpdir.join("profiles.yml").write("p: {}\n")
+    tmpdir.mkdir("sql").mkdir("staging").join("stg_a.sql").write("select 1")
+    tmpdir.mkdir("macros").join("cents.sql").write("{% macro cents() %}{% endmacro %}")
+    tmpdir.mkdir("models").join("unused.sql").write("select 2")
+    yield Path(".")
+
+
+def test_get_project_inputs(project):
+    inputs = [str(path) for path in get_project_inputs(project)]
+    assert os.path.join("sql", "staging", "stg_a.sql") in inputs
+    assert os.path.join("macros", "cents.sql") in inputs
+    assert os.path.join("models", "unused.sql") not in inputs
+    assert "dbt_project.yml" in inputs
+    assert get_packages_outputs(project) == [Path("pkgs")]
+
+
+def test_get_fingerprint(project, monkeypatch):
+    cmd = ["dbt", "compile"]
+    fingerprint = get_fingerprint(cmd, get_project_inputs(project))
+    assert get_fingerprint(cmd, get_project_inputs(project)) == fingerprint
+    assert get_fingerprint([*cmd, "-t", "prod"], get_project_inputs()) != fingerprint
+    monkeypatch.setenv("DBT_TARGET", "prod")
+    assert get_fingerprint(cmd, get_project_inputs(project)) != fingerprint
+    monkeypatch.delenv("DBT_TARGET")
+    Path("sql/staging/stg_b.sql").write_text("select 3")
+    assert get_fingerprint(cmd, get_project_inputs(project)) != fingerprint
+
+
+def test_run_dbt_cmd_if_changed(project, capsys):
+    output = project / "target" / "manifest.json"
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = []
+        mock_popen.return_value.returncode = 0
+
+        def run():
+            inputs = get_project_inputs(project)
+            return run_dbt_cmd_if_changed("compile", ["dbt"], inputs, [output])
+
+        assert run() == 0
+        assert mock_popen.call_count == 1
+        assert get_fingerprints_path().exists()
+        # output missing
+        assert run() == 0
+        assert mock_popen.call_count == 2
+        output.write_text("{}")
+        assert run() == 0
+        assert mock_popen.call_count == 2
+        assert "Skipping `dbt`, its inputs did not change." in capsys.readouterr().out
+        # a failed run is not remembered
+        os.utime("sql/staging/stg_a.sql", ns=(0, 0))
+        mock_popen.return_value.returncode = 1
+        assert run() == 1
+        mock_popen.return_value.returncode = 0
+        assert run() == 0
+        assert mock_popen.call_count == 4
+
+
+@pytest.mark.parametrize(
+    ("hook", "output", "cmd"),
+    [
+        (dbt_compile, "target/manifest.json", ("dbt", "compile", "-m", "stg_a")),
+        (dbt_docs_generate, "target/catalog.json", ("dbt", "docs", "generate")),
+        (dbt_deps, "pkgs", ("dbt", "deps")),
+    ],
+)
+def test_hooks_skip_unchanged(project, hook, output, cmd):
+    Path("target").mkdir()
+    Path(output).mkdir()
+    argv = ["--skip-unchanged"]
+    if hook is dbt_compile:
+        argv.append("sql/staging/stg_a.sql")
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = []
+        mock_popen.return_value.returncode = 0
+        assert hook(argv) == 0
+        assert hook(argv) == 0
+        assert mock_popen.call_count == 1
+        assert mock_popen.call_args[0][0] == cmd
+        assert hook(argv[1:]) == 0
+        assert mock_popen.call_count == 2
@@ -0,0 +1,66 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pre_commit_dbt.references import clear_references
+from pre_commit_dbt.references import extract_references
+from pre_commit_dbt.references import get_references
+from pre_commit_dbt.references import Reference
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        ("select * from {{ ref('aa') }}", [Reference("ref", "aa")]),
+        ('select * from {{ref("aa")}}', [Reference("ref", "aa")]),
+        (
+            "{{ ref('aa') }} join {{ ref('bb') }} on {{ source('src', 'cc') }}",
+            [
+                Reference("ref", "aa"),
+                Reference("ref", "bb"),
+                Reference("source", "cc", "src"),
+            ],
+        ),
+        ("{{ ref('package', 'aa') }}", [Reference("ref", "aa", "package")]),
+        ("{{ ref('aa', v=2) }}", [Reference("ref", "aa", version="2")]),
+        ("{{ ref('aa', version='3') }}", [Reference("ref", "aa", version="3")]),
+        (
+            "{{\n  source(\n    'src',\n    'cc'\n  )\n}}",
+            [Reference("source", "cc", "src")],
+        ),
+        ("{% set rel = ref('aa') %}", [Reference("ref", "aa")]),
+        ("{{ ref('aa') | lower }}", [Reference("ref", "aa")]),
+        ("{# {{ ref('aa') }} #}", []),
+        ("{{ ref(var('model')) }}", []),
+        ("{{ ref(my_model) }}", []),
+        ("{{ ref('aa' ~ suffix) }}", []),
+        ("{{ source('src', table_name) }}", []),
+        ("{{ ref('aa', ) }}", [Reference("ref", "aa")]),
+        ("{{ source('src') }}", []),
+        ("{{ config(materialized='table') }}", []),
+        ("select ref('aa') from bb", []),
+        ("{{ ref('aa'", []),
+    ],
+)
+def test_extract_references(sql, expected):
+    assert extract_references(sql) == expected
+
+
+def test_get_references_cached(tmpdir):
+    clear_references()
+    sql = "select * from {{ ref('aa') }}"
+    files = []
+    for name in ("model1.sql", "model2.sql"):
+        file = tmpdir.join(name)
+        file.write(sql)
+        files.append(Path(file))
+    with patch(
+        "pre_commit_dbt.references.extract_references", wraps=extract_references
+    ) as extract:
+        assert get_references(files[0]) == [Reference("ref", "aa")]
+        assert get_references(files[1]) == [Reference("ref", "aa")]
+        extract.assert_called_once()
+        files[1].write_text("select * from {{ ref('bb') }}")
+        assert get_references(files[1]) == [Reference("ref", "bb")]
+        assert extract.call_count == 2
@@ -49,3 +49,21 @@ def test_fix_semicolon_integration(input_s, expected_status_code, output, tmpdir
 
     assert file_output == output
     assert status_code == expected_status_code
+
+
+def test_fix_semicolon_jobs(tmpdir, capsys):
+    paths = []
+    for i, (input_s, _, _) in enumerate(TESTS):
+        path = tmpdir.join(f"file{i}.txt")
+        path.write_binary(input_s)
+        paths.append(path)
+
+    status_code = main([*map(str, paths), "--jobs", "4"])
+
+    assert status_code == 1
+    assert [path.read_binary() for path in paths] == [output for *_, output in TESTS]
+    assert capsys.readouterr().out == "".join(
+        f"Replacing semicolon in {path}.\n"
+        for path, (_, status_code, _) in zip(paths, TESTS)
+        if status_code
+    )
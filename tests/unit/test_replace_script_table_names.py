@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 
+from pre_commit_dbt.replace_script_table_names import get_ref_from_name
 from pre_commit_dbt.replace_script_table_names import get_source_from_name
 from pre_commit_dbt.replace_script_table_names import main
+from pre_commit_dbt.utils import build_manifest_index
 
 
 # Input, expected return value, expected output
@@ -149,3 +153,39 @@ def test_get_source_from_name(manifest):
         ("prod.source1.src3", "{{ source('source1', 'src3') }}"),
         ("dev2.source1.src3", "{{ source('source1', 'src3') }}"),
     ]
+
+
+def test_get_source_from_name_relation(manifest):
+    tables = {"source1.table2", "table1", "source1", "table2.source1", "prod.source1"}
+    result = get_source_from_name(manifest, tables)
+    assert list(result) == [
+        ("table1", "{{ source('source1', 'table1') }}"),
+        ("source1.table2", "{{ source('source1', 'table2') }}"),
+    ]
+    assert tables == {"source1", "table2.source1", "prod.source1"}
+
+
+def test_get_ref_from_name(manifest):
+    tables = {"ff.replaced_model", "aa"}
+    result = get_ref_from_name(manifest, tables)
+    assert list(result) == [("ff.replaced_model", "{{ ref('replaced_model') }}")]
+    assert tables == {"aa"}
+
+
+def test_replace_script_table_names_batch(manifest_path_str, tmpdir):
+    paths = []
+    for i in range(5):
+        path = tmpdir.join(f"file{i}.sql")
+        sql = f"SELECT * FROM replaced_model\nJOIN source1.table{i}\n"
+        path.write_text(sql, "utf-8")
+        paths.append(path)
+    with patch(
+        "pre_commit_dbt.utils.build_manifest_index", wraps=build_manifest_index
+    ) as build:
+        ret = main([*map(str, paths), "--manifest", manifest_path_str])
+    assert ret == 1
+    build.assert_called_once()
+    assert paths[1].read_text("utf-8") == (
+        "SELECT * FROM {{ ref('replaced_model') }}\n"
+        "JOIN {{ source('source1', 'table1') }}\n"
+    )
@@ -0,0 +1,138 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from pre_commit_dbt.cli import main as cli_main
+from pre_commit_dbt.run_hooks import get_hook_filenames
+from pre_commit_dbt.run_hooks import HOOKS
+from pre_commit_dbt.run_hooks import main
+
+
+def write_config(tmpdir, content):
+    config = tmpdir.join(".pre-commit-dbt.yaml")
+    config.write(content)
+    return str(config)
+
+
+@pytest.mark.parametrize(
+    ("files", "test_cnt", "expected_status_code"),
+    [
+        (["aa/bb/with_test1.sql"], 1, 0),
+        (["aa/bb/with_test1.sql"], 3, 1),
+        (["aa/bb/with_test1.yml"], 3, 0),
+    ],
+)
+def test_run_hooks(files, test_cnt, expected_status_code, tmpdir, manifest_path_str):
+    config = write_config(
+        tmpdir,
+        f"""
+hooks:
+- id: check-model-has-tests
+  args: ["--test-cnt", {test_cnt}, "--manifest", "{manifest_path_str}", "--"]
+- id: check-model-parents-and-childs
+  args: ["--manifest", "{manifest_path_str}", "--"]
+    """,
+    )
+    status_code = main(["--config", config, *files])
+    assert status_code == expected_status_code
+
+
+def test_run_hooks_share_manifest(tmpdir, manifest_path_str):
+    config = write_config(
+        tmpdir,
+        f"""
+hooks:
+- id: check-model-has-tests
+  args: ["--manifest", "{manifest_path_str}", "--"]
+- id: check-model-parents-and-childs
+  args: ["--manifest", "{manifest_path_str}", "--"]
+    """,
+    )
+    with patch("pre_commit_dbt.utils._parse_json") as mock_parse:
+        mock_parse.return_value = {}
+        main(["--config", config, "aa/bb/with_test1.sql"])
+    assert mock_parse.call_count == 1
+
+
+def test_run_hooks_unknown_hook(tmpdir, capsys):
+    config = write_config(tmpdir, "hooks:\n- id: unknown-hook\n")
+    assert main(["--config", config, "aa.sql"]) == 1
+    assert "Unknown hook `unknown-hook`" in capsys.readouterr().out
+
+
+def test_run_hooks_missing_config(tmpdir):
+    assert main(["--config", str(tmpdir.join("missing.yaml"))]) == 1
+
+
+def test_run_hooks_without_filenames(tmpdir):
+    config = write_config(tmpdir, "hooks:\n- id: dbt-deps\n")
+    with patch("pre_commit_dbt.dbt_deps.run_dbt_cmd") as mock_run:
+        mock_run.return_value = 0
+        assert main(["--config", config]) == 0
+    mock_run.assert_called_once()
+
+
+def test_run_hooks_hook_error(tmpdir):
+    config = write_config(tmpdir, "hooks:\n- id: check-script-semicolon\n")
+    with patch("pre_commit_dbt.check_script_semicolon.main") as mock_main:
+        mock_main.side_effect = ValueError("boom")
+        assert main(["--config", config, "aa.sql"]) == 1
+
+
+def test_run_hooks_invalid_args(tmpdir, capsys, manifest_path_str):
+    config = write_config(
+        tmpdir,
+        f"""
+hooks:
+- id: check-model-has-tests
+  args: ["--bogus"]
+- id: check-model-has-tests
+  args: ["--manifest", "{manifest_path_str}", "--"]
+    """,
+    )
+    assert main(["--config", config, "aa/bb/with_test1.sql"]) == 2
+    output = capsys.readouterr().out
+    assert "check-model-has-tests: Failed" in output
+    assert "check-model-has-tests: Passed" in output
+
+
+def test_hooks_same_as_pre_commit_hooks():
+    extensions = {
+        "sql": {".sql"},
+        "yaml": {".yml", ".yaml"},
+    }
+    pre_commit_hooks = yaml.safe_load(Path(".pre-commit-hooks.yaml").read_text())
+    for hook in pre_commit_hooks:
+        if hook["entry"].startswith("pre-commit-dbt "):
+            continue
+        if hook.get("pass_filenames") is False:
+            expected = None
+        elif hook.get("files"):
+            expected = extensions["yaml"]
+        else:
+            types = hook.get("types") or hook.get("types_or")
+            expected = set().union(*(extensions[type_] for type_ in types))
+        hook_types = HOOKS[hook["id"]]
+        assert (set(hook_types) if hook_types else None) == expected, hook["id"]
+
+
+@pytest.mark.parametrize(
+    ("hook", "expected"),
+    [
+        ({"id": "check-script-semicolon"}, ["models/aa.sql", "seeds/bb.sql"]),
+        ({"id": "check-source-has-loader"}, ["models/cc.yml"]),
+        ({"id": "check-script-semicolon", "files": "^models"}, ["models/aa.sql"]),
+        ({"id": "check-script-semicolon", "exclude": "^models"}, ["seeds/bb.sql"]),
+        ({"id": "dbt-deps"}, []),
+    ],
+)
+def test_get_hook_filenames(hook, expected):
+    paths = ["models/aa.sql", "seeds/bb.sql", "models/cc.yml", "README.md"]
+    assert get_hook_filenames(hook, paths) == expected
+
+
+def test_cli_run(tmpdir):
+    config = write_config(tmpdir, "hooks: []\n")
+    assert cli_main(["run", "--config", config]) == 0
@@ -0,0 +1,114 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from pre_commit_dbt.dbt_run import main as dbt_run
+from pre_commit_dbt.run_report import format_timing_report
+from pre_commit_dbt.run_report import get_mtime
+from pre_commit_dbt.run_report import load_baseline
+from pre_commit_dbt.run_report import load_run_results
+from pre_commit_dbt.run_report import print_timing_report
+
+RUN_RESULTS = {
+    "results": [
+        {
+            "unique_id": "model.p.stg_a",
+            "status": "success",
+            "execution_time": 2.0,
+            "thread_id": "Thread-1",
+        },
+        {
+            "unique_id": "model.p.int_b",
+            "status": "success",
+            "execution_time": 6.0,
+            "thread_id": "Thread-2",
+        },
+        {
+            "unique_id": "model.p.mart_c",
+            "status": "error",
+            "execution_time": 1.0,
+            "thread_id": "Thread-1",
+        },
+    ],
+    "elapsed_time": 10.0,
+    "args": {"threads": 2},
+}
+
+
+@pytest.fixture
+def run_results_path(tmpdir):
+    run_results = tmpdir.mkdir("target").join("run_results.json")
+    run_results.write(json.dumps(RUN_RESULTS))
+    yield str(run_results)
+
+
+def test_format_timing_report():
+    assert format_timing_report(RUN_RESULTS, slowest=2) == [
+        "Slowest 2 of 3 nodes:",
+        "     6.00s model.p.int_b",
+        "     2.00s model.p.stg_a",
+        "Thread utilization: 45% (2 threads, 10.00s elapsed)",
+    ]
+
+
+def test_format_timing_report_baseline():
+    baseline = {"model.p.stg_a": 2.5, "model.p.int_b": 4.0, "model.p.other": 1.0}
+    assert format_timing_report(RUN_RESULTS, baseline=baseline)[1:] == [
+        "Execution time compared to the baseline (2 nodes):",
+        "     6.00s model.p.int_b (+2.00s, +50%)",
+        "     2.00s model.p.stg_a (-0.50s, -20%)",
+        "1 nodes are not in the baseline.",
+    ]
+
+
+def test_format_timing_report_thread_ids():
+    run_results = {**RUN_RESULTS, "args": {}}
+    assert format_timing_report(run_results) == [
+        "Thread utilization: 45% (2 threads, 10.00s elapsed)"
+    ]
+    assert format_timing_report({"results": []}, slowest=5) == [
+        "Slowest 0 of 0 nodes:"
+    ]
+
+
+def test_load_run_results(run_results_path):
+    assert load_run_results(run_results_path) == RUN_RESULTS
+    mtime = get_mtime(run_results_path)
+    assert load_run_results(run_results_path, previous_mtime=mtime) is None
+    assert load_run_results(run_results_path, previous_mtime=-1) == RUN_RESULTS
+    assert load_run_results(run_results_path + ".missing") is None
+    assert get_mtime(run_results_path + ".missing") == -1
+
+
+def test_print_timing_report_write_baseline(run_results_path, tmpdir, capsys):
+    baseline_path = str(tmpdir.join("timing", "baseline.json"))
+    print_timing_report(run_results_path, 1, baseline_path, write_baseline=True)
+    assert load_baseline(baseline_path) == {"model.p.int_b": 6.0, "model.p.stg_a": 2.0}
+    out = capsys.readouterr().out
+    assert "Execution time compared" not in out
+    assert f"Execution times stored in {baseline_path}." in out
+    print_timing_report(run_results_path, 0, baseline_path)
+    assert "     6.00s model.p.int_b (+0.00s, +0%)" in capsys.readouterr().out
+
+
+def test_print_timing_report_no_run_results(tmpdir, capsys):
+    print_timing_report(str(tmpdir.join("run_results.json")), 3)
+    assert "No timing report" in capsys.readouterr().out
+
+
+def test_dbt_run_timing_report(run_results_path, capsys):
+    def run_dbt(*args, **kwargs):
+        # dbt rewrites run_results.json
+        os.utime(run_results_path, ns=(0, 0))
+        return mock_popen.return_value
+
+    with patch("pre_commit_dbt.utils.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.stdout = []
+        mock_popen.return_value.returncode = 1
+        mock_popen.side_effect = run_dbt
+        argv = ["aa/stg_a.sql", "--report-slowest", "1"]
+        assert dbt_run([*argv, "--run-results", run_results_path]) == 1
+    out = capsys.readouterr().out
+    assert "Slowest 1 of 3 nodes:\n     6.00s model.p.int_b\n" in out
@@ -64,6 +64,15 @@ TESTS = (  # type: ignore
             frozenset({"src", "src4"}): {"source_name": "src", "table_name": "src4"},
         },
     ),
+    (
+        """
+    SELECT * FROM {{ ref(my_model) }} bb
+    JOIN {{ ref('ref' ~ suffix) }} r ON bb.id = r.id
+    """,
+        0,
+        set(),
+        {},
+    ),
 )
 
 TESTS_INTEGRATION = (
@@ -118,6 +127,18 @@ def test_check_script_ref_and_source(
     assert sources == missing_source
 
 
+def test_check_script_ref_and_source_jobs(manifest_path_str, tmpdir):
+    paths = []
+    for i, (input_s, *_) in enumerate(TESTS):
+        path = tmpdir.join(f"file{i}.sql")
+        path.write_text(input_s, "utf-8")
+        paths.append(str(path))
+    manifest = get_json(manifest_path_str)
+    expected = check_refs_sources(paths=paths, manifest=manifest)
+    assert check_refs_sources(paths=paths, manifest=manifest, jobs=4) == expected
+    assert main([*paths, "--manifest", manifest_path_str, "--jobs", "4"]) == 1
+
+
 @pytest.mark.parametrize(
     ("input_s", "expected_status_code", "valid_manifest"), TESTS_INTEGRATION
 )
@@ -0,0 +1,73 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pre_commit_dbt.check_model_has_tests import main as check_model_has_tests
+from pre_commit_dbt.check_model_parents_and_childs import (
+    main as check_model_parents_and_childs,
+)
+from pre_commit_dbt.cli import main as cli_main
+from pre_commit_dbt.slim_manifest import main
+from pre_commit_dbt.slim_manifest import SLIM_MANIFEST_PROJECTION
+from pre_commit_dbt.utils import get_manifest_path
+from pre_commit_dbt.utils import get_slim_manifest_path
+
+
+def test_slim_manifest(manifest_path_str, manifest):
+    assert main(["--manifest", manifest_path_str]) == 0
+    slim_file = get_slim_manifest_path(manifest_path_str)
+    assert slim_file == Path(manifest_path_str).with_name("manifest.slim.json")
+    slim = json.loads(slim_file.read_text())
+    assert set(slim) == set(SLIM_MANIFEST_PROJECTION) & set(manifest)
+    assert slim["child_map"] == manifest["child_map"]
+    for key, node in slim["nodes"].items():
+        assert set(node) <= set(SLIM_MANIFEST_PROJECTION["nodes"])
+        assert node == {
+            field: value
+            for field, value in manifest["nodes"][key].items()
+            if field in SLIM_MANIFEST_PROJECTION["nodes"]
+        }
+
+
+def test_slim_manifest_used(manifest_path_str):
+    assert get_manifest_path(manifest_path_str) == manifest_path_str
+    main(["--manifest", manifest_path_str])
+    slim_path = str(get_slim_manifest_path(manifest_path_str))
+    assert get_manifest_path(manifest_path_str) == slim_path
+    # manifest regenerated by dbt, slim manifest is outdated
+    stat = os.stat(slim_path)
+    os.utime(manifest_path_str, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert get_manifest_path(manifest_path_str) == manifest_path_str
+
+
+@pytest.mark.parametrize(
+    ("hook", "args"),
+    [
+        (check_model_has_tests, ["--test-cnt", "1"]),
+        (check_model_has_tests, ["--test-cnt", "3"]),
+        (check_model_parents_and_childs, ["--min-parent-cnt", "2"]),
+    ],
+)
+def test_slim_manifest_same_result(hook, args, manifest_path_str, capsys):
+    argv = [*args, "--manifest", manifest_path_str, "aa/bb/with_test1.sql"]
+    expected = hook(argv)
+    expected_output = capsys.readouterr().out
+    main(["--manifest", manifest_path_str])
+    capsys.readouterr()
+    assert hook(argv) == expected
+    assert capsys.readouterr().out == expected_output
+
+
+def test_slim_manifest_error(tmpdir, capsys):
+    manifest_path = tmpdir.join("manifest.json")
+    manifest_path.write("{")
+    assert main(["--manifest", str(manifest_path)]) == 1
+    assert "Unable to create slim manifest" in capsys.readouterr().out
+    assert not get_slim_manifest_path(str(manifest_path)).exists()
+
+
+def test_cli_slim_manifest(manifest_path_str):
+    assert cli_main(["slim-manifest", "--manifest", manifest_path_str]) == 0
+    assert get_slim_manifest_path(manifest_path_str).exists()
@@ -0,0 +1,38 @@
+import pytest
+
+from pre_commit_dbt.sql_tokens import tokenize_sql
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        ("", []),
+        ("  SELECT  A ", ["select", "a"]),
+        ("count(a),b", ["count", "(", "a", ")", ",", "b"]),
+        ("a -- from b\nc", ["a", "c"]),
+        ("a--b", ["a"]),
+        ("a /* from\nb */ c", ["a", "c"]),
+        ("a/**/b", ["a", "b"]),
+        ("a {# from b #} c", ["a", "c"]),
+        ("a {% if x %}b{% endif %} c", ["a", "b", "c"]),
+        ("from {{ ref('a b') }}", ["from", "{{ ref('a b') }}"]),
+        ("cte_{{ p }} as", ["cte_{{ p }}", "as"]),
+        ("'from a' b", ["'from a'", "b"]),
+        ("'it''s -- no comment' b", ["'it''s -- no comment'", "b"]),
+        ("'a\\'b' c", ["'a\\'b'", "c"]),
+        ('"My Table"."A"', ['"my table"."a"']),
+        ("`db`.`t`", ["`db`.`t`"]),
+        ("a - b / c {d}", ["a", "-", "b", "/", "c", "{d}"]),
+        ("a /* unterminated", ["a"]),
+        ("a {{ unterminated", ["a", "{{ unterminated"]),
+        ("a 'unterminated", ["a", "'unterminated"]),
+    ],
+)
+def test_tokenize_sql(sql, expected):
+    assert list(tokenize_sql(sql)) == expected
+
+
+def test_tokenize_sql_every_character():
+    # every character is part of a token or of a skipped block
+    sql = "select {a} - /b/ from 'x' \"y\" `z` {{ c }}{% d %}{# e #}/* f */-- g"
+    assert "".join(tokenize_sql(sql)) == "select{a}-/b/from'x'\"y\"`z`{{ c }}"
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from pre_commit_dbt.unify_column_description import main
+from pre_commit_dbt.yaml_io import load_yaml
 
 TESTS = (  # type: ignore
     (
@@ -346,3 +349,44 @@ models:
     description: test
 """
     )
+
+
+def test_replace_column_description_once_per_file(tmpdir, capsys):
+    schema_yml = """
+version: 2
+
+models:
+-   name: {name}
+    columns:
+    -   name: test1
+        description: {desc1}
+    -   name: test2
+        description: {desc2}
+    """
+    yml_files = []
+    for name, desc1, desc2 in (
+        ("model1", "test", "test"),
+        ("model2", "bad1", "bad2"),
+        ("model3", "test", "test"),
+    ):
+        yml_file = tmpdir.join(f"{name}.yml")
+        yml_file.write(schema_yml.format(name=name, desc1=desc1, desc2=desc2))
+        yml_file.chmod(0o644)
+        yml_files.append(yml_file)
+    capsys.readouterr()
+    with patch(
+        "pre_commit_dbt.unify_column_description.load_yaml", wraps=load_yaml
+    ) as load:
+        status_code = main([str(yml_file) for yml_file in yml_files])
+    assert status_code == 1
+    load.assert_called_once()
+    assert load_yaml(yml_files[1].read_text("utf-8"))["models"][0]["columns"] == [
+        {"name": "test1", "description": "test"},
+        {"name": "test2", "description": "test"},
+    ]
+    assert yml_files[1].stat().mode & 0o777 == 0o644
+    assert capsys.readouterr().out == (
+        f"{yml_files[1]}: replaced 2 descriptions:\n"
+        "- column `test1` for `test`\n"
+        "- column `test2` for `test`\n"
+    )
@@ -1,18 +1,40 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from pre_commit_dbt.utils import _MANIFEST_INDEXES
+from pre_commit_dbt.utils import build_properties_index
 from pre_commit_dbt.utils import CalledProcessError
+from pre_commit_dbt.utils import chunked
+from pre_commit_dbt.utils import clear_json_documents
+from pre_commit_dbt.utils import clear_yaml_documents
 from pre_commit_dbt.utils import cmd_output
+from pre_commit_dbt.utils import get_deps_names
 from pre_commit_dbt.utils import get_filenames
+from pre_commit_dbt.utils import get_json
+from pre_commit_dbt.utils import get_json_cache_path
 from pre_commit_dbt.utils import get_macro_schemas
+from pre_commit_dbt.utils import get_macros
+from pre_commit_dbt.utils import get_manifest_index
 from pre_commit_dbt.utils import get_model_schemas
+from pre_commit_dbt.utils import get_models
+from pre_commit_dbt.utils import get_source_schemas
+from pre_commit_dbt.utils import get_yaml
+from pre_commit_dbt.utils import get_yaml_cache_path
+from pre_commit_dbt.utils import JsonOpenError
+from pre_commit_dbt.utils import load_yaml_files
 from pre_commit_dbt.utils import MacroSchema
+from pre_commit_dbt.utils import map_files
 from pre_commit_dbt.utils import Model
 from pre_commit_dbt.utils import ModelSchema
 from pre_commit_dbt.utils import obj_in_deps
 from pre_commit_dbt.utils import paths_to_dbt_models
+from pre_commit_dbt.utils import run_dbt_cmd
+from pre_commit_dbt.utils import run_dbt_cmds
 from pre_commit_dbt.utils import SourceSchema
+from pre_commit_dbt.utils import stream_cmd_output
+from pre_commit_dbt.yaml_io import load_yaml_with_lines
 
 
 def test_cmd_output_error():
@@ -25,6 +47,82 @@ def test_cmd_output_output():
     assert ret == "hi\n"
 
 
+def test_stream_cmd_output(capsys):
+    lines = []
+    script = "echo one; echo two >&2; echo three"
+    ret = stream_cmd_output("sh", "-c", script, callback=lines.append, tail=2)
+    assert lines == ["one\n", "two\n", "three\n"]
+    assert ret == "two\nthree\n"
+    assert capsys.readouterr().out == "one\ntwo\nthree\n"
+
+
+def test_stream_cmd_output_error():
+    with pytest.raises(CalledProcessError) as e:
+        stream_cmd_output("sh", "-c", "echo one; echo two; exit 3", tail=1)
+    assert e.value.args[2:4] == (3, "two\n")
+
+
+@pytest.mark.parametrize(
+    ("items", "size", "expected"),
+    [
+        (["a", "b", "c"], 0, [["a", "b", "c"]]),
+        (["a", "b", "c"], 2, [["a", "b"], ["c"]]),
+        (["a", "b", "c"], 3, [["a", "b", "c"]]),
+        ([], 2, [[]]),
+    ],
+)
+def test_chunked(items, size, expected):
+    assert chunked(items, size) == expected
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_run_dbt_cmds(jobs, capsys):
+    waves = [
+        [
+            ["sh", "-c", "sleep 0.2; echo a"],
+            ["sh", "-c", "echo b"],
+            ["sh", "-c", "echo c"],
+        ],
+        [["sh", "-c", "echo d"]],
+    ]
+    assert run_dbt_cmds(waves, jobs) == 0
+    out = capsys.readouterr().out
+    lines = [line for line in out.splitlines() if not line.startswith("Executing")]
+    assert lines == ["a", "b", "c", "d"]
+
+
+def test_run_dbt_cmds_long_output(capsys):
+    # concurrent commands spool their whole output, not only the tail
+    cmd = ["sh", "-c", "seq 1 1000"]
+    assert run_dbt_cmds([[cmd, cmd]], jobs=2) == 0
+    out = capsys.readouterr().out
+    assert out.count("\n1\n") == 2
+    assert out.count("\n1000\n") == 2
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_dbt_cmds_error(jobs, capsys):
+    waves = [
+        [["sh", "-c", "exit 2"], ["sh", "-c", "echo b"]],
+        [["sh", "-c", "echo c"], ["sh", "-c", "echo d"]],
+    ]
+    assert run_dbt_cmds(waves, jobs) == 1
+    out = capsys.readouterr().out
+    assert "Command failed with exit code 2\n" in out
+    assert "b\n" in out
+    assert "c\n" not in out
+    assert "Skipped 2 commands after the failed commands." in out
+
+
+def test_run_dbt_cmd(capsys):
+    lines = []
+    assert run_dbt_cmd(["sh", "-c", "echo 1 of 2 OK"], callback=lines.append) == 0
+    assert lines == ["1 of 2 OK\n"]
+    assert run_dbt_cmd(["sh", "-c", "echo 2 of 2 ERROR; exit 1"]) == 1
+    out = capsys.readouterr().out
+    assert "2 of 2 ERROR\nCommand failed with exit code 1" in out
+
+
 @pytest.mark.parametrize(
     "test_input,pre,post,expected",
     [
@@ -117,3 +215,347 @@ macros:
             prefix="macro",
         )
     ]
+
+
+def test_get_json_cache(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {"model.aa": {}}}')
+    assert get_json(str(file)) == {"nodes": {"model.aa": {}}}
+    assert get_json_cache_path(Path(file)).exists()
+    # served from the process
+    assert get_json(str(file)) is get_json(str(file))
+    # served from the disk
+    clear_json_documents()
+    assert get_json(str(file)) == {"nodes": {"model.aa": {}}}
+
+
+def test_get_json_cache_invalidated(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {"model.aa": {}}}')
+    get_json(str(file))
+    file.write('{"nodes": {"model.bbbb": {}}}')
+    assert get_json(str(file)) == {"nodes": {"model.bbbb": {}}}
+
+
+def test_get_json_cache_same_size(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {"model.aa": {}}}')
+    get_json(str(file))
+    file.write('{"nodes": {"model.bb": {}}}')
+    file.setmtime(file.mtime() + 10)
+    assert get_json(str(file)) == {"nodes": {"model.bb": {}}}
+
+
+def test_get_json_cache_touched(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {"model.aa": {}}}')
+    get_json(str(file))
+    file.setmtime(file.mtime() + 10)
+    clear_json_documents()
+    assert get_json(str(file)) == {"nodes": {"model.aa": {}}}
+    clear_json_documents()
+    assert get_json(str(file)) == {"nodes": {"model.aa": {}}}
+
+
+def test_get_json_cache_corrupted(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {}}')
+    get_json(str(file))
+    get_json_cache_path(Path(file)).write_bytes(b"corrupted")
+    clear_json_documents()
+    assert get_json(str(file)) == {"nodes": {}}
+
+
+def test_get_json_cache_write_error(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {}}')
+    with patch("pre_commit_dbt.utils.marshal.dumps") as mock_dumps:
+        mock_dumps.side_effect = ValueError("disk full")
+        assert get_json(str(file)) == {"nodes": {}}
+    cache_dir = get_json_cache_path(Path(file)).parent
+    assert cache_dir.exists()
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_get_json_without_cache(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {}}')
+    assert get_json(str(file), use_cache=False) == {"nodes": {}}
+    assert not get_json_cache_path(Path(file)).exists()
+
+
+def test_get_json_error(tmpdir):
+    with pytest.raises(JsonOpenError):
+        get_json(str(tmpdir.join("missing.json")))
+
+
+def test_get_manifest_index(manifest):
+    index = get_manifest_index(manifest)
+    assert get_manifest_index(manifest) is index
+    assert index.ids_by_stem[("model", "catalog_cols")] == ["model.test.catalog_cols"]
+    assert index.node_ids_by_name["ref1"] == ["model.ref1"]
+    assert index.source_ids_by_name[frozenset(["src", "src1"])] == ["source.src.src1"]
+    assert "test.test1" in index.ids_by_type["test"]
+
+
+def test_get_manifest_index_rebuilt_for_new_manifest():
+    first = {"nodes": {"model.aa": {"name": "aa"}}}
+    second = {"nodes": {"model.bb": {"name": "bb"}}}
+    assert get_manifest_index(first).node_ids_by_name == {"aa": ["model.aa"]}
+    assert get_manifest_index(second).node_ids_by_name == {"bb": ["model.bb"]}
+
+
+def test_get_manifest_index_released_on_reload(tmpdir):
+    file = tmpdir.join("manifest.json")
+    file.write('{"nodes": {"model.aa": {"name": "aa"}}}')
+    first = get_json(str(file))
+    get_manifest_index(first)
+    file.write('{"nodes": {"model.bbbb": {"name": "bbbb"}}}')
+    second = get_json(str(file))
+    assert get_manifest_index(second).node_ids_by_name == {"bbbb": ["model.bbbb"]}
+    assert all(manifest is not first for manifest, _ in _MANIFEST_INDEXES.values())
+
+
+def test_get_models_manifest_order(manifest):
+    result = get_models(manifest, {"with_test2", "with_test1", "missing"})
+    assert [model.model_id for model in result] == [
+        "model.with_test1",
+        "model.with_test2",
+    ]
+
+
+def test_get_macros(manifest):
+    result = get_macros(manifest, {"with_description", "with_schema"})
+    assert [macro.macro_id for macro in result] == ["macro.with_description"]
+
+
+@pytest.mark.parametrize(
+    "obj,manifest_node",
+    [
+        (Model("model.with_test1", "with_test1", "cc", {}), "child_map"),
+        (Model("model.missing", "missing", "cc", {}), "child_map"),
+        (SourceSchema("test", "test1", "cc", {}, {}), "child_map"),
+        (SourceSchema("parent_child", "parent_child1", "cc", {}, {}), "child_map"),
+        (ModelSchema("parent_child", "cc", {}, Path("cc")), "child_map"),
+        (ModelSchema("parent_child", "cc", {}, Path("cc")), "parent_map"),
+        (ModelSchema("missing", "cc", {}, Path("cc")), "parent_map"),
+        (object, "child_map"),
+    ],
+)
+def test_get_deps_names_same_as_obj_in_deps(manifest, obj, manifest_node):
+    expected = [
+        dep_name
+        for dep_name in manifest.get(manifest_node, {})
+        if obj_in_deps(obj, dep_name)
+    ]
+    assert get_deps_names(manifest, obj, manifest_node) == expected
+
+
+SOURCES_YML = """
+version: 2
+sources:
+- name: src
+  tables:
+  - name: table1
+  - name: table2
+"""
+
+
+def test_get_yaml_parsed_once(tmpdir):
+    clear_yaml_documents()
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(SOURCES_YML)
+    other_file = tmpdir.join("other.yml")
+    other_file.write(SOURCES_YML)
+    with patch(
+        "pre_commit_dbt.utils.load_yaml_with_lines", wraps=load_yaml_with_lines
+    ) as load:
+        first = get_yaml(Path(yml_file))
+        second = get_yaml(Path(other_file))
+        assert load.call_count == 1
+        # changed content is parsed again
+        yml_file.write(SOURCES_YML + "  - name: table3\n")
+        assert len(get_yaml(Path(yml_file))["sources"][0]["tables"]) == 3
+        assert load.call_count == 2
+    assert first == second
+    assert first is not second
+
+
+def test_get_yaml_copies(tmpdir):
+    clear_yaml_documents()
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(SOURCES_YML)
+    get_yaml(Path(yml_file))["sources"].clear()
+    schemas = list(get_source_schemas([Path(yml_file)]))
+    assert [schema.table_name for schema in schemas] == ["table1", "table2"]
+    assert "tables" not in schemas[0].source_schema
+    assert get_yaml(Path(yml_file))["sources"][0]["tables"]
+
+
+def test_get_source_schemas_unnamed(tmpdir):
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(SOURCES_YML + "  - description: no name\n- tables:\n  - name: t\n")
+    schemas = list(get_source_schemas([Path(yml_file)]))
+    assert [schema.table_name for schema in schemas] == ["table1", "table2"]
+
+
+def test_get_yaml_not_marshallable(tmpdir):
+    clear_yaml_documents()
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write("version: 2\nmodels:\n- name: a\n  meta:\n    since: 2021-01-01\n")
+    first = get_yaml(Path(yml_file))
+    first["models"].clear()
+    assert get_yaml(Path(yml_file))["models"][0]["meta"]["since"].year == 2021
+
+
+def test_get_yaml_disk_cache(tmpdir, monkeypatch):
+    clear_yaml_documents()
+    monkeypatch.setenv("PRE_COMMIT_DBT_YAML_CACHE", str(tmpdir.join("cache")))
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(SOURCES_YML)
+    expected = get_yaml(Path(yml_file))
+    cache_files = tmpdir.join("cache").listdir()
+    assert len(cache_files) == 1
+    clear_yaml_documents()
+    with patch("pre_commit_dbt.utils.load_yaml_with_lines") as load:
+        assert get_yaml(Path(yml_file)) == expected
+    load.assert_not_called()
+    # corrupted cache file is ignored
+    cache_files[0].write("corrupted")
+    clear_yaml_documents()
+    assert get_yaml(Path(yml_file)) == expected
+
+
+def test_get_yaml_cache_path(monkeypatch):
+    monkeypatch.delenv("PRE_COMMIT_DBT_YAML_CACHE", raising=False)
+    assert get_yaml_cache_path("abc") is None
+    monkeypatch.setenv("PRE_COMMIT_DBT_YAML_CACHE", "cache")
+    assert get_yaml_cache_path("abc").parent == Path("cache")
+
+
+@pytest.mark.parametrize("limit", [1, 4096])
+def test_load_yaml_files(limit, tmpdir):
+    clear_yaml_documents()
+    paths = []
+    for i in range(3):
+        yml_file = tmpdir.join(f"schema{i}.yml")
+        yml_file.write(SOURCES_YML + f"  - name: table_{i}\n")
+        paths.append(str(yml_file))
+    invalid_file = tmpdir.join("invalid.yml")
+    invalid_file.write("sources: [")
+    sql_file = tmpdir.join("model.sql")
+    sql_file.write("select 1")
+    # the prefetched documents are not evicted by a smaller cache
+    with patch("pre_commit_dbt.utils._YAML_DOCUMENTS_LIMIT", limit):
+        load_yaml_files([*paths, str(invalid_file), str(sql_file)], jobs=2)
+        with patch("pre_commit_dbt.utils.load_yaml_with_lines") as load:
+            for i, path in enumerate(paths):
+                assert get_yaml(Path(path))["sources"][0]["tables"][-1] == {
+                    "name": f"table_{i}"
+                }
+    load.assert_not_called()
+
+
+def test_load_yaml_files_one_job(tmpdir):
+    clear_yaml_documents()
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(SOURCES_YML)
+    with patch("pre_commit_dbt.utils.concurrent.futures") as futures:
+        load_yaml_files([str(yml_file), str(yml_file)], jobs=1)
+    futures.ProcessPoolExecutor.assert_not_called()
+
+
+@pytest.mark.parametrize("jobs", [0, 1, 4])
+def test_map_files_ordered(jobs, tmpdir):
+    paths = []
+    for i in range(20):
+        sql_file = tmpdir.join(f"model{i}.sql")
+        sql_file.write(f"select {i}")
+        paths.append(str(sql_file))
+    result = list(map_files(lambda path: Path(path).read_text(), paths, jobs))
+    assert result == [(path, f"select {i}") for i, path in enumerate(paths)]
+
+
+def test_map_files_one_job():
+    with patch("pre_commit_dbt.utils.concurrent.futures") as futures:
+        assert list(map_files(str.upper, ["a", "b"], jobs=1)) == [
+            ("a", "A"),
+            ("b", "B"),
+        ]
+    futures.ThreadPoolExecutor.assert_not_called()
+
+
+def test_map_files_error(tmpdir):
+    sql_file = tmpdir.join("model.sql")
+    sql_file.write("select 1")
+    paths = [str(sql_file), str(tmpdir.join("missing.sql"))]
+    result = map_files(lambda path: Path(path).read_text(), paths, jobs=2)
+    assert next(result) == (str(sql_file), "select 1")
+    with pytest.raises(FileNotFoundError):
+        next(result)
+
+
+PROPERTIES_YML = """version: 2
+models:
+- name: model1
+  description: first
+
+- name: model2
+- not a model
+sources:
+- name: src
+  tables:
+  - name: table1
+  - name: table2
+macros:
+- name: macro1
+exposures:
+- name: exposure1
+  type: dashboard
+"""
+
+
+def test_build_properties_index(tmpdir):
+    clear_yaml_documents()
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(PROPERTIES_YML)
+    other_file = tmpdir.join("other.yml")
+    other_file.write("version: 2\nmodels:\n- name: model1\n")
+    empty_file = tmpdir.join("empty.yml")
+    empty_file.write("")
+    files = [Path(yml_file), Path(other_file), Path(empty_file)]
+    index = build_properties_index(files)
+    positions = [
+        (entry.resource_type, entry.name, entry.file.name, entry.line)
+        for entry in index.entries
+    ]
+    assert positions == [
+        ("model", "model1", "schema.yml", 3),
+        ("model", "model2", "schema.yml", 6),
+        ("macro", "macro1", "schema.yml", 14),
+        ("exposure", "exposure1", "schema.yml", 16),
+        ("source", "table1", "schema.yml", 11),
+        ("source", "table2", "schema.yml", 12),
+        ("model", "model1", "other.yml", 3),
+    ]
+    models = index.get("model", "model1")
+    assert [model.file.name for model in models] == ["schema.yml", "other.yml"]
+    assert models[0].schema == {"name": "model1", "description": "first"}
+    (table,) = index.get_source("src", "table2")
+    assert table.source_schema == {"name": "src"}
+    assert index.get("model", "missing") == []
+    assert [entry.name for entry in index.of_type("exposure")] == ["exposure1"]
+
+
+def test_build_properties_index_malformed(tmpdir):
+    clear_yaml_documents()
+    yml_file = tmpdir.join("schema.yml")
+    yml_file.write(
+        "models:\n  name: aaa\nsources:\n- name: src\n  tables:\n"
+        "macros:\n- name: [a, b]\n"
+    )
+    index = build_properties_index([Path(yml_file)])
+    assert [(entry.resource_type, entry.name) for entry in index.entries] == [
+        ("macro", ["a", "b"])
+    ]
+    assert index.by_name == {}
@@ -0,0 +1,40 @@
+import io
+
+import pytest
+import yaml
+
+from pre_commit_dbt.yaml_io import dump_yaml
+from pre_commit_dbt.yaml_io import dump_yaml_str
+from pre_commit_dbt.yaml_io import load_yaml
+
+PROPERTIES = {
+    "version": 2,
+    "models": [
+        {
+            "name": "model",
+            "description": "It's a 'model': ü",
+            "columns": [{"name": "id", "tests": ["unique", "not_null"]}],
+            "meta": {},
+        }
+    ],
+}
+
+
+@pytest.mark.parametrize("stream", [str, str.encode, io.StringIO])
+def test_load_yaml(stream):
+    text = yaml.dump(PROPERTIES)
+    assert load_yaml(stream(text)) == PROPERTIES
+
+
+def test_load_yaml_is_safe():
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_dump_yaml_same_as_pure_python():
+    expected = yaml.dump(PROPERTIES, default_flow_style=False, sort_keys=False)
+    assert dump_yaml(PROPERTIES) == expected
+    stream = io.StringIO()
+    dump_yaml(PROPERTIES, stream)
+    assert stream.getvalue() == expected
+    assert dump_yaml_str(PROPERTIES) == expected